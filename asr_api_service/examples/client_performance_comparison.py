@@ -5,67 +5,129 @@
 """
 
 import asyncio
+import contextlib
+import sys
 import websockets
-import json
 import time
-import base64
 import numpy as np
+import orjson
 import requests
-from pathlib import Path
+from requests.adapters import HTTPAdapter
 import io
 import soundfile as sf
 
+try:
+    # pybase64 提供 SIMD 加速的 base64 编码，未安装时回退到标准库
+    import pybase64 as b64
+except ImportError:
+    import base64 as b64
+
+
+def dumps_text(message: dict) -> str:
+    """使用 orjson 序列化消息（支持 numpy 数组），作为 WebSocket 文本帧发送"""
+    return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def install_uvloop() -> None:
+    """有 uvloop 时使用其事件循环（Windows 不支持）"""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# 共享的随机数生成器，避免使用 np.random 的全局状态
+RNG = np.random.default_rng(0)
+
+# WebSocket 二进制方案中每条消息合并的窗口数
+BATCH_N = 8
+
+# WebSocket 连接参数：关闭 permessage-deflate（音频数据几乎不可压缩，压缩只浪费 CPU），
+# 并放宽消息/写缓冲上限以容纳批量帧。客户端不协商压缩，服务端即不会启用。
+WS_CONNECT_OPTIONS = {
+    "compression": None,
+    "max_size": 2**23,
+    "write_limit": 2**20,
+}
+
+
 class AudioTransmissionTester:
     def __init__(self, base_url="http://localhost:8000", ws_url="ws://localhost:8000"):
         self.base_url = base_url
         self.ws_url = ws_url
+        # 复用 HTTP 连接，避免每个请求重复握手
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # 对比期间每个 WebSocket 路径只建立一次连接，由 run_comparison 的 AsyncExitStack 管理
+        self._ws = {}
+        self._ws_stack = None
     
     def generate_test_audio(self, duration=10, sample_rate=16000):
         """生成测试音频数据"""
-        t = np.linspace(0, duration, sample_rate * duration, False)
-        # 生成包含语音特征的音频
+        samples = sample_rate * duration
+        # 生成包含语音特征的音频（全程 float32，原地计算）
         frequency = 440  # A4音符
-        audio = np.sin(2 * np.pi * frequency * t) * 0.3
+        audio = np.arange(samples, dtype=np.float32)
+        audio *= np.float32(2 * np.pi * frequency / sample_rate)
+        np.sin(audio, out=audio)
+        audio *= 0.3
         # 添加一些噪音模拟真实语音
-        noise = np.random.normal(0, 0.05, audio.shape)
-        audio = audio + noise
-        return audio.astype(np.float32), sample_rate
+        noise = RNG.standard_normal(samples, dtype=np.float32)
+        noise *= 0.05
+        audio += noise
+        return audio, sample_rate
+    
+    async def _open_ws(self, path):
+        """获取指定路径的 WebSocket 连接（已打开则复用）"""
+        websocket = self._ws.get(path)
+        if websocket is None:
+            websocket = await self._ws_stack.enter_async_context(
+                websockets.connect(f"{self.ws_url}{path}", **WS_CONNECT_OPTIONS)
+            )
+            self._ws[path] = websocket
+        return websocket
     
-    def save_audio_as_wav(self, audio, sample_rate, filename):
-        """保存音频为WAV文件"""
-        sf.write(filename, audio, sample_rate)
-        return filename
+    def encode_wav(self, audio, sample_rate):
+        """将音频编码为内存中的WAV（不落盘）"""
+        buf = io.BytesIO()
+        sf.write(buf, audio, sample_rate, format='WAV', subtype='PCM_16')
+        buf.seek(0)
+        return buf
     
     async def test_base64_method(self, audio, sample_rate):
         """测试Base64编码方法（原始方法）"""
         print("\n🔄 测试方案1: Base64编码传输")
         
-        # 保存为WAV
-        temp_file = "temp_test.wav"
-        self.save_audio_as_wav(audio, sample_rate, temp_file)
+        # 编码为内存WAV
+        wav_buf = self.encode_wav(audio, sample_rate)
         
-        # 读取并编码为Base64
+        # 编码为Base64
         start_time = time.time()
-        with open(temp_file, 'rb') as f:
-            audio_bytes = f.read()
-        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+        audio_bytes = wav_buf.getvalue()
+        audio_base64 = b64.b64encode(audio_bytes).decode('ascii')
         encode_time = time.time() - start_time
         
         # 发送请求
         start_time = time.time()
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/v1/mobile/process-audio",
-            json={
+            data=orjson.dumps({
                 "audio_base64": audio_base64,
                 "format": "wav",
                 "sample_rate": sample_rate,
                 "enable_vad": True,
                 "return_format": "segments"
-            }
+            }),
+            headers={"Content-Type": "application/json"},
         )
         request_time = time.time() - start_time
         
-        result = response.json() if response.status_code == 200 else None
+        result = orjson.loads(response.content) if response.status_code == 200 else None
         
         print(f"  📊 数据大小: {len(audio_base64):,} 字符")
         print(f"  ⏱️ 编码耗时: {encode_time*1000:.1f}ms")
@@ -76,38 +138,34 @@ class AudioTransmissionTester:
         else:
             print(f"  ❌ 请求失败: {response.status_code}")
         
-        # 清理临时文件
-        Path(temp_file).unlink(missing_ok=True)
         return encode_time + request_time
     
     async def test_direct_upload_method(self, audio, sample_rate):
         """测试直接文件上传方法（优化方法）"""
         print("\n⚡ 测试方案2: 直接文件上传")
         
-        # 保存为WAV
-        temp_file = "temp_test.wav"
-        self.save_audio_as_wav(audio, sample_rate, temp_file)
+        # 编码为内存WAV
+        wav_buf = self.encode_wav(audio, sample_rate)
         
-        # 直接上传文件
+        # 直接上传文件（从内存流式发送）
         start_time = time.time()
-        with open(temp_file, 'rb') as f:
-            files = {'audio': ('test.wav', f, 'audio/wav')}
-            data = {
-                'sample_rate': sample_rate,
-                'enable_vad': True,
-                'return_audio': False,
-                'output_format': 'json'
-            }
-            response = requests.post(
-                f"{self.base_url}/api/v1/mobile/process-audio-efficient",
-                files=files,
-                data=data
-            )
+        files = {'audio': ('test.wav', wav_buf, 'audio/wav')}
+        data = {
+            'sample_rate': sample_rate,
+            'enable_vad': True,
+            'return_audio': False,
+            'output_format': 'json'
+        }
+        response = self.session.post(
+            f"{self.base_url}/api/v1/mobile/process-audio-efficient",
+            files=files,
+            data=data
+        )
         request_time = time.time() - start_time
         
-        result = response.json() if response.status_code == 200 else None
+        result = orjson.loads(response.content) if response.status_code == 200 else None
         
-        print(f"  📊 文件大小: {Path(temp_file).stat().st_size:,} 字节")
+        print(f"  📊 文件大小: {wav_buf.getbuffer().nbytes:,} 字节")
         print(f"  🌐 请求耗时: {request_time*1000:.1f}ms")
         print(f"  📈 总耗时: {request_time*1000:.1f}ms")
         if result:
@@ -116,8 +174,6 @@ class AudioTransmissionTester:
         else:
             print(f"  ❌ 请求失败: {response.status_code}")
         
-        # 清理临时文件
-        Path(temp_file).unlink(missing_ok=True)
         return request_time
     
     async def test_websocket_binary_method(self, audio, sample_rate):
@@ -125,56 +181,82 @@ class AudioTransmissionTester:
         print("\n🚀 测试方案3: WebSocket二进制流传输")
         
         try:
+            # 连接（复用）并配置WebSocket，握手与配置不计入传输时间
+            websocket = await self._open_ws("/api/v1/stream/vad-binary?fmt=json")
+            # 发送配置
+            config = {
+                "sample_rate": sample_rate,
+                "window_size": 1024
+            }
+            await websocket.send(dumps_text(config))
+            
+            # 等待确认
+            response = await websocket.recv()
+            config_result = orjson.loads(response)
+            print(f"  📡 连接状态: {config_result.get('type', 'ready')}")
+            
+            # 预热：发送一个静音窗口，使首批计时不包含冷启动开销
+            await websocket.send(bytes(1024 * 4))
+            await websocket.recv()
+            
             start_time = time.time()
             
-            # 连接WebSocket
-            async with websockets.connect(f"{self.ws_url}/api/v1/stream/vad-binary") as websocket:
-                # 发送配置
-                config = {
-                    "sample_rate": sample_rate,
-                    "window_size": 1024
-                }
-                await websocket.send(json.dumps(config))
-                
-                # 等待确认
-                response = await websocket.recv()
-                config_result = json.loads(response)
-                print(f"  📡 连接状态: {config_result.get('type', 'ready')}")
-                
-                # 分块发送音频数据
-                window_size = 1024
-                total_chunks = len(audio) // window_size
-                processing_times = []
-                
-                for i in range(0, len(audio), window_size):
-                    chunk = audio[i:i+window_size]
-                    if len(chunk) < window_size:
+            # 分批发送音频数据：每条消息合并 BATCH_N 个窗口，减少帧数和往返次数
+            window_size = 1024
+            batch_size = window_size * BATCH_N
+            total_chunks = len(audio) // window_size
+            total_batches = -(-len(audio) // batch_size)
+            processing_times = []
+            
+            assert audio.dtype == np.float32 and audio.flags['C_CONTIGUOUS']
+            
+            # 尾批补零用的预分配缓冲区，以 float32 视图写入，直接发送 memoryview
+            # （整批与尾批都只发送视图，循环中不分配新的 bytes）
+            pad_bytes = bytearray(batch_size * 4)
+            pad_buf = np.frombuffer(pad_bytes, dtype=np.float32)
+            
+            async def send_batches():
+                """发送端：连续发送所有批次，不等待结果"""
+                for i in range(0, len(audio), batch_size):
+                    batch = audio[i:i+batch_size]
+                    n = len(batch)
+                    if n % window_size:
                         # 补零到完整窗口大小
-                        chunk = np.pad(chunk, (0, window_size - len(chunk)))
+                        padded = n + window_size - n % window_size
+                        pad_buf[:n] = batch
+                        pad_buf[n:padded] = 0
+                        await websocket.send(memoryview(pad_bytes)[:padded * 4])
+                        continue
                     
-                    # 发送二进制数据
-                    chunk_start = time.time()
-                    await websocket.send(chunk.astype(np.float32).tobytes())
-                    
-                    # 接收结果
-                    response = await websocket.recv()
-                    result = json.loads(response)
-                    processing_times.append(result.get('processing_time_ms', 0))
-                    chunk_time = time.time() - chunk_start
-                
-                # 发送结束信号
-                await websocket.send(b'')
-                
-                total_time = time.time() - start_time
-                
-                print(f"  📊 传输块数: {total_chunks}")
-                print(f"  📦 每块大小: {window_size * 4} 字节 (float32)")
-                print(f"  ⏱️ 平均处理时间: {np.mean(processing_times):.1f}ms/块")
-                print(f"  🌐 总传输时间: {total_time*1000:.1f}ms")
-                print(f"  📈 实时因子: {(len(audio)/sample_rate)/(total_time):.2f}x")
-                
-                return total_time
-                
+                    # 直接发送 audio 切片的字节视图（连续 float32，无需拷贝）
+                    await websocket.send(memoryview(batch).cast('B'))
+            
+            # 发送与接收流水线并行：服务器处理第 N 批时第 N+1 批已在传输中
+            send_task = asyncio.create_task(send_batches())
+            
+            # 接收结果（每批一个）
+            for _ in range(total_batches):
+                response = await websocket.recv()
+                result = orjson.loads(response)
+                # 服务器按采样计时，只有部分结果带处理时间
+                if 'processing_time_ms' in result:
+                    processing_times.append(result['processing_time_ms'])
+            
+            await send_task
+            
+            # 发送结束信号
+            await websocket.send(b'')
+            
+            total_time = time.time() - start_time
+            
+            print(f"  📊 传输块数: {total_chunks} ({total_batches} 批)")
+            print(f"  📦 每批大小: {batch_size * 4} 字节 (float32)")
+            print(f"  ⏱️ 平均处理时间: {np.mean(processing_times):.1f}ms/批")
+            print(f"  🌐 总传输时间: {total_time*1000:.1f}ms")
+            print(f"  📈 实时因子: {(len(audio)/sample_rate)/(total_time):.2f}x")
+            
+            return total_time
+            
         except Exception as e:
             print(f"  ❌ WebSocket连接失败: {e}")
             return float('inf')
@@ -184,57 +266,64 @@ class AudioTransmissionTester:
         print("\n📡 测试方案4: WebSocket JSON流传输")
         
         try:
+            # 连接（复用）并配置WebSocket，握手与配置不计入传输时间
+            websocket = await self._open_ws("/api/v1/stream/vad?fmt=json")
+            # 发送配置
+            config_msg = {
+                "type": "config",
+                "sample_rate": sample_rate,
+                "channels": 1
+            }
+            await websocket.send(dumps_text(config_msg))
+            
+            # 等待确认
+            response = await websocket.recv()
+            config_result = orjson.loads(response)
+            print(f"  📡 连接状态: {config_result.get('message', 'ready')}")
+            
+            # 预热：发送一个静音窗口，使首块计时不包含冷启动开销
+            await websocket.send(dumps_text({
+                "type": "audio",
+                "data_b64": b64.b64encode(bytes(1024 * 4)).decode('ascii')
+            }))
+            await websocket.recv()
+            
             start_time = time.time()
             
-            async with websockets.connect(f"{self.ws_url}/api/v1/stream/vad") as websocket:
-                # 发送配置
-                config_msg = {
-                    "type": "config",
-                    "sample_rate": sample_rate,
-                    "channels": 1
-                }
-                await websocket.send(json.dumps(config_msg))
-                
-                # 等待确认
-                response = await websocket.recv()
-                config_result = json.loads(response)
-                print(f"  📡 连接状态: {config_result.get('message', 'ready')}")
-                
-                # 分块发送音频数据
-                window_size = 1024
-                total_chunks = len(audio) // window_size
-                
-                for i in range(0, len(audio), window_size):
-                    chunk = audio[i:i+window_size]
-                    
-                    # 发送JSON格式数据
-                    audio_msg = {
-                        "type": "audio",
-                        "data": chunk.tolist()
-                    }
-                    await websocket.send(json.dumps(audio_msg))
-                    
-                    # 接收结果
-                    response = await websocket.recv()
-                    result = json.loads(response)
-                
-                # 发送结束信号
-                end_msg = {"type": "end"}
-                await websocket.send(json.dumps(end_msg))
-                
-                # 接收最终状态
-                response = await websocket.recv()
-                final_result = json.loads(response)
-                
-                total_time = time.time() - start_time
-                
-                print(f"  📊 传输块数: {total_chunks}")
-                print(f"  🌐 总传输时间: {total_time*1000:.1f}ms")
-                print(f"  📈 实时因子: {(len(audio)/sample_rate)/(total_time):.2f}x")
-                print(f"  ✅ 最终状态: {final_result.get('message', 'completed')}")
+            # 分块发送音频数据
+            window_size = 1024
+            total_chunks = len(audio) // window_size
+            
+            for i in range(0, len(audio), window_size):
+                chunk = audio[i:i+window_size]
                 
-                return total_time
+                # 发送JSON格式数据（float32 字节的 Base64）
+                audio_msg = {
+                    "type": "audio",
+                    "data_b64": b64.b64encode(chunk.tobytes()).decode('ascii')
+                }
+                await websocket.send(dumps_text(audio_msg))
                 
+                # 接收结果（只需等待应答，不解析内容）
+                await websocket.recv()
+            
+            # 发送结束信号
+            end_msg = {"type": "end"}
+            await websocket.send(dumps_text(end_msg))
+            
+            # 接收最终状态
+            response = await websocket.recv()
+            final_result = orjson.loads(response)
+            
+            total_time = time.time() - start_time
+            
+            print(f"  📊 传输块数: {total_chunks}")
+            print(f"  🌐 总传输时间: {total_time*1000:.1f}ms")
+            print(f"  📈 实时因子: {(len(audio)/sample_rate)/(total_time):.2f}x")
+            print(f"  ✅ 最终状态: {final_result.get('message', 'completed')}")
+            
+            return total_time
+            
         except Exception as e:
             print(f"  ❌ WebSocket连接失败: {e}")
             return float('inf')
@@ -251,10 +340,15 @@ class AudioTransmissionTester:
         # 测试各种方案
         results = {}
         
-        results['base64'] = await self.test_base64_method(audio, sample_rate)
-        results['direct_upload'] = await self.test_direct_upload_method(audio, sample_rate)
-        results['websocket_binary'] = await self.test_websocket_binary_method(audio, sample_rate)
-        results['websocket_json'] = await self.test_websocket_json_method(audio, sample_rate)
+        # WebSocket 连接在整个对比期间保持打开，结束时统一关闭
+        async with contextlib.AsyncExitStack() as stack:
+            self._ws_stack = stack
+            results['base64'] = await self.test_base64_method(audio, sample_rate)
+            results['direct_upload'] = await self.test_direct_upload_method(audio, sample_rate)
+            results['websocket_binary'] = await self.test_websocket_binary_method(audio, sample_rate)
+            results['websocket_json'] = await self.test_websocket_json_method(audio, sample_rate)
+        self._ws.clear()
+        self._ws_stack = None
         
         # 性能对比汇总
         print("\n" + "=" * 50)
@@ -290,4 +384,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -2,14 +2,48 @@
 """Example streaming ASR client."""
 
 import asyncio
-import json
+import struct
+import sys
 import time
-from typing import List
 
+import orjson
 import websockets
 import numpy as np
 
 
+# Binary audio frame header, mirrors AUDIO_FRAME_HEADER on the server:
+# sample_rate (uint32), sample count (uint32), timestamp ms (uint64).
+AUDIO_FRAME_HEADER = struct.Struct("<IIQ")
+
+# Audio frames are effectively incompressible, so don't offer permessage-deflate
+# (the server can only enable it if the client asks for it).
+WS_CONNECT_OPTIONS = {
+    "compression": None,
+    "max_size": 2**23,
+    "write_limit": 2**20,
+}
+
+
+# Shared generator for test-audio noise
+RNG = np.random.default_rng(0)
+
+
+def dumps_text(message: dict) -> str:
+    """Serialize a message with orjson for sending as a WebSocket text frame."""
+    return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def install_uvloop() -> None:
+    """Use uvloop's event loop when available (not supported on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 class StreamingASRClient:
     """Example streaming ASR client."""
     
@@ -21,7 +55,7 @@ class StreamingASRClient:
     async def connect(self, api_key: str, enable_llm: bool = False):
         """Connect to the streaming ASR server."""
         try:
-            self.websocket = await websockets.connect(self.server_url)
+            self.websocket = await websockets.connect(self.server_url, **WS_CONNECT_OPTIONS)
             self.is_connected = True
             print(f"✅ Connected to {self.server_url}")
             
@@ -33,15 +67,15 @@ class StreamingASRClient:
                     "enable_llm": enable_llm,
                     "language": "en"
                 },
-                "timestamp": int(time.time() * 1000)
+                "timestamp": time.time_ns() // 1_000_000
             }
             
-            await self.websocket.send(json.dumps(config_message))
+            await self.websocket.send(dumps_text(config_message))
             print("📝 Configuration sent")
             
             # Wait for ready status
             response = await self.websocket.recv()
-            message = json.loads(response)
+            message = orjson.loads(response)
             
             if message["type"] == "status" and message["data"]["status"] == "ready":
                 print("🚀 Server is ready")
@@ -68,10 +102,10 @@ class StreamingASRClient:
             "data": {
                 "command": "start"
             },
-            "timestamp": int(time.time() * 1000)
+            "timestamp": time.time_ns() // 1_000_000
         }
         
-        await self.websocket.send(json.dumps(control_message))
+        await self.websocket.send(dumps_text(control_message))
         print("🎤 Recording started")
     
     async def stop_recording(self):
@@ -81,35 +115,29 @@ class StreamingASRClient:
             "data": {
                 "command": "stop"
             },
-            "timestamp": int(time.time() * 1000)
+            "timestamp": time.time_ns() // 1_000_000
         }
         
-        await self.websocket.send(json.dumps(control_message))
+        await self.websocket.send(dumps_text(control_message))
         print("⏹️  Recording stopped")
     
-    async def send_audio(self, audio_data: List[float], sample_rate: int = 16000):
-        """Send audio data."""
+    async def send_audio(self, audio_data: np.ndarray, sample_rate: int = 16000):
+        """Send audio data as a binary frame (header + float32 PCM)."""
         if not self.is_connected or not self.websocket:
             print("❌ Not connected to server")
             return
         
-        audio_message = {
-            "type": "audio",
-            "data": {
-                "audio_data": audio_data,
-                "sample_rate": sample_rate
-            },
-            "timestamp": int(time.time() * 1000)
-        }
+        pcm = audio_data.astype("<f4", copy=False)
+        header = AUDIO_FRAME_HEADER.pack(sample_rate, len(pcm), time.time_ns() // 1_000_000)
         
-        await self.websocket.send(json.dumps(audio_message))
+        await self.websocket.send(header + pcm.tobytes())
     
     async def listen_for_results(self):
         """Listen for transcription results."""
         try:
             while self.is_connected:
                 response = await self.websocket.recv()
-                message = json.loads(response)
+                message = orjson.loads(response)
                 
                 if message["type"] == "result":
                     data = message["data"]
@@ -145,22 +173,25 @@ class StreamingASRClient:
             print(f"❌ Error listening for results: {e}")
 
 
-def generate_test_audio(duration: float = 2.0, sample_rate: int = 16000, frequency: float = 440.0) -> List[float]:
+def generate_test_audio(duration: float = 2.0, sample_rate: int = 16000, frequency: float = 440.0) -> np.ndarray:
     """Generate test audio signal (sine wave)."""
     samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, samples, endpoint=False)
+    audio = np.arange(samples, dtype=np.float32)
     
-    # Generate a sine wave with some noise
-    audio = 0.3 * np.sin(2 * np.pi * frequency * t)
+    # Generate a sine wave with some noise, in place and in float32
+    audio *= np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(audio, out=audio)
+    audio *= 0.3
     
     # Add some noise to make it more realistic
-    noise = 0.05 * np.random.normal(0, 1, samples)
-    audio = audio + noise
+    noise = RNG.standard_normal(samples, dtype=np.float32)
+    noise *= 0.05
+    audio += noise
     
     # Clip to valid range
-    audio = np.clip(audio, -1.0, 1.0)
+    np.clip(audio, -1.0, 1.0, out=audio)
     
-    return audio.tolist()
+    return audio
 
 
 async def main():
@@ -196,13 +227,20 @@ async def main():
         # Generate and send audio in chunks
         chunk_duration = 0.5  # 500ms chunks
         total_duration = 5.0  # 5 seconds total
+        num_chunks = int(total_duration / chunk_duration)
+        chunk_samples = int(chunk_duration * 16000)
         
-        for i in range(int(total_duration / chunk_duration)):
-            # Generate audio chunk
-            audio_chunk = generate_test_audio(
+        # Precompute the whole signal once so the send loop only slices
+        full_audio = np.concatenate([
+            generate_test_audio(
                 duration=chunk_duration,
                 frequency=440.0 + i * 50  # Vary frequency
             )
+            for i in range(num_chunks)
+        ])
+        
+        for i in range(num_chunks):
+            audio_chunk = full_audio[i * chunk_samples:(i + 1) * chunk_samples]
             
             await client.send_audio(audio_chunk)
             print(f"📤 Sent chunk {i+1}")
@@ -234,14 +272,14 @@ async def main():
 
 if __name__ == "__main__":
     # Install required packages:
-    # pip install websockets numpy
+    # pip install websockets numpy orjson (optional: uvloop)
     
     try:
-        import websockets
         import numpy as np
     except ImportError as e:
         print(f"❌ Missing dependency: {e}")
-        print("Install with: pip install websockets numpy")
+        print("Install with: pip install websockets numpy orjson")
         exit(1)
     
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -1,14 +1,34 @@
 #!/usr/bin/env python3
 """VAD API 使用示例 - 展示如何使用独立的VAD REST API"""
 
+import asyncio
+import base64
+
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
-import time
-from typing import List
+
+
+# 复用连接池的全局会话，避免每次请求都重新建立 TCP 连接
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.headers["Content-Type"] = "application/json"
+
+
+# 共享的随机数生成器，避免使用 np.random 的全局状态
+RNG = np.random.default_rng(0)
+
+
+def post_json(url: str, payload: dict) -> requests.Response:
+    """使用 orjson 序列化并通过共享会话发送 POST 请求"""
+    return SESSION.post(url, data=orjson.dumps(payload))
 
 
 def generate_test_audio(duration: float = 1.0, sample_rate: int = 16000, 
-                       has_speech: bool = True) -> List[float]:
+                       has_speech: bool = True) -> np.ndarray:
     """生成测试音频数据
     
     参数:
@@ -19,23 +39,35 @@ def generate_test_audio(duration: float = 1.0, sample_rate: int = 16000,
     samples = int(duration * sample_rate)
     
     if has_speech:
-        # 生成类似语音的复杂信号
-        t = np.linspace(0, duration, samples)
+        # 生成类似语音的复杂信号（全程 float32）
+        w = np.arange(samples, dtype=np.float32) * np.float32(2 * np.pi / sample_rate)
         # 多个频率叠加模拟语音
-        signal = (0.3 * np.sin(2 * np.pi * 200 * t) +     # 基频
-                  0.2 * np.sin(2 * np.pi * 400 * t) +     # 第一谐波
-                  0.1 * np.sin(2 * np.pi * 800 * t) +     # 第二谐波
-                  0.05 * np.random.normal(0, 1, samples))  # 噪声
+        signal = 0.3 * np.sin(200 * w)               # 基频
+        signal += 0.2 * np.sin(400 * w)              # 第一谐波
+        signal += 0.1 * np.sin(800 * w)              # 第二谐波
+        signal += 0.05 * RNG.standard_normal(samples, dtype=np.float32)  # 噪声
         # 添加振幅调制模拟语音节奏
-        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)
-        signal = signal * envelope
+        envelope = np.sin(3 * w, out=w)
+        envelope *= 0.5
+        envelope += 0.5
+        signal *= envelope
     else:
         # 生成低能量噪声（静音）
-        signal = 0.01 * np.random.normal(0, 1, samples)
+        signal = RNG.standard_normal(samples, dtype=np.float32)
+        signal *= 0.01
     
     # 限制到有效范围
-    signal = np.clip(signal, -1.0, 1.0)
-    return signal.tolist()
+    np.clip(signal, -1.0, 1.0, out=signal)
+    return signal
+
+
+def encode_audio(signal: np.ndarray) -> str:
+    """将音频编码为 Base64 PCM16（小端）字符串
+    
+    每个样本仅占2字节，比JSON浮点数组小一个数量级
+    """
+    pcm16 = (signal * 32767).astype('<i2')
+    return base64.b64encode(pcm16.tobytes()).decode()
 
 
 def example_single_detection():
@@ -49,36 +81,38 @@ def example_single_detection():
     print("\n1. 检测包含语音的音频:")
     speech_audio = generate_test_audio(duration=0.5, has_speech=True)
     
-    response = requests.post(url, json={
-        "audio_data": speech_audio,
+    response = post_json(url, {
+        "audio_b64": encode_audio(speech_audio),
+        "dtype": "int16",
         "sample_rate": 16000
     })
     
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         print(f"   是否说话: {result['is_speaking']}")
         print(f"   状态: {result['state']}")
-        print(f"   概率: {result['probability']}")
-        print(f"   RMS能量: {result['rms']}")
+        print(f"   概率: {result['probability']:.4f}")
+        print(f"   RMS能量: {result['rms']:.4f}")
         print(f"   处理时间: {result['processing_time_ms']}ms")
     else:
-        print(f"   错误: {response.json()}")
+        print(f"   错误: {orjson.loads(response.content)}")
     
     # 测试静音检测
     print("\n2. 检测静音音频:")
     silence_audio = generate_test_audio(duration=0.5, has_speech=False)
     
-    response = requests.post(url, json={
-        "audio_data": silence_audio,
+    response = post_json(url, {
+        "audio_b64": encode_audio(silence_audio),
+        "dtype": "int16",
         "sample_rate": 16000
     })
     
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         print(f"   是否说话: {result['is_speaking']}")
         print(f"   状态: {result['state']}")
-        print(f"   概率: {result['probability']}")
-        print(f"   RMS能量: {result['rms']}")
+        print(f"   概率: {result['probability']:.4f}")
+        print(f"   RMS能量: {result['rms']:.4f}")
 
 
 def example_batch_processing():
@@ -96,14 +130,15 @@ def example_batch_processing():
         generate_test_audio(0.3, has_speech=True),   # 语音
     ]
     
-    response = requests.post(url, json={
-        "segments": segments,
+    response = post_json(url, {
+        "segments_b64": [encode_audio(seg) for seg in segments],
+        "dtype": "int16",
         "sample_rate": 16000,
         "reset_between_segments": False  # 保持VAD状态连续
     })
     
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         
         print(f"\n处理了 {result['summary']['total_segments']} 个片段:")
         print(f"- 语音片段: {result['summary']['speech_segments']}")
@@ -113,7 +148,7 @@ def example_batch_processing():
         print("\n各片段结果:")
         for seg in result['segments']:
             state = "语音" if seg['is_speaking'] else "静音"
-            print(f"  片段 {seg['segment_index']}: {state} (概率: {seg['probability']})")
+            print(f"  片段 {seg['segment_index']}: {state} (概率: {seg['probability']:.4f})")
 
 
 def example_file_analysis():
@@ -123,24 +158,28 @@ def example_file_analysis():
     url = "http://localhost:8000/api/v1/vad/analyze-file"
     
     # 生成一个包含多个语音段的模拟音频文件
-    audio_parts = []
-    
     # 创建模式: 静音(1s) - 语音(2s) - 静音(0.5s) - 语音(1.5s) - 静音(1s)
-    audio_parts.extend(generate_test_audio(1.0, has_speech=False))   # 静音
-    audio_parts.extend(generate_test_audio(2.0, has_speech=True))    # 语音
-    audio_parts.extend(generate_test_audio(0.5, has_speech=False))   # 静音
-    audio_parts.extend(generate_test_audio(1.5, has_speech=True))    # 语音
-    audio_parts.extend(generate_test_audio(1.0, has_speech=False))   # 静音
-    
-    response = requests.post(url, json={
-        "audio_data": audio_parts,
-        "sample_rate": 16000,
+    pattern = [(1.0, False), (2.0, True), (0.5, False), (1.5, True), (1.0, False)]
+    sample_rate = 16000
+    
+    # 预分配整段缓冲区，按片段写入，避免逐段拼接
+    lengths = [int(duration * sample_rate) for duration, _ in pattern]
+    audio = np.empty(sum(lengths), dtype=np.float32)
+    offset = 0
+    for (duration, has_speech), length in zip(pattern, lengths):
+        audio[offset:offset + length] = generate_test_audio(duration, sample_rate, has_speech)
+        offset += length
+    
+    response = post_json(url, {
+        "audio_b64": encode_audio(audio),
+        "dtype": "int16",
+        "sample_rate": sample_rate,
         "window_duration": 0.5,  # 500ms窗口
         "overlap": 0.1          # 100ms重叠
     })
     
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         
         print(f"\n音频文件分析结果:")
         print(f"- 总时长: {result['statistics']['total_duration']}秒")
@@ -153,11 +192,15 @@ def example_file_analysis():
             print(f"  语音段 {i+1}: {seg['start']}s - {seg['end']}s (时长: {seg['duration']}s)")
 
 
-def example_real_time_simulation():
-    """示例4: 模拟实时VAD处理"""
+async def example_real_time_simulation():
+    """示例4: 模拟实时VAD处理
+    
+    生成并编码下一块音频的同时，上一块的请求已在服务器处理中。
+    VAD 是有状态的，因此同一时刻只有一个请求在途，保证顺序。
+    """
     print("\n=== 示例4: 模拟实时VAD处理 ===")
     
-    url = "http://localhost:8000/api/v1/vad/detect"
+    url = "/api/v1/vad/detect"
     
     # 模拟实时音频流
     chunk_duration = 0.1  # 100ms块
@@ -170,18 +213,9 @@ def example_real_time_simulation():
     print("时间 | 状态  | 概率   | 状态变化")
     print("-" * 40)
     
-    for i, has_speech in enumerate(speech_pattern):
-        # 生成音频块
-        audio_chunk = generate_test_audio(chunk_duration, sample_rate, has_speech)
-        
-        # 发送VAD请求
-        response = requests.post(url, json={
-            "audio_data": audio_chunk,
-            "sample_rate": sample_rate
-        })
-        
+    def print_result(i: int, response: httpx.Response) -> None:
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             
             time_str = f"{i * chunk_duration:.1f}s"
             state = "语音" if result['is_speaking'] else "静音"
@@ -189,9 +223,32 @@ def example_real_time_simulation():
             changed = "是" if result['state_changed'] else "否"
             
             print(f"{time_str:4} | {state:4} | {prob:6} | {changed}")
+    
+    async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
+        pending = None
+        for i, has_speech in enumerate(speech_pattern):
+            # 生成并编码音频块（与上一个请求重叠）
+            audio_chunk = generate_test_audio(chunk_duration, sample_rate, has_speech)
+            body = orjson.dumps({
+                "audio_b64": encode_audio(audio_chunk),
+                "dtype": "int16",
+                "sample_rate": sample_rate
+            })
+            
+            # 等待上一个请求完成后再发送，保持VAD状态顺序
+            if pending is not None:
+                print_result(i - 1, await pending)
+            
+            # 发送VAD请求
+            pending = asyncio.create_task(client.post(
+                url, content=body, headers={"Content-Type": "application/json"}
+            ))
+            
+            # 模拟实时延迟（请求在此期间处理）
+            await asyncio.sleep(0.05)
         
-        # 模拟实时延迟
-        time.sleep(0.05)
+        if pending is not None:
+            print_result(len(speech_pattern) - 1, await pending)
 
 
 def example_vad_status():
@@ -199,10 +256,10 @@ def example_vad_status():
     print("\n=== 示例5: 获取VAD状态 ===")
     
     # 获取当前状态
-    response = requests.get("http://localhost:8000/api/v1/vad/status")
+    response = SESSION.get("http://localhost:8000/api/v1/vad/status")
     
     if response.status_code == 200:
-        status = response.json()
+        status = orjson.loads(response.content)
         
         print("\nVAD处理器状态:")
         print(f"- 状态: {status['status']}")
@@ -220,7 +277,7 @@ def example_vad_status():
     
     # 重置VAD状态
     print("\n重置VAD状态...")
-    response = requests.post("http://localhost:8000/api/v1/vad/reset")
+    response = SESSION.post("http://localhost:8000/api/v1/vad/reset")
     if response.status_code == 200:
         print("VAD状态已重置")
 
@@ -233,7 +290,7 @@ def main():
     
     try:
         # 检查服务是否可用
-        response = requests.get("http://localhost:8000/health")
+        response = SESSION.get("http://localhost:8000/health")
         if response.status_code != 200:
             print("错误: ASR API服务不可用")
             return
@@ -246,7 +303,7 @@ def main():
     example_single_detection()
     example_batch_processing()
     example_file_analysis()
-    example_real_time_simulation()
+    asyncio.run(example_real_time_simulation())
     example_vad_status()
     
     print("\n所有示例运行完成！")
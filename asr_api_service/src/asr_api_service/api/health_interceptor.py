@@ -0,0 +1,65 @@
+"""Pure ASGI interceptor for liveness probes.
+
+Liveness probes are answered before the request reaches FastAPI, so they
+skip middleware, routing and response-model validation entirely.
+"""
+
+import hashlib
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from asr_api_service.api.probe_counters import LIVE, PROBE_COUNTS
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+LIVE_PATHS = frozenset({"/live", "/api/v1/live"})
+
+_LIVE_BODY = b'{"status":"alive"}'
+_LIVE_ETAG = f'W/"{hashlib.blake2b(_LIVE_BODY, digest_size=8).hexdigest()}"'.encode()
+_LIVE_CACHE_HEADERS = [
+    (b"etag", _LIVE_ETAG),
+    (b"cache-control", b"public, max-age=5"),
+]
+_LIVE_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_LIVE_BODY)).encode()),
+    *_LIVE_CACHE_HEADERS,
+]
+_NOT_MODIFIED_HEADERS = _LIVE_CACHE_HEADERS
+
+_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+_NOT_ALLOWED_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_NOT_ALLOWED_BODY)).encode()),
+    (b"allow", b"GET, HEAD"),
+]
+
+
+class HealthCheckInterceptor:
+    """Answer liveness probes (GET/HEAD) directly and pass everything else to ``app``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in LIVE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        PROBE_COUNTS[LIVE] += 1
+        method = scope["method"]
+        if method == "GET" or method == "HEAD":
+            if (b"if-none-match", _LIVE_ETAG) in scope["headers"]:
+                status, headers, body = 304, _NOT_MODIFIED_HEADERS, b""
+            else:
+                # HEAD gets the same headers but no body
+                status, headers = 200, _LIVE_HEADERS
+                body = _LIVE_BODY if method == "GET" else b""
+        else:
+            status, headers, body = 405, _NOT_ALLOWED_HEADERS, _NOT_ALLOWED_BODY
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
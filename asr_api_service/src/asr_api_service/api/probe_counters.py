@@ -0,0 +1,25 @@
+"""Request counters for the health probe endpoints.
+
+Counters are plain integers in a preallocated array, so counting a probe
+is a single increment with no per-request allocation. They are formatted
+only when ``/metrics`` is scraped.
+"""
+
+import array
+
+# Counter slots, indexed by the constants below
+PROBE_NAMES = ("live", "health", "health_detailed", "ready")
+LIVE, HEALTH, HEALTH_DETAILED, READY = range(len(PROBE_NAMES))
+
+PROBE_COUNTS = array.array("Q", [0] * len(PROBE_NAMES))
+
+
+def render_prometheus() -> str:
+    """Format the probe counters in the Prometheus text exposition format."""
+    lines = [
+        "# HELP asr_probe_requests_total Health probe requests served.",
+        "# TYPE asr_probe_requests_total counter",
+    ]
+    for name, count in zip(PROBE_NAMES, PROBE_COUNTS):
+        lines.append(f'asr_probe_requests_total{{endpoint="{name}"}} {count}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,54 @@
+"""Shared response classes."""
+
+import functools
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+import msgpack
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (numpy arrays and enums supported)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+class MsgPackResponse(Response):
+    """MessagePack response (bytes values are packed as bin, without Base64)."""
+
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+def ttl_cached_json(
+    ttl: float, key: Callable[[], Hashable] = lambda: None
+) -> Callable[[Callable[[], Awaitable[Any]]], Callable[[], Awaitable[Response]]]:
+    """Cache a parameterless endpoint's serialized JSON payload.
+
+    The payload is rebuilt once ``ttl`` seconds have passed or ``key()``
+    changes; otherwise the cached bytes are returned without calling the
+    endpoint or running FastAPI's serialization.
+    """
+
+    def decorator(func: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Response]]:
+        # (monotonic expiry time, key, serialized payload)
+        cache: Optional[Tuple[float, Hashable, bytes]] = None
+
+        @functools.wraps(func)
+        async def wrapper() -> Response:
+            nonlocal cache
+            now = time.monotonic()
+            current_key = key()
+            if cache is None or now >= cache[0] or cache[1] != current_key:
+                body = orjson.dumps(await func(), option=orjson.OPT_SERIALIZE_NUMPY)
+                cache = (now + ttl, current_key, body)
+            return Response(content=cache[2], media_type="application/json")
+
+        return wrapper
+
+    return decorator
@@ -1,23 +1,50 @@
 """API v1 package."""
 
+import importlib
+from collections import Counter
+
 from fastapi import APIRouter
 
-from asr_api_service.api.v1.health import router as health_router
-from asr_api_service.api.v1.transcription import router as transcription_router
-from asr_api_service.api.v1.streaming import router as streaming_router
-from asr_api_service.api.v1.vad import router as vad_router
-from asr_api_service.api.v1.mobile import router as mobile_router
-from asr_api_service.api.v1.stream_vad import router as stream_vad_router
+from asr_api_service.config import settings
 
 # API v1 router
 api_router = APIRouter()
 
+# Sub-router modules and their tags, each included exactly once.
+# Modules are imported only when enabled, so workers that don't serve a
+# route never load its dependencies.
+_SUB_ROUTERS = (
+    ("health", "health"),
+    ("transcription", "transcription"),
+    ("streaming", "streaming"),
+    ("vad", "vad"),
+    ("mobile", "mobile"),
+    ("stream_vad", "streaming-vad"),
+)
+
+
+def _include(name: str, tag: str) -> APIRouter:
+    """Import a sub-router module and include its router."""
+    module = importlib.import_module(f"{__name__}.{name}")
+    api_router.include_router(module.router, tags=[tag])
+    return module.router
+
+
 # Include sub-routers
-api_router.include_router(health_router, tags=["health"])
-api_router.include_router(transcription_router, tags=["transcription"])
-api_router.include_router(streaming_router, tags=["streaming"])
-api_router.include_router(vad_router, tags=["vad"])
-api_router.include_router(mobile_router, tags=["mobile"])
-api_router.include_router(stream_vad_router, tags=["streaming-vad"])
-
-__all__ = ["api_router"]
\ No newline at end of file
+_included = [
+    _include(name, tag)
+    for name, tag in _SUB_ROUTERS
+    if name in settings.api_enabled_routers
+]
+
+# Catch duplicated registrations at import time (explicit, so it survives -O)
+_route_keys = Counter(
+    (getattr(route, "path", None), frozenset(getattr(route, "methods", None) or ()))
+    for _router in _included
+    for route in _router.routes
+)
+_duplicates = sorted(str(path) for (path, _), count in _route_keys.items() if count > 1)
+if _duplicates:
+    raise RuntimeError(f"Duplicate API v1 routes registered: {_duplicates}")
+
+__all__ = ["api_router"]
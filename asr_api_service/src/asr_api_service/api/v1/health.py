@@ -1,15 +1,33 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+import asyncio
+import functools
+import hashlib
+import os
+import stat
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel
 
+from asr_api_service.api.probe_counters import (
+    HEALTH,
+    HEALTH_DETAILED,
+    LIVE,
+    PROBE_COUNTS,
+    READY,
+)
+from asr_api_service.api.responses import ORJSONResponse
 from asr_api_service.config import settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class HealthResponse(BaseModel):
-    """Health check response model."""
+    """Health check response model (OpenAPI documentation only)."""
 
     status: str
     service: str
@@ -18,7 +36,7 @@ class HealthResponse(BaseModel):
 
 
 class DetailedHealthResponse(BaseModel):
-    """Detailed health check response model."""
+    """Detailed health check response model (OpenAPI documentation only)."""
 
     status: str
     service: str
@@ -27,83 +45,238 @@ class DetailedHealthResponse(BaseModel):
     checks: dict
 
 
-@router.get("/health", response_model=HealthResponse)
-async def basic_health_check():
+@functools.lru_cache(maxsize=1)
+def _api_keys_configured() -> Tuple[bool, bool]:
+    """Return (asr_key_configured, llm_key_configured), computed once."""
+    return bool(settings.get_asr_api_key()), bool(settings.llm_api_key)
+
+
+def _detailed_settings() -> dict:
+    """Settings summary reported by /health/detailed."""
+    return {
+        "asr_provider": settings.asr_provider,
+        "llm_provider": settings.llm_provider,
+        "audio_sample_rate": settings.audio_sample_rate,
+        "vad_threshold": settings.vad_threshold,
+        "streaming_max_clients": settings.streaming_max_clients,
+    }
+
+
+# Built once; reused by reference on every /health/detailed rebuild
+_DETAILED_SETTINGS = _detailed_settings()
+_VALID_CONFIGURATION = (settings.valid_vad_threshold, settings.valid_audio_settings)
+
+
+def refresh() -> None:
+    """Drop cached settings-derived state (call after reloading settings)."""
+    global _detailed_health_cache, _DETAILED_SETTINGS, _VALID_CONFIGURATION
+    _api_keys_configured.cache_clear()
+    _DETAILED_SETTINGS = _detailed_settings()
+    _VALID_CONFIGURATION = (settings.valid_vad_threshold, settings.valid_audio_settings)
+    _detailed_health_cache = None
+
+
+# Pre-serialized /health body and its ETag, keyed by the settings values it reports
+_basic_health_cache: Optional[Tuple[tuple, bytes, str]] = None
+
+# Lets probes, load balancers and proxies reuse /health responses briefly
+_BASIC_HEALTH_CACHE_CONTROL = "public, max-age=5"
+
+
+def _basic_health_body() -> Tuple[bytes, str]:
+    """Return the serialized basic health payload and its ETag.
+
+    The payload is rebuilt only if the reported settings changed.
+    """
+    global _basic_health_cache
+    key = (
+        settings.asr_provider,
+        settings.llm_provider,
+        settings.audio_sample_rate,
+        settings.vad_threshold,
+    )
+    if _basic_health_cache is None or _basic_health_cache[0] != key:
+        body = orjson.dumps({
+            "status": "healthy",
+            "service": "asr-api-service",
+            "version": "0.1.0",
+            "settings": {
+                "asr_provider": settings.asr_provider,
+                "llm_provider": settings.llm_provider,
+                "audio_sample_rate": settings.audio_sample_rate,
+                "vad_threshold": settings.vad_threshold,
+            },
+        })
+        etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        _basic_health_cache = (key, body, etag)
+    return _basic_health_cache[1], _basic_health_cache[2]
+
+
+# Computed at import so the first probe is already a cache hit
+_basic_health_body()
+
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
+async def basic_health_check(request: Request):
     """Basic health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        service="asr-api-service",
-        version="0.1.0",
-        settings={
-            "asr_provider": settings.asr_provider,
-            "llm_provider": settings.llm_provider,
-            "audio_sample_rate": settings.audio_sample_rate,
-            "vad_threshold": settings.vad_threshold,
-        },
+    PROBE_COUNTS[HEALTH] += 1
+    body, etag = _basic_health_body()
+    headers = {"ETag": etag, "Cache-Control": _BASIC_HEALTH_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.head("/health")
+async def basic_health_head():
+    """Basic health check for HEAD probes: status and cache headers, no body."""
+    PROBE_COUNTS[HEALTH] += 1
+    _, etag = _basic_health_body()
+    return Response(headers={"ETag": etag, "Cache-Control": _BASIC_HEALTH_CACHE_CONTROL})
+
+
+# Storage status shared by /ready and /health/detailed for this many seconds
+_STORAGE_STATUS_TTL = 5.0
+
+# Cached storage status: (monotonic time computed, {"audio", "log", "temp"} -> bool)
+_storage_status_cache: Optional[Tuple[float, Dict[str, bool]]] = None
+
+
+def _is_dir(path: Path) -> bool:
+    """Check that a path is an existing directory with a single stat call."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode)
+
+
+async def _storage_status() -> Dict[str, bool]:
+    """Return the storage directory status, re-checked at most every few seconds.
+
+    The stat calls run concurrently in worker threads so they don't block the event loop.
+    """
+    global _storage_status_cache
+    now = time.monotonic()
+    if _storage_status_cache is not None and now - _storage_status_cache[0] < _STORAGE_STATUS_TTL:
+        return _storage_status_cache[1]
+
+    audio_ok, log_ok, temp_ok = await asyncio.gather(
+        asyncio.to_thread(_is_dir, settings.audio_storage_path),
+        asyncio.to_thread(_is_dir, settings.log_storage_path),
+        asyncio.to_thread(_is_dir, settings.temp_storage_path),
     )
+    status = {"audio": audio_ok, "log": log_ok, "temp": temp_ok}
+    _storage_status_cache = (now, status)
+    return status
+
 
+# Cached /health/detailed body: (monotonic time computed, serialized payload)
+_detailed_health_cache: Optional[Tuple[float, bytes]] = None
 
-@router.get("/health/detailed", response_model=DetailedHealthResponse)
+
+@router.get("/health/detailed", responses={200: {"model": DetailedHealthResponse}})
 async def detailed_health_check():
-    """Detailed health check endpoint with system checks."""
-    checks = {}
-    
+    """Detailed health check endpoint with system checks.
+
+    The result is cached for ``settings.health_cache_ttl`` seconds.
+    """
+    PROBE_COUNTS[HEALTH_DETAILED] += 1
+    global _detailed_health_cache
+    ttl = settings.health_cache_ttl
+    now = time.monotonic()
+    if _detailed_health_cache is not None and now - _detailed_health_cache[0] < ttl:
+        return Response(
+            content=_detailed_health_cache[1],
+            media_type="application/json",
+            headers={"Cache-Control": f"max-age={int(ttl)}", "X-Cache": "HIT"},
+        )
+
     # Check storage directories
-    checks["storage"] = {
-        "audio_storage": settings.audio_storage_path.exists() and settings.audio_storage_path.is_dir(),
-        "log_storage": settings.log_storage_path.exists() and settings.log_storage_path.is_dir(),
-        "temp_storage": settings.temp_storage_path.exists() and settings.temp_storage_path.is_dir(),
-    }
+    storage = await _storage_status()
+    audio_ok, log_ok, temp_ok = storage["audio"], storage["log"], storage["temp"]
     
     # Check API keys
-    checks["api_keys"] = {
-        "asr_key_configured": bool(settings.get_asr_api_key()),
-        "llm_key_configured": bool(settings.llm_api_key),
-    }
+    asr_key_configured, llm_key_configured = _api_keys_configured()
     
     # Check configuration
-    checks["configuration"] = {
-        "valid_vad_threshold": 0.0 <= settings.vad_threshold <= 1.0,
-        "valid_audio_settings": settings.audio_sample_rate > 0 and settings.audio_chunk_duration > 0,
-    }
+    valid_vad_threshold, valid_audio_settings = _VALID_CONFIGURATION
     
     # Overall status
-    all_checks_passed = all(
-        all(check_results.values()) if isinstance(check_results, dict) else check_results
-        for check_results in checks.values()
+    all_checks_passed = (
+        audio_ok and log_ok and temp_ok
+        and asr_key_configured and llm_key_configured
+        and valid_vad_threshold and valid_audio_settings
     )
     
-    return DetailedHealthResponse(
+    checks = {
+        "storage": {
+            "audio_storage": audio_ok,
+            "log_storage": log_ok,
+            "temp_storage": temp_ok,
+        },
+        "api_keys": {
+            "asr_key_configured": asr_key_configured,
+            "llm_key_configured": llm_key_configured,
+        },
+        "configuration": {
+            "valid_vad_threshold": valid_vad_threshold,
+            "valid_audio_settings": valid_audio_settings,
+        },
+    }
+    
+    payload = dict(
         status="healthy" if all_checks_passed else "degraded",
         service="asr-api-service",
         version="0.1.0",
-        settings={
-            "asr_provider": settings.asr_provider,
-            "llm_provider": settings.llm_provider,
-            "audio_sample_rate": settings.audio_sample_rate,
-            "vad_threshold": settings.vad_threshold,
-            "streaming_max_clients": settings.streaming_max_clients,
-        },
+        settings=_DETAILED_SETTINGS,
         checks=checks,
     )
+    body = orjson.dumps(payload)
+    _detailed_health_cache = (now, body)
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": f"max-age={int(ttl)}", "X-Cache": "MISS"},
+    )
 
 
 @router.get("/ready")
 async def readiness_check():
     """Readiness check endpoint for Kubernetes."""
+    PROBE_COUNTS[READY] += 1
     # Check if required API keys are configured
-    asr_key = settings.get_asr_api_key()
-    if not asr_key:
+    asr_key_configured, _ = _api_keys_configured()
+    if not asr_key_configured:
         return {"status": "not ready", "reason": "ASR API key not configured"}
     
     # Check storage directories
-    if not settings.audio_storage_path.exists():
+    storage = await _storage_status()
+    if not storage["audio"]:
         return {"status": "not ready", "reason": "Audio storage directory not available"}
     
     return {"status": "ready"}
 
 
+# Built once and returned by reference; Starlette only reads its body and headers
+_LIVE_RESPONSE = Response(content=b'{"status":"alive"}', media_type="application/json")
+_LIVE_HEAD_RESPONSE = Response()
+
+
 @router.get("/live")
 async def liveness_check():
-    """Liveness check endpoint for Kubernetes."""
-    return {"status": "alive"}
\ No newline at end of file
+    """Liveness check endpoint for Kubernetes.
+
+    Normally answered by ``HealthCheckInterceptor`` before reaching FastAPI;
+    this route serves the app when it runs without the interceptor.
+    """
+    PROBE_COUNTS[LIVE] += 1
+    return _LIVE_RESPONSE
+
+
+@router.head("/live")
+async def liveness_head():
+    """Liveness check for HEAD probes (status only)."""
+    PROBE_COUNTS[LIVE] += 1
+    return _LIVE_HEAD_RESPONSE
@@ -1,28 +1,47 @@
 """移动端专用 API 接口 - 针对 Expo React Native 优化"""
 
-import base64
-import io
+import asyncio
+import hashlib
+import json
+import logging
+import math
 import time
-import tempfile
-import subprocess
-import os
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Union
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends, Request
 from pydantic import BaseModel, Field
 import structlog
 import numpy as np
-import soundfile as sf
 
+try:
+    # SIMD 加速的 base64 编解码，未安装时回退到标准库
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+from asr_api_service.api.responses import MsgPackResponse, ORJSONResponse
 from asr_api_service.config import settings
-from asr_api_service.core.audio.vad import VADProcessor
+from asr_api_service.core.audio.converter import AudioConverter
+from asr_api_service.core.audio.vad import VADPool, VADProcessor, VADSession
 from asr_api_service.exceptions import VADError, ValidationError
 from asr_api_service.utils.validation import validate_audio_data
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger(__name__)
 
+_MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+_MSGPACK_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {"content": {"application/msgpack": {}}}
+}
+
+
+def _accepts_msgpack(http_request: Request) -> bool:
+    """客户端是否通过 Accept 头请求 MessagePack 响应"""
+    accept = http_request.headers.get("accept", "")
+    return any(media_type in accept for media_type in _MSGPACK_MEDIA_TYPES)
+
 
 class MobileAudioRequest(BaseModel):
     """移动端音频请求模型"""
@@ -52,7 +71,9 @@ class MobileAudioResponse(BaseModel):
     total_duration: float = Field(..., description="总时长（秒）")
     
     # 音频数据
-    audio_data: Optional[List[float]] = Field(None, description="处理后的音频数据（PCM）")
+    audio_data: Optional[List[float]] = Field(None, description="处理后的音频数据（PCM，仅 merged 格式）")
+    audio_data_b64: Optional[str] = Field(None, description="Base64 编码的原始 float32 小端 PCM（segments 格式）")
+    audio_samples: Optional[int] = Field(None, description="PCM 样本数")
     audio_base64: Optional[str] = Field(None, description="Base64 编码的音频")
     audio_format: Optional[str] = Field(None, description="音频格式")
     
@@ -73,199 +94,75 @@ async def get_vad_processor() -> VADProcessor:
             threshold=settings.vad_threshold,
             silence_duration=settings.vad_silence_duration,
             hop_size=settings.vad_hop_size,
+            batch_size=settings.vad_batch_size,
         )
     return _vad_processor
 
 
-class AudioConverter:
-    """音频格式转换工具"""
-    
-    @staticmethod
-    def _check_ffmpeg_available() -> bool:
-        """检查 ffmpeg 是否可用"""
-        try:
-            subprocess.run(['ffmpeg', '-version'], 
-                         stdout=subprocess.DEVNULL, 
-                         stderr=subprocess.DEVNULL, 
-                         check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
-    
-    @staticmethod
-    def _convert_with_ffmpeg(input_path: str, output_path: str, sample_rate: int = 16000) -> bool:
-        """使用 ffmpeg 转换音频格式"""
-        try:
-            cmd = [
-                'ffmpeg', '-i', input_path,
-                '-ar', str(sample_rate),  # 设置采样率
-                '-ac', '1',               # 转为单声道
-                '-f', 'wav',              # 输出格式为 WAV
-                '-y',                     # 覆盖输出文件
-                output_path
-            ]
-            
-            result = subprocess.run(
-                cmd, 
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.PIPE, 
-                check=True,
-                text=True
-            )
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            logger.error(f"ffmpeg 转换失败: {e.stderr}")
-            return False
-        except Exception as e:
-            logger.error(f"ffmpeg 调用异常: {e}")
-            return False
-    
-    @staticmethod
-    def base64_to_audio(audio_base64: str, format: str) -> tuple[np.ndarray, int]:
-        """
-        将 Base64 音频转换为 NumPy 数组
-        
-        返回: (音频数据, 采样率)
-        """
-        try:
-            # 解码 Base64
-            audio_bytes = base64.b64decode(audio_base64)
-            
-            # soundfile 原生支持的格式
-            native_formats = ['wav', 'flac', 'ogg']
-            
-            if format.lower() in native_formats:
-                # 使用 soundfile 直接读取
-                try:
-                    with io.BytesIO(audio_bytes) as audio_io:
-                        audio_data, sample_rate = sf.read(audio_io)
-                except Exception as e:
-                    logger.warning(f"soundfile 读取失败，尝试 ffmpeg: {e}")
-                    # 如果 soundfile 失败，也尝试 ffmpeg
-                    return AudioConverter._convert_with_ffmpeg_fallback(
-                        audio_bytes, format
-                    )
-            else:
-                # 对于其他格式（如 m4a, mp3），使用 ffmpeg
-                return AudioConverter._convert_with_ffmpeg_fallback(
-                    audio_bytes, format
-                )
-            
-            # 确保是单声道
-            if len(audio_data.shape) > 1:
-                audio_data = audio_data.mean(axis=1)
-            
-            # 归一化到 [-1, 1]
-            max_val = np.abs(audio_data).max()
-            if max_val > 0:
-                audio_data = audio_data / max_val
-            
-            return audio_data.astype(np.float32), sample_rate
-            
-        except Exception as e:
-            logger.error(f"音频转换失败: {e}")
-            raise ValueError(f"无法转换音频格式 {format}: {str(e)}")
-    
-    @staticmethod
-    def _convert_with_ffmpeg_fallback(audio_bytes: bytes, format: str) -> tuple[np.ndarray, int]:
-        """使用 ffmpeg 作为后备转换方案"""
-        # 检查 ffmpeg 是否可用
-        if not AudioConverter._check_ffmpeg_available():
-            raise ValueError(
-                f"不支持的音频格式 {format}。"
-                f"请安装 ffmpeg 以支持更多格式，或使用 WAV/FLAC/OGG 格式。"
-            )
-        
-        # 创建临时文件
-        with tempfile.NamedTemporaryFile(suffix=f'.{format}', delete=False) as input_file:
-            input_file.write(audio_bytes)
-            input_path = input_file.name
-        
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as output_file:
-            output_path = output_file.name
-        
-        try:
-            # 使用 ffmpeg 转换
-            success = AudioConverter._convert_with_ffmpeg(input_path, output_path)
-            
-            if not success:
-                raise ValueError(f"ffmpeg 无法转换 {format} 格式")
-            
-            # 读取转换后的 WAV 文件
-            audio_data, sample_rate = sf.read(output_path)
-            
-            # 确保是单声道
-            if len(audio_data.shape) > 1:
-                audio_data = audio_data.mean(axis=1)
-            
-            # 归一化到 [-1, 1]
-            max_val = np.abs(audio_data).max()
-            if max_val > 0:
-                audio_data = audio_data / max_val
-            
-            return audio_data.astype(np.float32), sample_rate
-            
-        finally:
-            # 清理临时文件
-            try:
-                os.unlink(input_path)
-                os.unlink(output_path)
-            except Exception as e:
-                logger.warning(f"清理临时文件失败: {e}")
-    
-    @staticmethod
-    def audio_to_base64(audio_data: np.ndarray, sample_rate: int, format: str = 'wav') -> str:
-        """
-        将音频数据转换为 Base64
-        
-        参数:
-            audio_data: 音频数据（-1 到 1 的浮点数）
-            sample_rate: 采样率
-            format: 输出格式
-        """
-        try:
-            # 创建内存缓冲区
-            buffer = io.BytesIO()
-            
-            # 写入音频数据
-            sf.write(buffer, audio_data, sample_rate, format=format)
-            
-            # 获取字节数据
-            audio_bytes = buffer.getvalue()
-            
-            # 编码为 Base64
-            return base64.b64encode(audio_bytes).decode('utf-8')
-            
-        except Exception as e:
-            logger.error(f"音频编码失败: {e}")
-            raise ValueError(f"无法编码音频: {str(e)}")
+# 批量处理使用的 VAD 处理器池：每个文件借出独立的处理器，可在线程池中并行检测
+_vad_pool: Optional[VADPool] = None
+
+
+async def get_vad_pool() -> VADPool:
+    """获取或创建 VAD 处理器池"""
+    global _vad_pool
+    if _vad_pool is None:
+        _vad_pool = VADPool(
+            settings.vad_workers,
+            threshold=settings.vad_threshold,
+            silence_duration=settings.vad_silence_duration,
+            hop_size=settings.vad_hop_size,
+            batch_size=settings.vad_batch_size,
+        )
+    return _vad_pool
+
+
+# 上传文件分块读取大小
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def read_into_buffer(upload: UploadFile, hint: Optional[int] = None) -> memoryview:
+    """
+    分块读取上传文件到预分配的 bytearray
     
-    @staticmethod
-    def resample_audio(audio_data: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
-        """
-        重采样音频数据
-        
-        简单的线性插值重采样，适用于语音
-        """
-        if orig_sr == target_sr:
-            return audio_data
-        
-        # 计算重采样因子
-        factor = target_sr / orig_sr
-        
-        # 计算新长度
-        new_length = int(len(audio_data) * factor)
+    避免 read() 一次性构造完整 bytes 对象，返回指向已读数据的 memoryview；
+    大小未知时从一个分块大小开始按倍数扩容
+    """
+    buf = bytearray(upload.size or hint or _UPLOAD_CHUNK_SIZE)
+    mv = memoryview(buf)
+    pos = 0
+    
+    while True:
+        chunk = await upload.read(_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
         
-        # 使用线性插值
-        old_indices = np.arange(len(audio_data))
-        new_indices = np.linspace(0, len(audio_data) - 1, new_length)
+        end = pos + len(chunk)
+        if end > len(buf):
+            # 超出预估大小时扩容（扩容前需释放 memoryview）
+            mv.release()
+            buf.extend(bytes(max(end - len(buf), len(buf))))
+            mv = memoryview(buf)
         
-        return np.interp(new_indices, old_indices, audio_data)
+        mv[pos:end] = chunk
+        pos = end
+    
+    return mv[:pos]
+
+
+def _rms(audio_data: np.ndarray) -> float:
+    """计算 RMS（点积一次完成平方和，不分配平方后的临时数组）"""
+    return math.sqrt(float(np.dot(audio_data, audio_data)) / max(1, audio_data.size))
 
 
-@router.post("/mobile/process-audio-efficient")
+def _b64_decoded_size(encoded: str) -> int:
+    """由 Base64 字符串长度直接计算解码后的字节数（无需再次解码）"""
+    return len(encoded) * 3 // 4 - encoded[-2:].count('=')
+
+
+@router.post("/mobile/process-audio-efficient", responses=_MSGPACK_RESPONSES)
 async def process_mobile_audio_efficient(
+    http_request: Request,
     audio: UploadFile = File(..., description="音频文件（直接上传，无Base64编码）"),
     sample_rate: int = Form(16000, description="采样率"),
     enable_vad: bool = Form(True, description="是否启用VAD检测"),
@@ -285,7 +182,7 @@ async def process_mobile_audio_efficient(
     
     try:
         # 读取音频文件
-        content = await audio.read()
+        content = await read_into_buffer(audio)
         format_ext = audio.filename.split('.')[-1].lower() if audio.filename else 'wav'
         
         logger.info(
@@ -296,58 +193,12 @@ async def process_mobile_audio_efficient(
             return_audio=return_audio
         )
         
-        # 直接转换音频（避免Base64编码步骤）
-        audio_data = None
-        actual_sample_rate = sample_rate
-        
-        # 根据格式直接处理
-        native_formats = ['wav', 'flac', 'ogg']
-        
-        if format_ext.lower() in native_formats:
-            # 使用soundfile直接读取
-            try:
-                with io.BytesIO(content) as audio_io:
-                    audio_data, actual_sample_rate = sf.read(audio_io)
-            except Exception as e:
-                logger.warning(f"soundfile直接读取失败，使用ffmpeg: {e}")
-                audio_data, actual_sample_rate = AudioConverter._convert_with_ffmpeg_fallback(content, format_ext)
-        else:
-            # 使用ffmpeg处理其他格式
-            audio_data, actual_sample_rate = AudioConverter._convert_with_ffmpeg_fallback(content, format_ext)
-        
-        # 确保是单声道和正确的数据类型
-        if len(audio_data.shape) > 1:
-            audio_data = audio_data.mean(axis=1)
-        
-        # 归一化
-        max_val = np.abs(audio_data).max()
-        if max_val > 0:
-            audio_data = audio_data / max_val
-        
-        audio_data = audio_data.astype(np.float32)
-        
-        # 重采样
-        if actual_sample_rate != sample_rate:
-            audio_data = AudioConverter.resample_audio(audio_data, actual_sample_rate, sample_rate)
-        
-        # VAD处理
-        speech_segments = []
-        valid_audio = audio_data
-        
-        if enable_vad:
-            vad_processor = await get_vad_processor()
-            segments_result = await analyze_audio_with_vad(
-                audio_data, sample_rate, 0.5, 0.1, vad_processor
-            )
-            speech_segments = segments_result['speech_segments']
-            
-            if speech_segments:
-                valid_audio = extract_segments(audio_data, speech_segments, sample_rate)
-            else:
-                valid_audio = np.array([], dtype=np.float32)
+        # 直接转换音频（避免Base64编码步骤）、重采样、VAD处理
+        total_duration, speech_segments, valid_audio = await _decode_and_detect(
+            content, format_ext, sample_rate, enable_vad, 0.5, 0.1
+        )
         
         # 构建响应
-        total_duration = len(audio_data) / sample_rate
         response_data = {
             "success": True,
             "message": "音频处理成功",
@@ -364,11 +215,12 @@ async def process_mobile_audio_efficient(
             if output_format == "binary":
                 # 返回二进制音频数据
                 from fastapi.responses import Response
-                audio_bytes = valid_audio.astype(np.float32).tobytes()
+                audio_bytes = valid_audio.astype(np.float32, copy=False).tobytes()
                 return Response(
                     content=audio_bytes,
                     media_type="application/octet-stream",
                     headers={
+                        # 响应头只能是 latin-1，使用 json.dumps 转义非 ASCII 字符
                         "X-Audio-Info": json.dumps(response_data),
                         "X-Sample-Rate": str(sample_rate),
                         "X-Samples": str(len(valid_audio)),
@@ -379,17 +231,27 @@ async def process_mobile_audio_efficient(
                 # JSON格式，但只返回必要信息
                 response_data["audio_samples"] = len(valid_audio)
                 response_data["audio_duration"] = len(valid_audio) / sample_rate
-                # 不返回完整音频数据，只返回统计信息
+                if _accepts_msgpack(http_request):
+                    # MessagePack 可直接携带二进制，返回 float32 小端 PCM
+                    response_data["audio_data"] = valid_audio.astype('<f4', copy=False).tobytes()
+                    response_data["audio_format"] = "pcm_f32le"
+                # 否则不返回完整音频数据，只返回统计信息
         
-        return response_data
+        if _accepts_msgpack(http_request):
+            return MsgPackResponse(response_data)
+        return ORJSONResponse(response_data)
         
     except Exception as e:
         logger.exception("高效音频处理失败")
         raise HTTPException(status_code=500, detail=f"处理失败: {str(e)}")
 
 
-@router.post("/mobile/process-audio", response_model=MobileAudioResponse)
-async def process_mobile_audio(request: MobileAudioRequest):
+@router.post(
+    "/mobile/process-audio",
+    response_model=MobileAudioResponse,
+    responses=_MSGPACK_RESPONSES,
+)
+async def process_mobile_audio(request: MobileAudioRequest, http_request: Request):
     """
     移动端音频处理接口 - 一站式处理音频录制结果
     
@@ -399,89 +261,197 @@ async def process_mobile_audio(request: MobileAudioRequest):
     3. 返回处理后的音频数据
     
     支持的格式: wav, m4a, mp3, ogg, webm, flac
+    
+    请求头 Accept: application/msgpack 时返回 MessagePack，
+    音频以 float32 小端 PCM 二进制放在 audio_data 中（忽略 return_format）
     """
-    start_time = time.time()
+    return await _process_mobile_audio(request, msgpack_response=_accepts_msgpack(http_request))
+
+
+class _AudioResultCache:
+    """
+    按音频内容哈希缓存处理结果（LRU + TTL）
     
-    try:
-        logger.info(
-            "移动端音频处理请求",
-            format=request.format,
-            sample_rate=request.sample_rate,
-            enable_vad=request.enable_vad,
-            audio_size=len(request.audio_base64),
+    除条目数外还按缓存音频的总字节数限制内存，超过单条上限的结果不缓存
+    """
+    
+    def __init__(self, maxsize: int, ttl: float, max_bytes: int, max_entry_bytes: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.total_bytes = 0
+        self._entries: "OrderedDict[tuple, Tuple[float, int, Any]]" = OrderedDict()
+    
+    def get(self, key: tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[2]
+    
+    def put(self, key: tuple, value: Any, nbytes: int) -> None:
+        if self.maxsize <= 0 or nbytes > self.max_entry_bytes:
+            return
+        if key in self._entries:
+            self._pop(key)
+        self._entries[key] = (time.monotonic(), nbytes, value)
+        self.total_bytes += nbytes
+        while len(self._entries) > self.maxsize or self.total_bytes > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+    
+    def _pop(self, key: tuple) -> None:
+        self.total_bytes -= self._entries.pop(key)[1]
+
+
+_audio_result_cache = _AudioResultCache(
+    maxsize=settings.audio_result_cache_size,
+    ttl=settings.audio_result_cache_ttl,
+    max_bytes=settings.audio_result_cache_max_bytes,
+    max_entry_bytes=settings.audio_result_cache_max_entry_bytes,
+)
+
+
+def _audio_digest(data: Union[bytes, memoryview]) -> bytes:
+    """音频内容哈希（blake2b，作为缓存键）"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+async def _decode_and_detect(
+    source: Union[str, bytes, memoryview],
+    format: str,
+    sample_rate: int,
+    enable_vad: bool,
+    vad_window_duration: float,
+    vad_overlap: float,
+) -> tuple[float, List[Dict[str, float]], np.ndarray]:
+    """
+    音频解码、重采样与 VAD 检测
+    
+    source 为 str 时视为 Base64，否则为原始字节。相同音频内容与参数的结果
+    会被缓存，重复上传（重试、后台同步）直接复用。
+    
+    返回: (总时长, 语音段列表, 有效音频)
+    """
+    cache_key = (
+        isinstance(source, str),
+        _audio_digest(source.encode() if isinstance(source, str) else source),
+        format,
+        sample_rate,
+        enable_vad,
+        vad_window_duration,
+        vad_overlap,
+    )
+    cached = _audio_result_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("命中音频结果缓存", format=format, sample_rate=sample_rate)
+        return cached
+    
+    # 步骤1: 转换音频格式
+    audio_conversion_start = time.time()
+    if isinstance(source, str):
+        audio_data, actual_sample_rate = AudioConverter.base64_to_audio(source, format)
+    else:
+        audio_data, actual_sample_rate = AudioConverter.bytes_to_audio(source, format)
+    audio_conversion_time = int((time.time() - audio_conversion_start) * 1000)
+    
+    # 步骤2: 重采样（如果需要）
+    resample_time = 0
+    if actual_sample_rate != sample_rate:
+        resample_start = time.time()
+        audio_data = AudioConverter.resample_audio(
+            audio_data,
+            actual_sample_rate,
+            sample_rate
         )
-        
-        # 步骤1: 转换音频格式
-        audio_conversion_start = time.time()
-        audio_data, actual_sample_rate = AudioConverter.base64_to_audio(
-            request.audio_base64,
-            request.format
+        resample_time = int((time.time() - resample_start) * 1000)
+    
+    # 计算原始音频信息
+    total_duration = len(audio_data) / sample_rate
+    
+    # 步骤3: VAD 检测（如果启用）
+    speech_segments = []
+    valid_audio = audio_data
+    
+    if enable_vad:
+        vad_processor = await get_vad_processor()
+        
+        # 分析音频文件
+        segments_result = await analyze_audio_with_vad(
+            audio_data,
+            sample_rate,
+            vad_window_duration,
+            vad_overlap,
+            vad_processor
         )
-        audio_conversion_time = int((time.time() - audio_conversion_start) * 1000)
         
-        logger.info(
-            "音频格式转换完成",
-            format=request.format,
-            original_sample_rate=actual_sample_rate,
-            target_sample_rate=request.sample_rate,
-            audio_length=len(audio_data),
-            conversion_time_ms=audio_conversion_time,
-        )
+        speech_segments = segments_result['speech_segments']
         
-        # 步骤2: 重采样（如果需要）
-        if actual_sample_rate != request.sample_rate:
-            logger.info(f"重采样: {actual_sample_rate} -> {request.sample_rate}")
-            resample_start = time.time()
-            audio_data = AudioConverter.resample_audio(
+        # 提取有效音频段
+        if speech_segments:
+            valid_audio = extract_segments(
                 audio_data,
-                actual_sample_rate,
-                request.sample_rate
+                speech_segments,
+                sample_rate
             )
-            resample_time = int((time.time() - resample_start) * 1000)
-            logger.info(f"重采样完成，耗时: {resample_time}ms")
-        
-        # 计算原始音频信息
-        total_duration = len(audio_data) / request.sample_rate
-        
-        # 音频质量分析
-        rms_level = float(np.sqrt(np.mean(audio_data ** 2)))
-        peak_level = float(np.max(np.abs(audio_data)))
-        
+        else:
+            valid_audio = np.array([], dtype=np.float32)
+    
+    # 汇总为一条日志；音频质量分析只在需要输出 INFO 日志时计算
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
-            "音频质量分析",
+            "音频解码与 VAD 检测完成",
+            format=format,
+            original_sample_rate=actual_sample_rate,
+            target_sample_rate=sample_rate,
             duration=total_duration,
-            rms_level=rms_level,
-            peak_level=peak_level,
             samples_count=len(audio_data),
+            rms_level=_rms(audio_data),
+            peak_level=float(max(audio_data.max(), -audio_data.min())) if len(audio_data) else 0.0,
+            conversion_time_ms=audio_conversion_time,
+            resample_time_ms=resample_time,
+            speech_segments_count=len(speech_segments),
+        )
+    
+    # 缓存结果在多个请求间共享，禁止修改
+    valid_audio.flags.writeable = False
+    result = (total_duration, speech_segments, valid_audio)
+    _audio_result_cache.put(cache_key, result, valid_audio.nbytes)
+    return result
+
+
+async def _process_mobile_audio(
+    request: MobileAudioRequest,
+    audio_bytes: Optional[Union[bytes, memoryview]] = None,
+    msgpack_response: bool = False,
+):
+    """
+    移动端音频处理主流程
+    
+    传入 audio_bytes 时直接解码原始字节，忽略 request.audio_base64；
+    msgpack_response 为 True 时以 MessagePack 返回原始 PCM 二进制
+    """
+    start_time = time.time()
+    log = logger.bind(
+        format=request.format,
+        sample_rate=request.sample_rate,
+        enable_vad=request.enable_vad,
+        audio_size=len(request.audio_base64) if audio_bytes is None else len(audio_bytes),
+    )
+    
+    try:
+        # 步骤1-3: 格式转换、重采样、VAD 检测
+        total_duration, speech_segments, valid_audio = await _decode_and_detect(
+            request.audio_base64 if audio_bytes is None else audio_bytes,
+            request.format,
+            request.sample_rate,
+            request.enable_vad,
+            request.vad_window_duration,
+            request.vad_overlap,
         )
-        
-        # 步骤3: VAD 检测（如果启用）
-        speech_segments = []
-        valid_audio = audio_data
-        
-        if request.enable_vad:
-            vad_processor = await get_vad_processor()
-            
-            # 分析音频文件
-            segments_result = await analyze_audio_with_vad(
-                audio_data,
-                request.sample_rate,
-                request.vad_window_duration,
-                request.vad_overlap,
-                vad_processor
-            )
-            
-            speech_segments = segments_result['speech_segments']
-            
-            # 提取有效音频段
-            if speech_segments:
-                valid_audio = extract_segments(
-                    audio_data,
-                    speech_segments,
-                    request.sample_rate
-                )
-            else:
-                valid_audio = np.array([], dtype=np.float32)
         
         # 步骤4: 准备响应数据
         response_data = {
@@ -495,10 +465,19 @@ async def process_mobile_audio(request: MobileAudioRequest):
         }
         
         # 根据返回格式处理音频数据
-        if request.return_format == "segments":
-            # 返回 PCM 数组
-            response_data["audio_data"] = valid_audio.tolist()
-            response_data["audio_format"] = "pcm_f32"
+        if msgpack_response:
+            # MessagePack 直接携带二进制，无需 Base64 或浮点数列表
+            response_data["audio_data"] = valid_audio.astype('<f4', copy=False).tobytes()
+            response_data["audio_format"] = "pcm_f32le"
+            response_data["audio_samples"] = int(valid_audio.size)
+            
+        elif request.return_format == "segments":
+            # 返回 Base64 编码的原始 float32 PCM（避免构造巨大的浮点数列表）
+            response_data["audio_data_b64"] = b64encode(
+                valid_audio.astype('<f4', copy=False).tobytes()
+            ).decode('ascii')
+            response_data["audio_format"] = "pcm_f32le"
+            response_data["audio_samples"] = int(valid_audio.size)
             
         elif request.return_format == "base64":
             # 返回 Base64 编码的音频
@@ -514,7 +493,7 @@ async def process_mobile_audio(request: MobileAudioRequest):
             )
             response_data["audio_base64"] = audio_base64
             response_data["audio_format"] = output_format
-            response_data["audio_size_bytes"] = len(base64.b64decode(audio_base64))
+            response_data["audio_size_bytes"] = _b64_decoded_size(audio_base64)
             
         elif request.return_format == "merged":
             # 返回合并的音频数据和 Base64
@@ -526,20 +505,23 @@ async def process_mobile_audio(request: MobileAudioRequest):
             )
             response_data["audio_format"] = "wav"
         
-        logger.info(
-            "音频处理完成",
+        log.info(
+            "移动端音频处理完成",
+            return_format=request.return_format,
             has_speech=response_data["has_speech"],
             speech_segments_count=len(speech_segments),
             speech_ratio=response_data["speech_ratio"],
             processing_time_ms=response_data["processing_time_ms"],
         )
         
+        if msgpack_response:
+            return MsgPackResponse(response_data)
         return MobileAudioResponse(**response_data)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception("移动端音频处理失败")
+        log.exception("移动端音频处理失败")
         raise HTTPException(status_code=500, detail=f"处理失败: {str(e)}")
 
 
@@ -568,21 +550,21 @@ async def quick_vad_check(
             audio_data = audio_data[:max_samples]
         
         # 简单的能量检测
-        rms = np.sqrt(np.mean(audio_data ** 2))
+        rms = _rms(audio_data)
         has_speech = rms > 0.01  # 简单阈值
         
         # 如果需要更准确的检测
         if has_speech and settings.vad_threshold > 0:
             vad_processor = await get_vad_processor()
-            vad_result = await vad_processor.process(audio_data.tolist())
+            vad_result = await vad_processor.process(audio_data)
             has_speech = vad_result.is_speaking
         
-        return {
+        return ORJSONResponse({
             "has_speech": has_speech,
-            "rms": float(rms),
+            "rms": rms,
             "duration": len(audio_data) / sample_rate,
             "processing_time_ms": int((time.time() - start_time) * 1000),
-        }
+        })
         
     except Exception as e:
         logger.error(f"快速 VAD 检测失败: {e}")
@@ -603,15 +585,12 @@ async def quick_vad_check_file(
     
     try:
         # 读取上传的文件
-        content = await audio.read()
+        content = await read_into_buffer(audio)
         
         # 获取文件格式
         filename = audio.filename or "audio"
         format_ext = filename.split('.')[-1].lower() if '.' in filename else 'wav'
         
-        # 转换为 Base64
-        audio_base64 = base64.b64encode(content).decode('utf-8')
-        
         logger.info(
             "快速 VAD 文件检测",
             filename=filename,
@@ -620,7 +599,7 @@ async def quick_vad_check_file(
         )
         
         # 转换音频
-        audio_data, _ = AudioConverter.base64_to_audio(audio_base64, format_ext)
+        audio_data, _ = AudioConverter.bytes_to_audio(content, format_ext)
         
         # 快速 VAD 检测（只检测前几秒）
         max_duration = 5.0  # 最多检测5秒
@@ -630,24 +609,24 @@ async def quick_vad_check_file(
             audio_data = audio_data[:max_samples]
         
         # 简单的能量检测
-        rms = np.sqrt(np.mean(audio_data ** 2))
+        rms = _rms(audio_data)
         has_speech = rms > 0.01  # 简单阈值
         
         # 如果需要更准确的检测
         if has_speech and settings.vad_threshold > 0:
             vad_processor = await get_vad_processor()
-            vad_result = await vad_processor.process(audio_data.tolist())
+            vad_result = await vad_processor.process(audio_data)
             has_speech = vad_result.is_speaking
         
-        return {
+        return ORJSONResponse({
             "filename": filename,
             "format": format_ext,
             "file_size": len(content),
             "has_speech": has_speech,
-            "rms": float(rms),
+            "rms": rms,
             "duration": len(audio_data) / sample_rate,
             "processing_time_ms": int((time.time() - start_time) * 1000),
-        }
+        })
         
     except Exception as e:
         logger.error(f"快速 VAD 文件检测失败: {e}")
@@ -666,26 +645,25 @@ async def batch_process_audio(
     适用于一次上传多个音频片段
     """
     start_time = time.time()
-    results = []
-    all_valid_audio = []
     
     try:
-        vad_processor = await get_vad_processor() if enable_vad else None
+        vad_pool = await get_vad_pool() if enable_vad else None
         
-        for i, audio_file in enumerate(audio_files):
+        async def _process_one(i: int, audio_file: UploadFile) -> tuple[Dict[str, Any], Optional[np.ndarray]]:
+            """处理单个文件，返回 (结果, 有效音频)"""
             # 读取文件
-            content = await audio_file.read()
+            content = await read_into_buffer(audio_file)
             
             # 检测格式
             format = audio_file.filename.split('.')[-1].lower()
             
-            # 转换为 Base64
-            audio_base64 = base64.b64encode(content).decode('utf-8')
-            
             # 处理单个文件
+            valid_audio = None
             try:
-                # 转换音频
-                audio_data, sample_rate = AudioConverter.base64_to_audio(audio_base64, format)
+                # 转换音频（在线程中执行，soundfile/ffmpeg/numpy 会释放 GIL）
+                audio_data, sample_rate = await asyncio.to_thread(
+                    AudioConverter.bytes_to_audio, content, format
+                )
                 
                 result = {
                     "index": i,
@@ -693,15 +671,17 @@ async def batch_process_audio(
                     "duration": len(audio_data) / sample_rate,
                 }
                 
-                if enable_vad:
-                    # VAD 分析
-                    segments_result = await analyze_audio_with_vad(
-                        audio_data,
-                        sample_rate,
-                        0.5,
-                        0.1,
-                        vad_processor
-                    )
+                if vad_pool is not None:
+                    # VAD 分析：从池中借出独立的处理器，在线程中执行
+                    async with vad_pool.acquire() as vad_processor:
+                        segments_result = await asyncio.to_thread(
+                            _analyze_audio_with_vad_sync,
+                            audio_data,
+                            sample_rate,
+                            0.5,
+                            0.1,
+                            vad_processor,
+                        )
                     
                     result["speech_segments"] = segments_result['speech_segments']
                     result["has_speech"] = len(segments_result['speech_segments']) > 0
@@ -713,10 +693,9 @@ async def batch_process_audio(
                             segments_result['speech_segments'],
                             sample_rate
                         )
-                        all_valid_audio.append(valid_audio)
                 else:
                     result["has_speech"] = True
-                    all_valid_audio.append(audio_data)
+                    valid_audio = audio_data
                 
                 result["success"] = True
                 
@@ -728,7 +707,30 @@ async def batch_process_audio(
                     "error": str(e),
                 }
             
+            return result, valid_audio
+        
+        # 并发处理所有文件，结果保持上传顺序
+        outcomes = await asyncio.gather(
+            *(_process_one(i, audio_file) for i, audio_file in enumerate(audio_files)),
+            return_exceptions=True,
+        )
+        
+        results = []
+        all_valid_audio = []
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                results.append({
+                    "index": i,
+                    "filename": audio_files[i].filename,
+                    "success": False,
+                    "error": str(outcome),
+                })
+                continue
+            
+            result, valid_audio = outcome
             results.append(result)
+            if valid_audio is not None:
+                all_valid_audio.append(valid_audio)
         
         # 准备响应
         response = {
@@ -753,10 +755,10 @@ async def batch_process_audio(
                 "audio_base64": merged_base64,
                 "format": "wav",
                 "duration": len(merged_audio) / 16000,
-                "size_bytes": len(base64.b64decode(merged_base64)),
+                "size_bytes": _b64_decoded_size(merged_base64),
             }
         
-        return response
+        return ORJSONResponse(response)
         
     except Exception as e:
         logger.exception("批量处理失败")
@@ -765,7 +767,49 @@ async def batch_process_audio(
 
 # 辅助函数
 
-async def analyze_audio_with_vad(
+def _vad_energy_scan(
+    audio_data: np.ndarray,
+    window_size: int,
+    hop_size: int,
+    threshold: float,
+) -> np.ndarray:
+    """
+    向量化的滑动窗口能量 VAD
+    
+    判定规则与 VADProcessor._process_with_simple_vad 一致，
+    返回形状为 (N, 2) 的语音段 (起始样本, 结束样本)
+    """
+    hop_size = max(hop_size, 1)
+    num_windows = (len(audio_data) - window_size) // hop_size + 1
+    if window_size <= 0 or num_windows <= 0:
+        return np.empty((0, 2), dtype=np.int64)
+    
+    # 每个窗口的 RMS 与峰值（与流式 VAD 共用 O(n) 实现，不复制窗口）
+    rms, peak = VADSession.sliding_energy(audio_data, window_size, hop_size)
+    
+    effective_threshold = np.where(peak > 0.01, 0.001, threshold)
+    is_speaking = (rms > effective_threshold) | (peak > 0.005)
+    
+    return _speech_bounds(is_speaking, hop_size, len(audio_data))
+
+
+def _speech_bounds(is_speaking: np.ndarray, hop_size: int, total_samples: int) -> np.ndarray:
+    """
+    根据每个窗口的语音判定求语音段
+    
+    返回形状为 (N, 2) 的语音段 (起始样本, 结束样本)，
+    音频结束时仍在说话则以音频末尾作为结束
+    """
+    # 状态切换位置: +1 为语音开始，-1 为语音结束
+    edges = np.diff(np.concatenate(([0], is_speaking.astype(np.int8), [0])))
+    seg_start = np.flatnonzero(edges == 1) * hop_size
+    end_index = np.flatnonzero(edges == -1)
+    seg_end = np.where(end_index < len(is_speaking), end_index * hop_size, total_samples)
+    
+    return np.stack([seg_start, seg_end], axis=1)
+
+
+def _analyze_audio_with_vad_sync(
     audio_data: np.ndarray,
     sample_rate: int,
     window_duration: float,
@@ -773,7 +817,7 @@ async def analyze_audio_with_vad(
     vad_processor: VADProcessor
 ) -> Dict[str, Any]:
     """
-    使用 VAD 分析音频数据
+    使用 VAD 分析音频数据（同步版本，可在线程中执行）
     
     返回语音段信息
     """
@@ -784,43 +828,31 @@ async def analyze_audio_with_vad(
     # 重置 VAD 状态
     vad_processor.reset()
     
-    # 分析音频
-    speech_segments = []
-    current_speech_start = None
-    position = 0
+    if not vad_processor.use_real_vad:
+        # 简单能量 VAD：一次向量化扫描全部窗口，无需逐窗口调用 process()
+        bounds = _vad_energy_scan(audio_data, window_size, hop_size, vad_processor.threshold)
+    elif hop_size > 0 and 0 < window_size <= len(audio_data):
+        # TEN-VAD：一次切出全部窗口批量检测（能量低于预筛阈值的窗口直接判为静音），
+        # 再由状态切换位置求语音段
+        windows = np.lib.stride_tricks.sliding_window_view(audio_data, window_size)[::hop_size]
+        rms, max_amplitude = vad_processor.sliding_energy(audio_data, window_size, hop_size)
+        results = vad_processor.process_batch_sync(
+            windows, rms=rms, max_amplitude=max_amplitude,
+            prescreen_floor=settings.vad_prescreen_floor,
+        )
+        is_speaking = np.fromiter((r.is_speaking for r in results), dtype=bool, count=len(results))
+        bounds = _speech_bounds(is_speaking, hop_size, len(audio_data))
+    else:
+        bounds = np.empty((0, 2), dtype=np.int64)
     
-    while position + window_size <= len(audio_data):
-        # 提取窗口
-        window = audio_data[position:position + window_size]
-        
-        # VAD 检测
-        result = await vad_processor.process(window.tolist())
-        
-        # 记录语音段
-        timestamp = position / sample_rate
-        
-        if result.is_speaking and current_speech_start is None:
-            # 语音开始
-            current_speech_start = timestamp
-            
-        elif not result.is_speaking and current_speech_start is not None:
-            # 语音结束
-            speech_segments.append({
-                "start": round(current_speech_start, 2),
-                "end": round(timestamp, 2),
-                "duration": round(timestamp - current_speech_start, 2),
-            })
-            current_speech_start = None
-        
-        position += hop_size
-    
-    # 处理最后一个语音段
-    if current_speech_start is not None:
-        end_time = len(audio_data) / sample_rate
+    speech_segments = []
+    for start_sample, end_sample in bounds.tolist():
+        start = start_sample / sample_rate
+        end = end_sample / sample_rate
         speech_segments.append({
-            "start": round(current_speech_start, 2),
-            "end": round(end_time, 2),
-            "duration": round(end_time - current_speech_start, 2),
+            "start": round(start, 2),
+            "end": round(end, 2),
+            "duration": round(end - start, 2),
         })
     
     return {
@@ -829,6 +861,23 @@ async def analyze_audio_with_vad(
     }
 
 
+async def analyze_audio_with_vad(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    window_duration: float,
+    overlap: float,
+    vad_processor: VADProcessor
+) -> Dict[str, Any]:
+    """
+    使用 VAD 分析音频数据（在事件循环中直接执行）
+    
+    返回语音段信息
+    """
+    return _analyze_audio_with_vad_sync(
+        audio_data, sample_rate, window_duration, overlap, vad_processor
+    )
+
+
 def extract_segments(
     audio_data: np.ndarray,
     segments: List[Dict[str, float]],
@@ -845,28 +894,33 @@ def extract_segments(
     返回:
         合并后的有效音频
     """
-    valid_chunks = []
-    
+    # 先计算有效的样本区间，确保索引有效
+    ranges = []
     for segment in segments:
-        start_sample = int(segment['start'] * sample_rate)
-        end_sample = int(segment['end'] * sample_rate)
-        
-        # 确保索引有效
-        start_sample = max(0, start_sample)
-        end_sample = min(len(audio_data), end_sample)
+        start_sample = max(0, int(segment['start'] * sample_rate))
+        end_sample = min(len(audio_data), int(segment['end'] * sample_rate))
         
         if start_sample < end_sample:
-            chunk = audio_data[start_sample:end_sample]
-            valid_chunks.append(chunk)
+            ranges.append((start_sample, end_sample))
     
-    if valid_chunks:
-        return np.concatenate(valid_chunks)
-    else:
-        return np.array([], dtype=np.float32)
+    # 一次性分配输出数组，逐段写入
+    valid_audio = np.empty(sum(end - start for start, end in ranges), dtype=np.float32)
+    position = 0
+    for start_sample, end_sample in ranges:
+        length = end_sample - start_sample
+        valid_audio[position:position + length] = audio_data[start_sample:end_sample]
+        position += length
+    
+    return valid_audio
 
 
-@router.post("/mobile/process-audio-file", response_model=MobileAudioResponse)
+@router.post(
+    "/mobile/process-audio-file",
+    response_model=MobileAudioResponse,
+    responses=_MSGPACK_RESPONSES,
+)
 async def process_mobile_audio_file(
+    http_request: Request,
     audio: UploadFile = File(..., description="音频文件"),
     sample_rate: int = Form(16000, description="采样率"),
     enable_vad: bool = Form(True, description="是否启用 VAD 检测"),
@@ -886,15 +940,12 @@ async def process_mobile_audio_file(
     
     try:
         # 读取上传的文件
-        content = await audio.read()
+        content = await read_into_buffer(audio)
         
         # 获取文件格式
         filename = audio.filename or "audio"
         format_ext = filename.split('.')[-1].lower() if '.' in filename else 'wav'
         
-        # 转换为 Base64
-        audio_base64 = base64.b64encode(content).decode('utf-8')
-        
         logger.info(
             "移动端音频文件处理请求",
             filename=filename,
@@ -904,9 +955,9 @@ async def process_mobile_audio_file(
             enable_vad=enable_vad,
         )
         
-        # 创建请求对象
+        # 创建请求对象（音频以原始字节传入，不再经过 Base64）
         request = MobileAudioRequest(
-            audio_base64=audio_base64,
+            audio_base64="",
             format=format_ext,
             sample_rate=sample_rate,
             enable_vad=enable_vad,
@@ -917,7 +968,9 @@ async def process_mobile_audio_file(
         )
         
         # 调用主处理函数
-        return await process_mobile_audio(request)
+        return await _process_mobile_audio(
+            request, content, msgpack_response=_accepts_msgpack(http_request)
+        )
         
     except Exception as e:
         logger.exception("处理音频文件失败")
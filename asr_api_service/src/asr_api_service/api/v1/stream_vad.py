@@ -1,232 +1,350 @@
 """流式VAD处理接口 - WebSocket版本"""
 
 import asyncio
-import json
+import struct
 import time
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+import msgpack
+import orjson
 import structlog
 import numpy as np
 
-from asr_api_service.core.audio.vad import VADProcessor
+try:
+    # SIMD 加速的 base64 解码，未安装时回退到标准库
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+from asr_api_service.api.responses import ttl_cached_json
+from asr_api_service.core.audio.buffer import FloatRing
+from asr_api_service.core.audio.vad import VADModel, VADSession
 from asr_api_service.config import settings
 
 router = APIRouter()
 logger = structlog.get_logger(__name__)
 
-# 全局VAD处理器
-_vad_processor: Optional[VADProcessor] = None
+# 全局VAD模型（所有连接共享，每个连接各自创建 VADSession）
+_vad_model: Optional[VADModel] = None
+
 
-async def get_vad_processor() -> VADProcessor:
-    """获取VAD处理器实例"""
-    global _vad_processor
-    if _vad_processor is None:
-        _vad_processor = VADProcessor(
+async def get_vad_model() -> VADModel:
+    """获取共享的VAD模型实例"""
+    global _vad_model
+    if _vad_model is None:
+        _vad_model = VADModel(
             threshold=settings.vad_threshold,
             silence_duration=settings.vad_silence_duration,
             hop_size=settings.vad_hop_size,
+            silence_shortcut=settings.vad_silence_shortcut,
+            batch_size=settings.vad_batch_size,
+        )
+    return _vad_model
+
+
+# ?fmt=bin 时的二进制VAD结果: is_speaking, probability, rms, processing_time_ms（16 字节）
+VAD_RESULT_STRUCT = struct.Struct("<?3xfff")
+
+# 处理耗时采样间隔：第 1 帧及此后每 16 帧计时一次，其余帧不计时
+TIMING_SAMPLE_INTERVAL = 16
+
+# 消息解析错误（JSON 与 MessagePack）
+_DECODE_ERRORS = (
+    orjson.JSONDecodeError,
+    msgpack.UnpackValueError,
+    msgpack.ExtraData,
+    msgpack.FormatError,
+    msgpack.StackError,
+)
+
+
+def _decode_message(raw: Union[bytes, str], use_msgpack: bool) -> Dict[str, Any]:
+    """解析一条控制消息（MessagePack 二进制帧或 JSON 文本帧）"""
+    if use_msgpack:
+        return msgpack.unpackb(raw, raw=False)
+    return orjson.loads(raw)
+
+
+async def _receive_message(websocket: WebSocket, use_msgpack: bool) -> Dict[str, Any]:
+    """接收一条控制消息（MessagePack 二进制帧或 JSON 文本帧）"""
+    if use_msgpack:
+        return _decode_message(await websocket.receive_bytes(), use_msgpack)
+    return _decode_message(await websocket.receive_text(), use_msgpack)
+
+
+async def _send_message(websocket: WebSocket, payload: Dict[str, Any], use_msgpack: bool) -> None:
+    """发送一条消息（MessagePack 二进制帧或 JSON 文本帧）"""
+    if use_msgpack:
+        await websocket.send_bytes(msgpack.packb(payload, use_bin_type=True))
+    else:
+        await websocket.send_text(
+            orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
         )
-    return _vad_processor
 
 
 @router.websocket("/stream/vad")
-async def stream_vad_processing(websocket: WebSocket):
+async def stream_vad_processing(
+    websocket: WebSocket,
+    fmt: str = Query("msgpack", description="消息格式: msgpack, json"),
+    sample_rate: int = Query(16000, gt=0, description="采样率"),
+    window_size: int = Query(1024, gt=0, description="VAD 窗口大小（样本数）"),
+    channels: int = Query(1, gt=0, description="声道数"),
+):
     """
     流式VAD处理WebSocket接口
     
+    默认使用 MessagePack 二进制帧；?fmt=json 时使用 JSON 文本帧（兼容旧客户端）
+    
+    音频参数通过查询字符串传入（如 ?sample_rate=16000&window_size=1024），
+    连接后即可直接发送音频，无需配置消息
+    
     消息格式:
-    - 配置: {"type": "config", "sample_rate": 16000, "channels": 1}
-    - 音频: {"type": "audio", "data": [float_array]}
+    - 配置（可选，兼容旧客户端）: {"type": "config", "sample_rate": 16000, "channels": 1}
+    - 音频: {"type": "audio", "data": bin}（float32 小端原始字节）
+      JSON 模式: {"type": "audio", "data_b64": str}（Base64 编码的 float32 小端字节）
     - 结束: {"type": "end"}
     
     返回格式:
     - VAD结果: {"type": "vad", "is_speaking": bool, "probability": float}
+    - 批量VAD结果: {"type": "vad_batch", "results": [VAD结果, ...]}（一条音频消息产生多个窗口时）
     - 状态: {"type": "status", "message": str}
     - 错误: {"type": "error", "message": str}
     """
+    use_msgpack = fmt != "json"
     await websocket.accept()
-    logger.info("WebSocket VAD连接建立")
+    logger.info("WebSocket VAD连接建立", fmt="msgpack" if use_msgpack else "json")
     
-    vad_processor = await get_vad_processor()
-    sample_rate = 16000
-    channels = 1
-    buffer = []
+    # 每个连接独立的VAD状态，连接结束后随之丢弃
+    vad_session = VADSession(await get_vad_model())
+    buffer = FloatRing(window_size * 4)
+    hop_size = max(1, window_size // 2)
     process_count = 0
     
     try:
-        while True:
-            # 接收消息
-            message = await websocket.receive_text()
-            data = json.loads(message)
+        # 连接断开时迭代器正常结束
+        messages = websocket.iter_bytes() if use_msgpack else websocket.iter_text()
+        async for raw in messages:
+            data = _decode_message(raw, use_msgpack)
             
             if data["type"] == "config":
-                # 配置参数
-                sample_rate = data.get("sample_rate", 16000)
-                channels = data.get("channels", 1)
+                # 配置参数（旧协议，新客户端使用查询参数）
+                sample_rate = data.get("sample_rate", sample_rate)
+                channels = data.get("channels", channels)
                 
-                await websocket.send_text(json.dumps({
+                await _send_message(websocket, {
                     "type": "status",
                     "message": f"配置成功: {sample_rate}Hz, {channels}声道",
-                    "use_real_vad": vad_processor.use_real_vad
-                }))
+                    "use_real_vad": vad_session.use_real_vad
+                }, use_msgpack)
                 
             elif data["type"] == "audio":
                 # 处理音频数据
-                start_time = time.time()
-                audio_chunk = data["data"]
+                if use_msgpack:
+                    # bin 字段直接映射为 float32 数组，无需逐个解析浮点数
+                    audio_chunk = np.frombuffer(data["data"], dtype='<f4')
+                elif "data_b64" not in data:
+                    # 旧客户端的浮点数列表（"data"）已不再支持
+                    await _send_message(websocket, {
+                        "type": "error",
+                        "message": "JSON 模式不再接受浮点数列表，"
+                                   "请使用 data_b64 字段（Base64 编码的 float32 小端字节）"
+                    }, use_msgpack)
+                    continue
+                else:
+                    audio_chunk = np.frombuffer(b64decode(data["data_b64"]), dtype='<f4')
                 
                 # 累积音频缓冲区
-                buffer.extend(audio_chunk)
+                buffer.write(audio_chunk)
                 
-                # 当缓冲区足够大时处理
-                window_size = 1024  # 可配置
-                if len(buffer) >= window_size:
-                    # 提取处理窗口
-                    process_data = buffer[:window_size]
-                    buffer = buffer[window_size//2:]  # 50%重叠
-                    
-                    # VAD处理
-                    result = await vad_processor.process(process_data)
-                    process_time = (time.time() - start_time) * 1000
-                    process_count += 1
-                    
-                    # 发送结果
-                    await websocket.send_text(json.dumps({
+                # 一次取出所有就绪窗口（50%重叠，跨步视图，不复制）并批量处理
+                windows = buffer.ready_windows(window_size, hop_size)
+                first_frame = process_count + 1
+                process_count += len(windows)
+                
+                # 批次中包含采样帧时计时，记录为该批次每个窗口的平均耗时
+                timed_frame = first_frame + (1 - first_frame) % TIMING_SAMPLE_INTERVAL
+                include_timing = timed_frame <= process_count
+                if include_timing:
+                    t0 = time.perf_counter_ns()
+                
+                # VAD处理
+                batch_results = await vad_session.process_batch(windows)
+                
+                results = []
+                for frame_count, result in enumerate(batch_results, first_frame):
+                    vad_message = {
                         "type": "vad",
                         "is_speaking": result.is_speaking,
-                        "probability": round(result.probability, 3),
+                        "probability": result.probability,
                         "current_state": result.current_state,
                         "state_changed": result.state_changed,
-                        "rms": round(result.rms, 4),
-                        "processing_time_ms": round(process_time, 1),
-                        "frame_count": process_count
-                    }))
+                        "rms": result.rms,
+                        "frame_count": frame_count
+                    }
+                    if include_timing and frame_count == timed_frame:
+                        vad_message["processing_time_ms"] = (
+                            (time.perf_counter_ns() - t0) / 1e6 / len(batch_results)
+                        )
+                    results.append(vad_message)
+                
+                # 发送结果：多个窗口的结果合并为一条消息
+                if len(results) == 1:
+                    await _send_message(websocket, results[0], use_msgpack)
+                elif results:
+                    await _send_message(websocket, {
+                        "type": "vad_batch",
+                        "results": results
+                    }, use_msgpack)
                     
             elif data["type"] == "end":
                 # 处理剩余缓冲区
-                if buffer:
-                    result = await vad_processor.process(buffer)
-                    await websocket.send_text(json.dumps({
+                if len(buffer) > 0:
+                    result = await vad_session.process(buffer.read_all())
+                    await _send_message(websocket, {
                         "type": "vad",
                         "is_speaking": result.is_speaking,
-                        "probability": round(result.probability, 3),
+                        "probability": result.probability,
                         "final": True
-                    }))
+                    }, use_msgpack)
                 
                 # 发送完成状态
-                await websocket.send_text(json.dumps({
+                await _send_message(websocket, {
                     "type": "status",
                     "message": f"处理完成，共处理 {process_count} 帧",
                     "total_frames": process_count
-                }))
+                }, use_msgpack)
                 break
                 
             else:
-                await websocket.send_text(json.dumps({
+                await _send_message(websocket, {
                     "type": "error",
                     "message": f"未知消息类型: {data['type']}"
-                }))
+                }, use_msgpack)
+        else:
+            logger.info("WebSocket VAD连接断开")
                 
     except WebSocketDisconnect:
         logger.info("WebSocket VAD连接断开")
-    except json.JSONDecodeError as e:
-        await websocket.send_text(json.dumps({
+    except _DECODE_ERRORS as e:
+        await _send_message(websocket, {
             "type": "error",
-            "message": f"JSON解析错误: {str(e)}"
-        }))
+            "message": f"消息解析错误: {str(e)}"
+        }, use_msgpack)
     except Exception as e:
         logger.exception("WebSocket VAD处理错误")
-        await websocket.send_text(json.dumps({
+        await _send_message(websocket, {
             "type": "error", 
             "message": f"处理错误: {str(e)}"
-        }))
-    finally:
-        # 重置VAD状态
-        vad_processor.reset()
-        logger.info("VAD处理器状态已重置")
+        }, use_msgpack)
 
 
 @router.websocket("/stream/vad-binary")
-async def stream_vad_binary(websocket: WebSocket):
+async def stream_vad_binary(
+    websocket: WebSocket,
+    fmt: str = Query("msgpack", description="消息格式: msgpack, json, bin"),
+    sample_rate: Optional[int] = Query(None, gt=0, description="采样率"),
+    window_size: Optional[int] = Query(None, gt=0, description="窗口大小（样本数）"),
+):
     """
     二进制流式VAD处理 - 更高效的版本
     
-    协议:
-    1. 文本配置消息: {"sample_rate": 16000, "window_size": 1024}
+    协议（控制消息默认 MessagePack，?fmt=json 时为 JSON 文本）:
+    1. 配置消息: {"sample_rate": 16000, "window_size": 1024}
+       URL 带有 sample_rate 或 window_size 查询参数时跳过配置消息，
+       服务器连接后立即返回 ready，客户端无需等待即可发送音频
     2. 二进制音频数据: float32数组的bytes
-    3. 文本结果: {"is_speaking": bool, "probability": float}
+    3. 结果: {"is_speaking": bool, "probability": float}
+       ?fmt=bin 时结果为 16 字节二进制帧 struct "<?3xfff"
+       (is_speaking, probability, rms, processing_time_ms)，控制消息仍为 MessagePack
     """
+    use_msgpack = fmt != "json"
+    packed_results = fmt == "bin"
     await websocket.accept()
-    logger.info("二进制WebSocket VAD连接建立")
+    logger.info("二进制WebSocket VAD连接建立", fmt=fmt if fmt in ("json", "bin") else "msgpack")
     
-    vad_processor = await get_vad_processor()
-    sample_rate = 16000
-    window_size = 1024
-    configured = False
+    vad_session = VADSession(await get_vad_model())
+    process_count = 0
     
     try:
-        while True:
-            if not configured:
-                # 等待配置消息
-                config_message = await websocket.receive_text()
-                config = json.loads(config_message)
-                sample_rate = config.get("sample_rate", 16000)
-                window_size = config.get("window_size", 1024)
-                configured = True
-                
-                await websocket.send_text(json.dumps({
-                    "type": "ready",
-                    "sample_rate": sample_rate,
-                    "window_size": window_size,
-                    "use_real_vad": vad_processor.use_real_vad
-                }))
-                continue
-            
-            # 接收二进制音频数据
-            audio_bytes = await websocket.receive_bytes()
-            
+        rate: int
+        size: int
+        if sample_rate is None and window_size is None:
+            # 旧协议：等待配置消息
+            config = await _receive_message(websocket, use_msgpack)
+            rate = config.get("sample_rate", 16000)
+            size = config.get("window_size", 1024)
+        else:
+            rate = sample_rate or 16000
+            size = window_size or 1024
+        
+        await _send_message(websocket, {
+            "type": "ready",
+            "sample_rate": rate,
+            "window_size": size,
+            "use_real_vad": vad_session.use_real_vad
+        }, use_msgpack)
+        
+        # 接收二进制音频数据（连接断开时迭代器正常结束）
+        async for audio_bytes in websocket.iter_bytes():
             if len(audio_bytes) == 0:  # 结束信号
                 break
                 
             # 解析float32数据
             audio_array = np.frombuffer(audio_bytes, dtype=np.float32)
             
-            # VAD处理
-            start_time = time.time()
-            result = await vad_processor.process(audio_array.tolist())
-            process_time = (time.time() - start_time) * 1000
+            # VAD处理（按采样间隔计时）
+            process_count += 1
+            include_timing = process_count % TIMING_SAMPLE_INTERVAL == 1
+            if include_timing:
+                t0 = time.perf_counter_ns()
+            result = await vad_session.process(audio_array)
+            process_time = (time.perf_counter_ns() - t0) / 1e6 if include_timing else None
+            
+            # 发送结果
+            if packed_results:
+                # 未计时的帧 processing_time_ms 为 NaN
+                await websocket.send_bytes(VAD_RESULT_STRUCT.pack(
+                    result.is_speaking,
+                    result.probability,
+                    result.rms,
+                    float("nan") if process_time is None else process_time,
+                ))
+                continue
             
-            # 发送结果（文本格式，便于解析）
-            await websocket.send_text(json.dumps({
+            vad_message: Dict[str, Any] = {
                 "is_speaking": result.is_speaking,
-                "probability": round(result.probability, 3),
-                "rms": round(result.rms, 4),
-                "processing_time_ms": round(process_time, 1),
+                "probability": result.probability,
+                "rms": result.rms,
                 "samples": len(audio_array)
-            }))
+            }
+            if include_timing:
+                vad_message["processing_time_ms"] = process_time
+            await _send_message(websocket, vad_message, use_msgpack)
+        else:
+            logger.info("二进制WebSocket VAD连接断开")
             
     except WebSocketDisconnect:
         logger.info("二进制WebSocket VAD连接断开")
     except Exception as e:
         logger.exception("二进制WebSocket VAD处理错误")
-        await websocket.send_text(json.dumps({
+        await _send_message(websocket, {
             "type": "error",
             "message": str(e)
-        }))
-    finally:
-        vad_processor.reset()
+        }, use_msgpack)
 
 
 @router.get("/stream/status")
+@ttl_cached_json(ttl=2.0)
 async def stream_status():
     """获取流式处理状态"""
-    vad_processor = await get_vad_processor()
-    stats = vad_processor.get_stats()
+    vad_model = await get_vad_model()
     
     return {
         "status": "ready",
-        "vad_type": "TEN-VAD" if stats["use_real_vad"] else "Simple VAD",
+        "vad_type": "TEN-VAD" if vad_model.use_real_vad else "Simple VAD",
+        # 低于能量下限、未经VAD推理直接判定为静音的窗口数
+        "silence_shortcut_frames": vad_model.silence_shortcut_frames,
         "endpoints": {
             "websocket_json": "/api/v1/stream/vad",
             "websocket_binary": "/api/v1/stream/vad-binary"
@@ -235,10 +353,11 @@ async def stream_status():
             "sample_rate": 16000,
             "window_size": 1024,
             "channels": 1,
-            "format": "float32"
+            "format": "float32",
+            "message_format": "msgpack"
         },
         "performance": {
             "binary_mode": "最高性能，推荐实时场景",
-            "json_mode": "兼容性好，调试方便"
+            "json_mode": "兼容性好，调试方便（?fmt=json）"
         }
     }
\ No newline at end of file
@@ -1,12 +1,14 @@
 """Streaming ASR WebSocket endpoint."""
 
-import json
 import time
 from typing import Dict, Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
+import orjson
 import structlog
 
+from asr_api_service.api.responses import ttl_cached_json
 from asr_api_service.config import settings
 from asr_api_service.models.streaming import StreamingMessage
 from asr_api_service.core.streaming.manager import StreamingManager
@@ -27,7 +29,8 @@ async def streaming_websocket(websocket: WebSocket):
     
     Protocol:
     - Client connects and sends configuration
-    - Client streams audio data
+    - Client streams audio data, either as JSON "audio" messages or as
+      binary frames (``AUDIO_FRAME_HEADER`` + float32 PCM)
     - Server responds with transcription results and status updates
     - Client can send control commands (start, stop, reset)
     """
@@ -53,19 +56,26 @@ async def streaming_websocket(websocket: WebSocket):
         # Main message loop
         while True:
             try:
-                # Receive message from client
-                raw_message = await websocket.receive_text()
+                # Receive message from client (text JSON or binary audio frame)
+                raw = await websocket.receive()
+                if raw["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(raw.get("code", 1000))
+                
+                raw_message = raw.get("text")
                 
                 # Parse message
                 try:
-                    message_data = json.loads(raw_message)
-                    message = StreamingMessage(**message_data)
-                except (json.JSONDecodeError, ValueError) as e:
+                    if raw_message is None:
+                        message = StreamingMessage.from_audio_frame(raw["bytes"])
+                    else:
+                        message_data = orjson.loads(raw_message)
+                        message = StreamingMessage(**message_data)
+                except (orjson.JSONDecodeError, ValueError) as e:
                     logger.warning(
                         "Invalid message format",
                         client_id=client_id,
                         error=str(e),
-                        raw_message=raw_message[:200],  # Log first 200 chars
+                        raw_message=(raw_message or "<binary>")[:200],  # Log first 200 chars
                     )
                     await streaming_manager.send_error(
                         client_id,
@@ -167,26 +177,15 @@ async def streaming_control(client_id: str, command: Dict[str, Any]):
 @router.get("/active-clients")
 async def get_active_clients():
     """Get list of active streaming clients."""
-    clients = await streaming_manager.get_active_clients()
-    
-    return {
-        "clients": [
-            {
-                "client_id": client["client_id"],
-                "connected_at": client["connected_at"],
-                "last_activity": client["last_activity"],
-                "total_messages": client["total_messages"],
-                "current_status": client["current_status"],
-                "remote_address": client.get("remote_address"),
-            }
-            for client in clients
-        ],
-        "total_clients": len(clients),
-    }
+    return Response(
+        content=await streaming_manager.snapshot_bytes(),
+        media_type="application/json",
+    )
 
 
 # Health check for streaming service
 @router.get("/streaming-health")
+@ttl_cached_json(ttl=2.0, key=lambda: len(streaming_manager.clients) >= settings.streaming_max_clients)
 async def streaming_health_check():
     """Health check specific to streaming functionality."""
     health_info = {
@@ -1,23 +1,40 @@
 """Transcription API endpoints."""
 
+import asyncio
+import io
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, Depends
+from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile, Depends
+from fastapi.exceptions import RequestValidationError
+import msgpack
+import numpy as np
+from pydantic import ValidationError as PydanticValidationError
+import soundfile as sf
 import structlog
 
+from asr_api_service.api.responses import ttl_cached_json
 from asr_api_service.config import settings
+from asr_api_service.core.audio.converter import AudioConverter
 from asr_api_service.core.asr.whisper import WhisperASRProvider
 from asr_api_service.exceptions import ASRServiceError, ValidationError
-from asr_api_service.models.transcription import TranscriptionRequest, TranscriptionResponse
+from asr_api_service.models.transcription import RawTranscriptionRequest, TranscriptionResponse
 from asr_api_service.utils.validation import validate_audio_file, validate_audio_data
 
 router = APIRouter()
 logger = structlog.get_logger(__name__)
 
+# Upload formats decoded by libsndfile; the rest go through ffmpeg
+_SOUNDFILE_FORMATS = frozenset({"wav", "flac", "ogg"})
 
-async def get_asr_provider() -> WhisperASRProvider:
+# Shared ASR provider (requests go through the shared HTTP connection pool)
+_asr_provider: Optional[WhisperASRProvider] = None
+
+
+async def get_asr_provider(request: Request) -> WhisperASRProvider:
     """Get configured ASR provider."""
+    global _asr_provider
     api_key = settings.get_asr_api_key()
     if not api_key:
         raise HTTPException(
@@ -25,19 +42,31 @@ async def get_asr_provider() -> WhisperASRProvider:
             detail="ASR API key not configured"
         )
     
-    return WhisperASRProvider(
-        api_key=api_key,
-        api_url=settings.get_asr_api_url(),
-        model=settings.get_asr_model(),
-        timeout=30.0,
-    )
+    # Client opened by the application lifespan (absent if it did not run)
+    http_client = getattr(request.app.state, "whisper_client", None)
+    
+    # Rebuild if the provider settings changed since it was created
+    if _asr_provider is None or (
+        _asr_provider.api_key,
+        _asr_provider.api_url,
+        _asr_provider.model,
+        _asr_provider.http_client,
+    ) != (api_key, settings.get_asr_api_url(), settings.get_asr_model(), http_client):
+        _asr_provider = WhisperASRProvider(
+            api_key=api_key,
+            api_url=settings.get_asr_api_url(),
+            model=settings.get_asr_model(),
+            timeout=30.0,
+            http_client=http_client,
+        )
+    return _asr_provider
 
 
 @router.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
     audio: UploadFile = File(..., description="Audio file to transcribe"),
-    prompt: str = Form("", description="Optional prompt to guide transcription"),
-    language: Optional[str] = Form(None, description="Target language code"),
+    prompt: str = Form("", max_length=1000, description="Optional prompt to guide transcription"),
+    language: Optional[str] = Form(None, pattern=r"^[a-z]{2}$", description="Target language code"),
     enable_llm: bool = Form(False, description="Enable LLM-based text correction"),
     asr_provider: WhisperASRProvider = Depends(get_asr_provider),
 ):
@@ -59,68 +88,188 @@ async def transcribe_audio(
             enable_llm=enable_llm,
         )
         
-        # Read audio file
+        # Read and decode audio file (CPU-bound, off the event loop)
         audio_content = await audio.read()
-        
-        # For now, we'll need to convert the audio file to the expected format
-        # In a full implementation, you'd use a library like librosa or pydub
-        # to decode various audio formats to raw PCM data
-        
-        # This is a simplified implementation that assumes the audio is already
-        # in the correct format or can be processed by the ASR provider directly
-        
-        # TODO: Implement proper audio file decoding
-        # For now, we'll raise an error for non-WAV files
-        if not audio.filename.lower().endswith('.wav'):
-            raise HTTPException(
-                status_code=400,
-                detail="Only WAV files are currently supported. Full format support coming soon."
-            )
-        
-        # For WAV files, we'd need to extract the audio data
-        # This is a placeholder - you'd implement proper WAV parsing
-        # or use a library like scipy.io.wavfile.read()
-        
-        raise HTTPException(
-            status_code=501,
-            detail="Audio file transcription not yet implemented. Use streaming API for now."
+        audio_data, sample_rate = await asyncio.to_thread(
+            _decode_audio_file, audio_content, Path(audio.filename or "").suffix
         )
         
     except ValidationError as e:
         logger.warning("Validation error", error=e.message)
         raise HTTPException(status_code=400, detail=e.message)
     
-    except ASRServiceError as e:
-        logger.error("ASR service error", error=e.message, error_code=e.error_code)
-        raise HTTPException(status_code=500, detail=e.message)
-    
-    except Exception as e:
-        logger.exception("Unexpected error during transcription")
+    except Exception:
+        logger.exception("Unexpected error while decoding audio file")
         raise HTTPException(status_code=500, detail="Internal server error")
+    
+    return await _transcribe_samples(
+        audio_data,
+        RawTranscriptionRequest(
+            sample_rate=sample_rate,
+            prompt=prompt,
+            language=language,
+            enable_llm=enable_llm,
+        ),
+        asr_provider,
+        start_time,
+    )
 
 
-@router.post("/transcribe-raw", response_model=TranscriptionResponse)
+def _decode_audio_file(content: bytes, suffix: str) -> Tuple[np.ndarray, int]:
+    """Decode an uploaded audio file to mono float32 samples.
+    
+    Args:
+        content: Encoded audio file
+        suffix: File extension, used to pick the decoder
+        
+    Returns:
+        Tuple of (samples, sample_rate)
+        
+    Raises:
+        ValidationError: If the file cannot be decoded
+    """
+    audio_format = suffix.lstrip(".").lower()
+    try:
+        if audio_format in _SOUNDFILE_FORMATS:
+            audio_data, sample_rate = sf.read(
+                io.BytesIO(content), dtype="float32", always_2d=False
+            )
+            if audio_data.ndim > 1:
+                audio_data = audio_data.mean(axis=1, dtype=np.float32)
+            return audio_data, sample_rate
+        
+        # MP3, MP4, M4A and AAC are piped through ffmpeg
+        return AudioConverter.bytes_to_audio(content, audio_format)
+    except (sf.LibsndfileError, ValueError) as e:
+        raise ValidationError(
+            f"Could not decode audio file: {str(e)}",
+            field="audio",
+            value=audio_format,
+        )
+
+
+@router.post(
+    "/transcribe-raw",
+    response_model=TranscriptionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"},
+                },
+            },
+        },
+    },
+)
 async def transcribe_raw_audio(
-    request: TranscriptionRequest,
-    audio_data: list[float],
-    sample_rate: int = 16000,
+    http_request: Request,
+    sample_rate: int = Query(16000, gt=0, description="Audio sample rate"),
+    prompt: str = Query("", max_length=1000, description="Optional prompt to guide transcription"),
+    language: Optional[str] = Query(None, pattern=r"^[a-z]{2}$", description="Target language code"),
+    enable_llm: bool = Query(False, description="Enable LLM-based text correction"),
     asr_provider: WhisperASRProvider = Depends(get_asr_provider),
 ):
-    """Transcribe raw audio data provided as JSON.
+    """Transcribe raw audio samples.
     
-    This endpoint accepts raw audio samples directly, which is useful
-    for applications that have already processed audio into float arrays.
+    The request body is the audio as little-endian float32 PCM bytes
+    (``application/octet-stream``), which is useful for applications that
+    have already processed audio into float arrays.
     """
-    start_time = time.time()
+    return await _transcribe_pcm(
+        await http_request.body(),
+        RawTranscriptionRequest(
+            sample_rate=sample_rate,
+            prompt=prompt,
+            language=language,
+            enable_llm=enable_llm,
+        ),
+        asr_provider,
+    )
+
+
+@router.post(
+    "/transcribe-raw-msgpack",
+    response_model=TranscriptionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/msgpack": {
+                    "schema": {"type": "string", "format": "binary"},
+                },
+            },
+        },
+    },
+)
+async def transcribe_raw_audio_msgpack(
+    http_request: Request,
+    asr_provider: WhisperASRProvider = Depends(get_asr_provider),
+):
+    """Transcribe raw audio samples sent as MessagePack.
     
+    The request body is a MessagePack map with the ``/transcribe-raw`` options
+    (``sample_rate``, ``prompt``, ``language``, ``enable_llm``) and
+    ``audio_bin``, the audio as little-endian float32 PCM bytes.
+    """
     try:
-        logger.info(
-            "Raw audio transcription request",
-            audio_length=len(audio_data),
-            sample_rate=sample_rate,
-            enable_llm=request.enable_llm,
+        payload = msgpack.unpackb(await http_request.body(), raw=False)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid MessagePack body")
+    
+    if not isinstance(payload, dict) or not isinstance(payload.get("audio_bin"), bytes):
+        raise HTTPException(
+            status_code=400,
+            detail="MessagePack body must be a map with an 'audio_bin' binary field",
         )
-        
+    
+    audio_bytes = payload.pop("audio_bin")
+    try:
+        options = RawTranscriptionRequest(**payload)
+    except PydanticValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    
+    return await _transcribe_pcm(audio_bytes, options, asr_provider)
+
+
+async def _transcribe_pcm(
+    audio_bytes: bytes,
+    options: RawTranscriptionRequest,
+    asr_provider: WhisperASRProvider,
+) -> TranscriptionResponse:
+    """Validate and transcribe little-endian float32 PCM bytes."""
+    start_time = time.time()
+    
+    if len(audio_bytes) % 4:
+        logger.warning("Validation error", error="Audio body length is not a multiple of 4")
+        raise HTTPException(
+            status_code=400,
+            detail="Audio body length must be a multiple of 4 bytes (float32 samples)",
+        )
+    audio_data = np.frombuffer(audio_bytes, dtype='<f4')
+    
+    logger.info(
+        "Raw audio transcription request",
+        audio_length=len(audio_data),
+        sample_rate=options.sample_rate,
+        enable_llm=options.enable_llm,
+    )
+    
+    return await _transcribe_samples(audio_data, options, asr_provider, start_time)
+
+
+async def _transcribe_samples(
+    audio_data: np.ndarray,
+    options: RawTranscriptionRequest,
+    asr_provider: WhisperASRProvider,
+    start_time: float,
+) -> TranscriptionResponse:
+    """Validate and transcribe mono float32 samples."""
+    sample_rate = options.sample_rate
+    
+    try:
         # Validate audio data
         validation_result = validate_audio_data(
             audio_data, 
@@ -144,13 +293,13 @@ async def transcribe_raw_audio(
         asr_result = await asr_provider.transcribe(
             audio_data=audio_data,
             sample_rate=sample_rate,
-            prompt=request.prompt,
-            language=request.language,
+            prompt=options.prompt,
+            language=options.language,
         )
         
         # TODO: Implement LLM correction if enabled
         corrected_text = None
-        if request.enable_llm and asr_result.text:
+        if options.enable_llm and asr_result.text:
             logger.info("LLM correction requested but not yet implemented")
             # corrected_text = await llm_provider.correct(asr_result.text)
         
@@ -189,12 +338,13 @@ async def transcribe_raw_audio(
         logger.error("ASR service error", error=e.message, error_code=e.error_code)
         raise HTTPException(status_code=500, detail=e.message)
     
-    except Exception as e:
+    except Exception:
         logger.exception("Unexpected error during transcription")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/models")
+@ttl_cached_json(ttl=2.0, key=lambda: (settings.asr_provider, settings.get_asr_model()))
 async def list_models():
     """List available ASR models."""
     return {
@@ -1,48 +1,118 @@
 """VAD (Voice Activity Detection) API endpoints."""
 
+import asyncio
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Type, TypeVar, Union
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Body, HTTPException, Depends, Query
+from pydantic import BaseModel
 import structlog
 import numpy as np
 
+from asr_api_service.api.responses import ORJSONResponse
 from asr_api_service.config import settings
-from asr_api_service.core.audio.vad import VADProcessor, VADResult
+from asr_api_service.core.audio.vad import VADPool, VADProcessor, VADResult
 from asr_api_service.exceptions import VADError, ValidationError
-from asr_api_service.utils.validation import validate_audio_data
+from asr_api_service.models.vad import VADAnalyzeRequest, VADRequest, VADSegmentsRequest
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+RequestT = TypeVar("RequestT", bound=BaseModel)
 
-# 全局VAD处理器实例（可以根据需要改为依赖注入）
-_vad_processor = None
+# VAD计算在专用线程池中执行，避免长音频阻塞事件循环
+_vad_executor = ThreadPoolExecutor(max_workers=settings.vad_workers, thread_name_prefix="vad")
 
+# 全局VAD处理器池：每个请求借出一个独立的处理器（含各自的 TEN-VAD 引擎），
+# 请求之间互不共享状态，归还时自动重置
+_vad_pool: Optional[VADPool] = None
 
-async def get_vad_processor() -> VADProcessor:
-    """获取或创建VAD处理器实例"""
-    global _vad_processor
-    if _vad_processor is None:
-        _vad_processor = VADProcessor(
+
+async def get_vad_pool() -> VADPool:
+    """获取或创建VAD处理器池"""
+    global _vad_pool
+    if _vad_pool is None:
+        _vad_pool = VADPool(
+            settings.vad_workers,
             threshold=settings.vad_threshold,
             silence_duration=settings.vad_silence_duration,
             hop_size=settings.vad_hop_size,
+            batch_size=settings.vad_batch_size,
+        )
+    return _vad_pool
+
+
+async def get_vad_processor() -> AsyncIterator[VADProcessor]:
+    """从处理器池借出一个VAD处理器，请求结束后归还"""
+    pool = await get_vad_pool()
+    async with pool.acquire() as vad_processor:
+        yield vad_processor
+
+
+async def _run_in_executor(func: Callable[..., T], *args: Any) -> T:
+    """在VAD线程池中执行阻塞的计算"""
+    return await asyncio.get_running_loop().run_in_executor(_vad_executor, func, *args)
+
+
+def _check_legacy_input(is_legacy: bool) -> None:
+    """浮点数列表输入可通过配置关闭"""
+    if is_legacy and not settings.vad_accept_float_list:
+        raise ValidationError(
+            "已停用浮点数列表输入，请使用 Base64 编码的 PCM 音频（audio_b64 / segments_b64）"
         )
-    return _vad_processor
+
+
+def _decode_request_audio(request: VADRequest) -> np.ndarray:
+    """将请求中的音频解码为 float32 数组"""
+    _check_legacy_input(request.audio_data is not None)
+    try:
+        return request.to_array()
+    except ValueError as e:
+        raise ValidationError(str(e), field="audio_b64")
+
+
+def _resolve_request(
+    model: Type[RequestT],
+    body: Union[RequestT, List[Any]],
+    legacy_field: str,
+    **query: Any,
+) -> RequestT:
+    """合并请求体与旧版查询参数
+
+    旧接口的请求体是裸的浮点数数组，sample_rate 等参数放在查询字符串中。
+    裸数组按 legacy_field 包装成请求模型；查询参数只补充请求体未设置的字段，
+    与请求体取值冲突时报错，不会被静默忽略。
+    """
+    overrides = {name: value for name, value in query.items() if value is not None}
+    if isinstance(body, list):
+        return model(**{legacy_field: body}, **overrides)
+
+    conflicts = [
+        name for name, value in overrides.items()
+        if name in body.model_fields_set and getattr(body, name) != value
+    ]
+    if conflicts:
+        raise ValidationError(
+            f"查询参数与请求体中的取值冲突: {', '.join(conflicts)}",
+            field=conflicts[0],
+        )
+    return body.model_copy(update=overrides) if overrides else body
 
 
 @router.post("/vad/detect")
 async def detect_voice_activity(
-    audio_data: List[float],
-    sample_rate: int = 16000,
+    body: Union[VADRequest, List[float]] = Body(...),
+    sample_rate: Optional[int] = Query(None, gt=0, description="旧版参数：采样率"),
     vad_processor: VADProcessor = Depends(get_vad_processor),
 ):
     """检测音频中的语音活动
     
     参数:
-        audio_data: 音频样本数据（-1.0到1.0的浮点数列表）
-        sample_rate: 采样率（默认16000Hz）
+        request: audio_b64 为 Base64 编码的小端 PCM（encoding 为 pcm_s16le 或 float32，
+            默认 pcm_s16le）；兼容旧的 audio_data 浮点数列表；sample_rate 为采样率（默认16000Hz）。
+            也接受旧版的裸浮点数数组请求体，此时 sample_rate 通过查询参数传递
     
     返回:
         VAD检测结果，包含语音状态、概率、能量等信息
@@ -50,8 +120,12 @@ async def detect_voice_activity(
     start_time = time.time()
     
     try:
+        request = _resolve_request(VADRequest, body, "audio_data", sample_rate=sample_rate)
+        sample_rate = request.sample_rate
+        audio_data = _decode_request_audio(request)
+        
         # 验证音频数据
-        if not audio_data:
+        if len(audio_data) == 0:
             raise ValidationError("音频数据不能为空")
         
         if len(audio_data) < vad_processor.hop_size:
@@ -75,16 +149,16 @@ async def detect_voice_activity(
         )
         
         # 执行VAD检测
-        result = await vad_processor.process(audio_data)
+        result = await _run_in_executor(vad_processor.process_sync, audio_data)
         
         # 构建响应
         response = {
             "is_speaking": result.is_speaking,
             "state": result.current_state,  # 'speech' 或 'silence'
             "state_changed": result.state_changed,
-            "probability": round(result.probability, 4),
-            "rms": round(result.rms, 4),
-            "max_amplitude": round(result.max_amplitude, 4),
+            "probability": result.probability,
+            "rms": result.rms,
+            "max_amplitude": result.max_amplitude,
             "silence_timeout": result.silence_timeout,
             "processing_time_ms": int((time.time() - start_time) * 1000),
             "metadata": {
@@ -119,27 +193,86 @@ async def detect_voice_activity(
         raise HTTPException(status_code=500, detail="内部服务器错误")
 
 
+def _process_segment_sync(
+    vad_processor: VADProcessor,
+    index: int,
+    segment: np.ndarray,
+    sample_rate: int,
+) -> Dict[str, Any]:
+    """检测单个音频片段（阻塞，在线程池中执行），出错时返回错误条目"""
+    try:
+        result = vad_processor.process_sync(segment)
+        
+        return {
+            "segment_index": index,
+            "is_speaking": result.is_speaking,
+            "state": result.current_state,
+            "state_changed": result.state_changed,
+            "probability": result.probability,
+            "rms": result.rms,
+            "max_amplitude": result.max_amplitude,
+            "silence_timeout": result.silence_timeout,
+            "duration_seconds": round(len(segment) / sample_rate, 2),
+        }
+        
+    except Exception as e:
+        logger.error(f"处理片段 {index} 时出错", error=str(e))
+        return {
+            "segment_index": index,
+            "error": str(e),
+            "is_speaking": None,
+            "state": "error",
+        }
+
+
+def _process_segments_sync(
+    vad_processor: VADProcessor,
+    segments: List[np.ndarray],
+    sample_rate: int,
+) -> List[Dict[str, Any]]:
+    """依次检测各个音频片段，VAD状态在片段之间延续（阻塞，在线程池中执行）"""
+    return [
+        _process_segment_sync(vad_processor, i, segment, sample_rate)
+        for i, segment in enumerate(segments)
+    ]
+
+
 @router.post("/vad/process-segments")
 async def process_audio_segments(
-    segments: List[List[float]],
-    sample_rate: int = 16000,
-    reset_between_segments: bool = False,
-    vad_processor: VADProcessor = Depends(get_vad_processor),
+    body: Union[VADSegmentsRequest, List[List[float]]] = Body(...),
+    sample_rate: Optional[int] = Query(None, gt=0, description="旧版参数：采样率"),
+    reset_between_segments: Optional[bool] = Query(None, description="旧版参数：片段之间是否重置VAD状态"),
+    vad_pool: VADPool = Depends(get_vad_pool),
 ):
     """批量处理多个音频片段的VAD检测
     
     参数:
-        segments: 音频片段列表，每个片段是一个浮点数列表
-        sample_rate: 采样率
-        reset_between_segments: 是否在处理每个片段之间重置VAD状态
+        request: segments_b64 为 Base64 编码的 PCM 片段列表（兼容旧的 segments 浮点数列表）；
+            sample_rate 为采样率；reset_between_segments 表示是否在处理每个片段之间重置VAD状态。
+            重置时各片段互不依赖，分别借用处理器并行检测；否则用同一个处理器按顺序检测。
+            也接受旧版的裸二维数组请求体，此时其余参数通过查询参数传递
     
     返回:
         每个片段的VAD检测结果列表
     """
     start_time = time.time()
-    results = []
     
     try:
+        request = _resolve_request(
+            VADSegmentsRequest,
+            body,
+            "segments",
+            sample_rate=sample_rate,
+            reset_between_segments=reset_between_segments,
+        )
+        sample_rate = request.sample_rate
+        reset_between_segments = request.reset_between_segments
+        _check_legacy_input(request.segments is not None)
+        try:
+            segments = request.to_arrays()
+        except ValueError as e:
+            raise ValidationError(str(e), field="segments_b64")
+        
         if not segments:
             raise ValidationError("音频片段列表不能为空")
         
@@ -150,36 +283,21 @@ async def process_audio_segments(
             reset_between=reset_between_segments,
         )
         
-        for i, segment in enumerate(segments):
-            if reset_between_segments and i > 0:
-                vad_processor.reset()
+        if reset_between_segments:
+            async def run_one(index: int, segment: np.ndarray) -> Dict[str, Any]:
+                async with vad_pool.acquire() as vad_processor:
+                    return await _run_in_executor(
+                        _process_segment_sync, vad_processor, index, segment, sample_rate
+                    )
             
-            # 处理每个片段
-            try:
-                result = await vad_processor.process(segment)
-                
-                segment_result = {
-                    "segment_index": i,
-                    "is_speaking": result.is_speaking,
-                    "state": result.current_state,
-                    "state_changed": result.state_changed,
-                    "probability": round(result.probability, 4),
-                    "rms": round(result.rms, 4),
-                    "max_amplitude": round(result.max_amplitude, 4),
-                    "silence_timeout": result.silence_timeout,
-                    "duration_seconds": round(len(segment) / sample_rate, 2),
-                }
-                
-                results.append(segment_result)
-                
-            except Exception as e:
-                logger.error(f"处理片段 {i} 时出错", error=str(e))
-                results.append({
-                    "segment_index": i,
-                    "error": str(e),
-                    "is_speaking": None,
-                    "state": "error",
-                })
+            results = await asyncio.gather(
+                *(run_one(i, segment) for i, segment in enumerate(segments))
+            )
+        else:
+            async with vad_pool.acquire() as vad_processor:
+                results = await _run_in_executor(
+                    _process_segments_sync, vad_processor, segments, sample_rate
+                )
         
         # 统计信息
         speech_segments = sum(1 for r in results if r.get("is_speaking") == True)
@@ -199,7 +317,7 @@ async def process_audio_segments(
             "metadata": {
                 "sample_rate": sample_rate,
                 "reset_between_segments": reset_between_segments,
-                "vad_threshold": vad_processor.threshold,
+                "vad_threshold": settings.vad_threshold,
             }
         }
         
@@ -214,21 +332,63 @@ async def process_audio_segments(
         raise HTTPException(status_code=500, detail="内部服务器错误")
 
 
+def _analyze_windows(
+    vad_processor: VADProcessor, audio_data: np.ndarray, window_size: int, hop_size: int
+) -> List[VADResult]:
+    """逐窗口检测整段音频（阻塞，在线程池中执行）"""
+    # 每个窗口的 RMS 和峰值用滑动累加一次算出，重叠部分不重复计算
+    rms, max_amplitude = vad_processor.sliding_energy(audio_data, window_size, hop_size)
+    if not vad_processor.use_real_vad:
+        return vad_processor.process_energy(rms, max_amplitude)
+    
+    # 一次性切出所有分析窗口（步长为 hop_size 的视图，不复制数据）并批量检测，
+    # 能量低于预筛阈值的窗口直接判为静音，不送入 TEN-VAD
+    windows = np.lib.stride_tricks.sliding_window_view(audio_data, window_size)[::hop_size]
+    return vad_processor.process_batch_sync(
+        windows, rms, max_amplitude, prescreen_floor=settings.vad_prescreen_floor
+    )
+
+
+def _speech_segments(
+    is_speaking: np.ndarray, hop_size: int, sample_rate: int, total_samples: int
+) -> List[Dict[str, float]]:
+    """根据每个窗口的语音判定计算语音段时间戳
+    
+    语音段从第一个判定为语音的窗口起点开始，到其后第一个静音窗口的起点结束；
+    音频结束时仍在说话则以音频总时长作为结束时间。
+    """
+    # 前后补 False，使每个语音段都有一个上升沿和一个下降沿；
+    # 末尾补上的下降沿（下标等于窗口数）对应音频结束
+    edges = np.diff(np.concatenate(([False], is_speaking, [False])).astype(np.int8))
+    start_index = np.flatnonzero(edges == 1)
+    end_index = np.flatnonzero(edges == -1)
+    starts = start_index * hop_size / sample_rate
+    ends = np.where(end_index < len(is_speaking), end_index * hop_size, total_samples) / sample_rate
+    
+    return [
+        {
+            "start": round(start, 2),
+            "end": round(end, 2),
+            "duration": round(end - start, 2),
+        }
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+
 @router.post("/vad/analyze-file")
 async def analyze_audio_file(
-    audio_data: List[float],
-    sample_rate: int = 16000,
-    window_duration: float = 0.5,  # 窗口时长（秒）
-    overlap: float = 0.1,  # 重叠时长（秒）
+    body: Union[VADAnalyzeRequest, List[float]] = Body(...),
+    sample_rate: Optional[int] = Query(None, gt=0, description="旧版参数：采样率"),
+    window_duration: Optional[float] = Query(None, gt=0, description="旧版参数：窗口时长（秒）"),
+    overlap: Optional[float] = Query(None, ge=0, description="旧版参数：重叠时长（秒）"),
     vad_processor: VADProcessor = Depends(get_vad_processor),
 ):
     """分析整个音频文件的语音活动分布
     
     参数:
-        audio_data: 完整音频文件的数据
-        sample_rate: 采样率
-        window_duration: 分析窗口时长（秒）
-        overlap: 窗口重叠时长（秒）
+        request: 完整音频文件的数据（audio_b64 或旧的 audio_data）、采样率、
+            window_duration 分析窗口时长（秒）、overlap 窗口重叠时长（秒）。
+            也接受旧版的裸浮点数数组请求体，此时其余参数通过查询参数传递
     
     返回:
         音频文件的VAD分析结果，包括语音段时间戳
@@ -236,13 +396,29 @@ async def analyze_audio_file(
     start_time = time.time()
     
     try:
-        if not audio_data:
+        request = _resolve_request(
+            VADAnalyzeRequest,
+            body,
+            "audio_data",
+            sample_rate=sample_rate,
+            window_duration=window_duration,
+            overlap=overlap,
+        )
+        sample_rate = request.sample_rate
+        window_duration = request.window_duration  # 窗口时长（秒）
+        overlap = request.overlap  # 重叠时长（秒）
+        audio_data = _decode_request_audio(request)
+        
+        if len(audio_data) == 0:
             raise ValidationError("音频数据不能为空")
         
         # 计算窗口参数
         window_size = int(window_duration * sample_rate)
         hop_size = int((window_duration - overlap) * sample_rate)
         
+        if window_size <= 0 or hop_size <= 0:
+            raise ValidationError("窗口时长必须大于重叠时长")
+        
         if window_size > len(audio_data):
             raise ValidationError("窗口大小超过音频长度")
         
@@ -254,49 +430,11 @@ async def analyze_audio_file(
             hop_size=hop_size,
         )
         
-        # 重置VAD状态
-        vad_processor.reset()
-        
-        # 分析音频
-        speech_segments = []
-        current_speech_start = None
-        position = 0
-        window_index = 0
-        
-        while position + window_size <= len(audio_data):
-            # 提取窗口
-            window = audio_data[position:position + window_size]
-            
-            # VAD检测
-            result = await vad_processor.process(window)
-            
-            # 记录语音段
-            timestamp = position / sample_rate
-            
-            if result.is_speaking and current_speech_start is None:
-                # 语音段开始
-                current_speech_start = timestamp
-                
-            elif not result.is_speaking and current_speech_start is not None:
-                # 语音段结束
-                speech_segments.append({
-                    "start": round(current_speech_start, 2),
-                    "end": round(timestamp, 2),
-                    "duration": round(timestamp - current_speech_start, 2),
-                })
-                current_speech_start = None
-            
-            position += hop_size
-            window_index += 1
+        results = await _run_in_executor(_analyze_windows, vad_processor, audio_data, window_size, hop_size)
+        is_speaking = np.fromiter((r.is_speaking for r in results), dtype=bool, count=len(results))
         
-        # 处理最后一个语音段
-        if current_speech_start is not None:
-            end_time = len(audio_data) / sample_rate
-            speech_segments.append({
-                "start": round(current_speech_start, 2),
-                "end": round(end_time, 2),
-                "duration": round(end_time - current_speech_start, 2),
-            })
+        speech_segments = _speech_segments(is_speaking, hop_size, sample_rate, len(audio_data))
+        window_index = len(results)
         
         # 计算统计信息
         total_duration = len(audio_data) / sample_rate
@@ -340,14 +478,13 @@ async def analyze_audio_file(
 
 
 @router.get("/vad/status")
-async def get_vad_status(vad_processor: VADProcessor = Depends(get_vad_processor)):
-    """获取VAD处理器当前状态和配置信息"""
-    stats = vad_processor.get_stats()
+async def get_vad_status(vad_pool: VADPool = Depends(get_vad_pool)):
+    """获取VAD处理器池当前状态和配置信息"""
+    stats = vad_pool.processors[0].get_stats()
     
     return {
         "status": "operational",
         "current_state": {
-            "is_speaking": stats["is_speaking"],
             "use_real_vad": stats["use_real_vad"],
             "vad_type": "TEN-VAD" if stats["use_real_vad"] else "Energy-based",
         },
@@ -356,9 +493,7 @@ async def get_vad_status(vad_processor: VADProcessor = Depends(get_vad_processor
             "silence_duration": stats["silence_duration"],
             "hop_size": stats["hop_size"],
         },
-        "buffer_info": {
-            "vad_buffer_size": stats["vad_buffer_size"],
-        },
+        "pool": vad_pool.get_stats(),
         "capabilities": {
             "ten_vad_available": stats["use_real_vad"],
             "supported_sample_rates": [8000, 16000, 22050, 44100, 48000],
@@ -368,12 +503,13 @@ async def get_vad_status(vad_processor: VADProcessor = Depends(get_vad_processor
 
 
 @router.post("/vad/reset")
-async def reset_vad_state(vad_processor: VADProcessor = Depends(get_vad_processor)):
-    """重置VAD处理器状态"""
-    vad_processor.reset()
+async def reset_vad_state():
+    """重置VAD处理器状态
     
+    处理器归还到池中时已自动重置，请求之间不再保留状态；保留此接口以兼容旧客户端。
+    """
     return {
         "status": "success",
         "message": "VAD处理器已重置",
-        "timestamp": int(time.time() * 1000),
-    }
\ No newline at end of file
+        "timestamp": time.time_ns() // 1_000_000,
+    }
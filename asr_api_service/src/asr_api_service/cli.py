@@ -48,6 +48,16 @@ def serve(
             workers=1 if reload else _workers,
             reload=reload,
             log_level=_log_level,
+            # C event loop and HTTP parser (uvloop is unavailable on Windows)
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            # WebSocket limits; audio frames do not compress, so skip permessage-deflate
+            ws="websockets",
+            ws_max_size=settings.streaming_max_message_size,
+            ws_max_queue=settings.streaming_max_queue,
+            ws_ping_interval=settings.streaming_ping_interval,
+            ws_ping_timeout=settings.streaming_ping_timeout,
+            ws_per_message_deflate=False,
         )
     except KeyboardInterrupt:
         console.print("\n👋 Shutting down ASR API Service", style="yellow")
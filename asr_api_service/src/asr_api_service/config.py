@@ -67,6 +67,10 @@ class Settings(BaseSettings):
     api_cors_headers: List[str] = Field(
         default=["*"], description="CORS allowed headers"
     )
+    api_enabled_routers: List[str] = Field(
+        default=["health", "transcription", "streaming", "vad", "mobile", "stream_vad"],
+        description="API v1 router modules to load",
+    )
 
     # ASR Configuration
     asr_provider: ASRProvider = Field(default=ASRProvider.WHISPER, description="ASR provider")
@@ -102,6 +106,26 @@ class Settings(BaseSettings):
     vad_threshold: float = Field(default=0.5, description="VAD threshold")
     vad_silence_duration: float = Field(default=0.8, description="VAD silence duration")
     vad_hop_size: int = Field(default=256, description="VAD hop size")
+    vad_accept_float_list: bool = Field(
+        default=True,
+        description="Accept legacy float-list audio on the VAD REST endpoints",
+    )
+    vad_silence_shortcut: float = Field(
+        default=1e-4,
+        description="RMS below which streaming VAD windows skip inference (0 disables)",
+    )
+    vad_prescreen_floor: float = Field(
+        default=1e-3,
+        description="RMS below which whole-file VAD analysis skips TEN-VAD (0 disables)",
+    )
+    vad_workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        description="Worker threads and pooled processors for the VAD REST endpoints",
+    )
+    vad_batch_size: int = Field(
+        default=64,
+        description="Windows handled per mini-batch in batch VAD processing",
+    )
 
     # Audio Configuration
     audio_sample_rate: int = Field(default=16000, description="Audio sample rate")
@@ -110,12 +134,34 @@ class Settings(BaseSettings):
     audio_lookback_duration: float = Field(default=9.0, description="Audio lookback duration")
     audio_max_duration: float = Field(default=300.0, description="Maximum audio duration in seconds")
     audio_min_duration: float = Field(default=0.1, description="Minimum audio duration in seconds")
+    audio_result_cache_size: int = Field(
+        default=256, description="Max cached mobile audio processing results (0 disables)"
+    )
+    audio_result_cache_ttl: float = Field(
+        default=300.0, description="Mobile audio processing result cache TTL in seconds"
+    )
+    audio_result_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Total audio bytes held by the mobile result cache",
+    )
+    audio_result_cache_max_entry_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        description="Mobile results with more audio bytes than this are not cached",
+    )
 
     # Streaming Configuration
     streaming_max_clients: int = Field(default=100, description="Maximum streaming clients")
     streaming_ping_interval: int = Field(default=20, description="WebSocket ping interval")
     streaming_ping_timeout: int = Field(default=10, description="WebSocket ping timeout")
     streaming_close_timeout: int = Field(default=5, description="WebSocket close timeout")
+    # A slow connection can buffer up to max_message_size * max_queue bytes
+    # (4 MiB * 16 = 64 MiB by default); 4 MiB fits a 30 s binary audio frame
+    streaming_max_message_size: int = Field(
+        default=4 * 1024 * 1024, description="Maximum incoming WebSocket message size in bytes"
+    )
+    streaming_max_queue: int = Field(
+        default=16, description="Incoming WebSocket messages buffered per connection"
+    )
 
     # Storage Configuration
     audio_storage_path: Path = Field(
@@ -154,6 +200,9 @@ class Settings(BaseSettings):
     metrics_path: str = Field(default="/metrics", description="Metrics endpoint path")
     enable_health_check: bool = Field(default=True, description="Enable health check endpoint")
     health_check_path: str = Field(default="/health", description="Health check endpoint path")
+    health_cache_ttl: float = Field(
+        default=30.0, description="Detailed health check cache TTL in seconds (0 disables)"
+    )
 
     # Development Configuration
     enable_docs: bool = Field(default=True, description="Enable API documentation")
@@ -177,6 +226,22 @@ class Settings(BaseSettings):
             raise ValueError("VAD threshold must be between 0.0 and 1.0")
         return v
 
+    @field_validator("vad_silence_shortcut", "vad_prescreen_floor")
+    @classmethod
+    def validate_vad_silence_floor(cls, v: float) -> float:
+        """Validate VAD silence floors are not negative."""
+        if v < 0:
+            raise ValueError("VAD silence floor must not be negative")
+        return v
+
+    @field_validator("vad_workers", "vad_batch_size")
+    @classmethod
+    def validate_vad_counts(cls, v: int) -> int:
+        """Validate VAD worker and batch counts are at least 1."""
+        if v < 1:
+            raise ValueError("VAD workers and batch size must be at least 1")
+        return v
+
     @field_validator("audio_chunk_duration", "audio_lookback_duration", "audio_max_duration")
     @classmethod
     def validate_positive_duration(cls, v: float) -> float:
@@ -228,6 +293,16 @@ class Settings(BaseSettings):
         """Check if running in development mode."""
         return self.api_debug or self.api_reload
 
+    @property
+    def valid_vad_threshold(self) -> bool:
+        """Check the VAD threshold is within [0, 1]."""
+        return 0.0 <= self.vad_threshold <= 1.0
+
+    @property
+    def valid_audio_settings(self) -> bool:
+        """Check the audio sample rate and chunk duration are positive."""
+        return self.audio_sample_rate > 0 and self.audio_chunk_duration > 0
+
     @property
     def cors_config(self) -> dict:
         """Get CORS configuration."""
@@ -1,7 +1,7 @@
 """Base ASR provider interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 
 import numpy as np
 
@@ -52,7 +52,7 @@ class ASRProvider(ABC):
     @abstractmethod
     async def transcribe(
         self,
-        audio_data: List[float],
+        audio_data: Union[List[float], np.ndarray],
         sample_rate: int = 16000,
         prompt: str = "",
         language: Optional[str] = None,
@@ -83,7 +83,7 @@ class ASRProvider(ABC):
 
     def create_audio_array(
         self, 
-        audio_data: List[float], 
+        audio_data: Union[List[float], np.ndarray], 
         sample_rate: int = 16000,
         target_dtype: np.dtype = np.int16
     ) -> np.ndarray:
@@ -97,7 +97,7 @@ class ASRProvider(ABC):
         Returns:
             NumPy array of audio data
         """
-        audio_array = np.array(audio_data, dtype=np.float32)
+        audio_array = np.asarray(audio_data, dtype=np.float32)
         
         # Clip to valid range
         audio_array = np.clip(audio_array, -1.0, 1.0)
@@ -111,7 +111,7 @@ class ASRProvider(ABC):
         
         return audio_array
 
-    def validate_audio_data(self, audio_data: List[float], min_duration: float = 0.1) -> None:
+    def validate_audio_data(self, audio_data: Union[List[float], np.ndarray], min_duration: float = 0.1) -> None:
         """Validate audio data.
         
         Args:
@@ -121,18 +121,18 @@ class ASRProvider(ABC):
         Raises:
             ValueError: If audio data is invalid
         """
-        if not audio_data:
-            raise ValueError("Audio data is empty")
-        
         if not isinstance(audio_data, (list, np.ndarray)):
             raise ValueError("Audio data must be a list or numpy array")
         
+        if len(audio_data) == 0:
+            raise ValueError("Audio data is empty")
+        
         duration = len(audio_data) / 16000  # Assume 16kHz
         if duration < min_duration:
             raise ValueError(f"Audio duration {duration:.2f}s is less than minimum {min_duration}s")
         
         # Check for all zeros (silence)
-        if all(abs(sample) < 1e-6 for sample in audio_data):
+        if np.all(np.abs(np.asarray(audio_data, dtype=np.float32)) < 1e-6):
             raise ValueError("Audio data appears to be silent")
 
     def get_provider_name(self) -> str:
@@ -1,10 +1,11 @@
 """Whisper ASR provider implementation."""
 
+import importlib.util
 import tempfile
 import time
 import wave
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 
 import httpx
 import numpy as np
@@ -15,6 +16,37 @@ from asr_api_service.exceptions import ASRProviderError
 
 logger = structlog.get_logger(__name__)
 
+# HTTP/2 needs the optional ``h2`` package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool shared by all providers; idle connections are kept warm
+# long enough to be reused between transcription requests
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60.0,
+)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used for ASR API requests."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=_HTTP_LIMITS,
+            http2=_HTTP2_AVAILABLE,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class WhisperASRProvider(ASRProvider):
     """Whisper ASR provider supporting OpenAI and Fireworks APIs."""
@@ -25,6 +57,7 @@ class WhisperASRProvider(ASRProvider):
         api_url: str,
         model: str = "whisper-1",
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize Whisper ASR provider.
         
@@ -33,13 +66,15 @@ class WhisperASRProvider(ASRProvider):
             api_url: API endpoint URL
             model: Whisper model name
             timeout: Request timeout in seconds
+            http_client: HTTP client to send requests with (defaults to the shared client)
         """
         super().__init__(api_key, api_url, model)
         self.timeout = timeout
+        self.http_client = http_client
         
     async def transcribe(
         self,
-        audio_data: List[float],
+        audio_data: Union[List[float], np.ndarray],
         sample_rate: int = 16000,
         prompt: str = "",
         language: Optional[str] = None,
@@ -127,7 +162,7 @@ class WhisperASRProvider(ASRProvider):
                     provider=self.get_provider_name(),
                 )
 
-    def _write_wav_file(self, filepath: str, audio_data: List[float], sample_rate: int) -> None:
+    def _write_wav_file(self, filepath: str, audio_data: Union[List[float], np.ndarray], sample_rate: int) -> None:
         """Write audio data to WAV file.
         
         Args:
@@ -200,42 +235,43 @@ class WhisperASRProvider(ASRProvider):
             ASRProviderError: If API request fails
         """
         headers = {"Authorization": f"Bearer {self.api_key}"}
+        client = self.http_client or get_http_client()
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    self.api_url,
-                    headers=headers,
-                    files=files,
-                    data=data,
-                )
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    error_detail = None
-                    try:
-                        error_detail = response.json()
-                    except:
-                        error_detail = response.text
-                        
-                    raise ASRProviderError(
-                        f"API request failed with status {response.status_code}",
-                        provider=self.get_provider_name(),
-                        status_code=response.status_code,
-                        response_data=error_detail,
-                    )
+        try:
+            response = await client.post(
+                self.api_url,
+                headers=headers,
+                files=files,
+                data=data,
+                timeout=self.timeout,
+            )
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                error_detail = None
+                try:
+                    error_detail = response.json()
+                except:
+                    error_detail = response.text
                     
-            except httpx.TimeoutException:
-                raise ASRProviderError(
-                    "API request timed out",
-                    provider=self.get_provider_name(),
-                )
-            except httpx.RequestError as e:
                 raise ASRProviderError(
-                    f"API request error: {str(e)}",
+                    f"API request failed with status {response.status_code}",
                     provider=self.get_provider_name(),
+                    status_code=response.status_code,
+                    response_data=error_detail,
                 )
+                
+        except httpx.TimeoutException:
+            raise ASRProviderError(
+                "API request timed out",
+                provider=self.get_provider_name(),
+            )
+        except httpx.RequestError as e:
+            raise ASRProviderError(
+                f"API request error: {str(e)}",
+                provider=self.get_provider_name(),
+            )
 
     def _extract_text_from_response(self, response_data: dict) -> str:
         """Extract text from API response.
@@ -1,6 +1,6 @@
 """Audio processing module."""
 
-from asr_api_service.core.audio.buffer import AudioBuffer
-from asr_api_service.core.audio.vad import VADProcessor
+from asr_api_service.core.audio.buffer import AudioBuffer, FloatRing
+from asr_api_service.core.audio.vad import VADModel, VADPool, VADProcessor, VADSession
 
-__all__ = ["AudioBuffer", "VADProcessor"]
\ No newline at end of file
+__all__ = ["AudioBuffer", "FloatRing", "VADModel", "VADPool", "VADProcessor", "VADSession"]
\ No newline at end of file
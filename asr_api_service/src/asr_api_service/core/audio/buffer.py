@@ -1,9 +1,10 @@
 """Audio buffer management."""
 
 import time
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from asr_api_service.exceptions import AudioProcessingError
 
@@ -22,7 +23,7 @@ class AudioBuffer:
         self.start_time = time.time()
         self.last_access_time = time.time()
         
-    def append(self, audio_data: List[float]) -> None:
+    def append(self, audio_data: Union[List[float], np.ndarray]) -> None:
         """Add audio data to the buffer.
         
         Args:
@@ -31,19 +32,23 @@ class AudioBuffer:
         Raises:
             AudioProcessingError: If audio data is invalid
         """
+        if isinstance(audio_data, np.ndarray):
+            # Numeric arrays are clipped in one pass, without per-sample checks
+            if not np.issubdtype(audio_data.dtype, np.number):
+                raise AudioProcessingError("All audio samples must be numeric")
+            self.buffer.extend(np.clip(audio_data, -1.0, 1.0).tolist())
+            self.last_access_time = time.time()
+            return
+            
         if not audio_data:
             return
             
-        if not isinstance(audio_data, (list, np.ndarray)):
+        if not isinstance(audio_data, list):
             raise AudioProcessingError(
                 "Audio data must be a list or numpy array",
                 audio_info={"type": type(audio_data).__name__}
             )
             
-        # Convert to list if numpy array
-        if isinstance(audio_data, np.ndarray):
-            audio_data = audio_data.tolist()
-            
         # Validate audio data range
         if any(not isinstance(sample, (int, float)) for sample in audio_data):
             raise AudioProcessingError("All audio samples must be numeric")
@@ -234,4 +239,112 @@ class AudioBuffer:
             "peak_level": self.get_peak_level(),
             "buffer_start_time": self.start_time,
             "last_access_time": self.last_access_time,
-        }
\ No newline at end of file
+        }
+
+
+class FloatRing:
+    """Preallocated float32 sample buffer handing out zero-copy windows.
+
+    Samples are appended at the tail and consumed from the head. When a write
+    would run past the end of the storage, the unread samples are moved back
+    to the start (and the storage grows if they still do not fit), so every
+    window is a contiguous view. Views are only valid until the next write.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize the ring buffer.
+
+        Args:
+            capacity: Initial capacity in samples
+        """
+        if capacity <= 0:
+            raise AudioProcessingError(
+                "Ring buffer capacity must be positive",
+                audio_info={"capacity": capacity}
+            )
+        self._data = np.empty(capacity, dtype=np.float32)
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        """Current storage size in samples."""
+        return len(self._data)
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append samples to the buffer.
+
+        Args:
+            samples: Audio samples to append (converted to float32)
+        """
+        n = len(samples)
+        if self._tail + n > len(self._data):
+            size = len(self)
+            if size + n > len(self._data):
+                capacity = len(self._data)
+                while size + n > capacity:
+                    capacity *= 2
+                data = np.empty(capacity, dtype=np.float32)
+                data[:size] = self._data[self._head:self._tail]
+                self._data = data
+            else:
+                # Overlapping copy is handled by NumPy
+                self._data[:size] = self._data[self._head:self._tail]
+            self._head, self._tail = 0, size
+
+        self._data[self._tail:self._tail + n] = samples
+        self._tail += n
+
+    def read_window(self, size: int, hop: int) -> Optional[np.ndarray]:
+        """Return the next window and advance the head by ``hop`` samples.
+
+        Args:
+            size: Window size in samples
+            hop: Number of samples to consume
+
+        Returns:
+            View of ``size`` samples, or None if not enough data is buffered
+        """
+        if len(self) < size:
+            return None
+        window = self._data[self._head:self._head + size]
+        self._head = min(self._head + hop, self._tail)
+        return window
+
+    def ready_windows(self, size: int, hop: int) -> np.ndarray:
+        """Return every complete window at once and consume them.
+
+        Equivalent to calling :meth:`read_window` until it returns None, but
+        the windows come back as a single strided view.
+
+        Args:
+            size: Window size in samples
+            hop: Number of samples between window starts
+
+        Returns:
+            View of shape ``(n, size)``; ``n`` is 0 if no window is ready
+        """
+        if len(self) < size:
+            return np.empty((0, size), dtype=np.float32)
+        count = (len(self) - size) // hop + 1
+        end = self._head + (count - 1) * hop + size
+        windows = sliding_window_view(self._data[self._head:end], size)[::hop]
+        self._head = min(self._head + count * hop, self._tail)
+        return windows
+
+    def read_all(self) -> np.ndarray:
+        """Return a view of all buffered samples and empty the buffer.
+
+        Returns:
+            View of the remaining samples
+        """
+        remaining = self._data[self._head:self._tail]
+        self._head = self._tail = 0
+        return remaining
+
+    def clear(self) -> None:
+        """Drop all buffered samples."""
+        self._head = self._tail = 0
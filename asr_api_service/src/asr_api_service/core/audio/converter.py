@@ -0,0 +1,370 @@
+"""音频格式转换、解码与重采样（移动端与转写接口共用）"""
+
+import io
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+from fractions import Fraction
+from functools import lru_cache
+from typing import Optional, Union
+
+import numpy as np
+import soundfile as sf
+import structlog
+
+try:
+    # SIMD 加速的 base64 编解码，未安装时回退到标准库
+    from pybase64 import b64decode, b64encode
+except ImportError:
+    from base64 import b64decode, b64encode
+
+try:
+    # 高性能多相重采样，未安装时依次回退到 SciPy / NumPy 实现的多相 FIR
+    import soxr
+except ImportError:
+    soxr = None
+
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
+logger = structlog.get_logger(__name__)
+
+# ffmpeg 可执行文件路径（导入时查找一次，未安装时为 None）
+_FFMPEG_PATH: Optional[str] = shutil.which('ffmpeg')
+
+
+# ffmpeg 无法从管道读取的格式（MP4 系容器需要 seek）
+_SEEKABLE_INPUT_FORMATS = frozenset({'m4a', 'mp4', 'mov', '3gp'})
+
+_WAV_FMT = struct.Struct("<HHIIHH")
+_WAV_CHUNK_HEADER = struct.Struct("<4sI")
+
+
+def _fast_pcm_wav_decode(buf: Union[bytes, memoryview]) -> Optional[tuple[np.ndarray, int]]:
+    """
+    16 位 PCM WAV（单/双声道）快速解码，跳过 libsndfile
+    
+    返回: (单声道 float32 音频, 采样率)，非此类 WAV 时返回 None
+    """
+    if len(buf) < 12 or buf[:4] != b'RIFF' or buf[8:12] != b'WAVE':
+        return None
+    
+    fmt = None
+    pos = 12
+    while pos + _WAV_CHUNK_HEADER.size <= len(buf):
+        chunk_id, chunk_size = _WAV_CHUNK_HEADER.unpack_from(buf, pos)
+        pos += _WAV_CHUNK_HEADER.size
+        
+        if chunk_id == b'fmt ' and chunk_size >= _WAV_FMT.size:
+            fmt = _WAV_FMT.unpack_from(buf, pos)
+        elif chunk_id == b'data':
+            if fmt is None:
+                return None
+            audio_format, channels, sample_rate, _, _, bits_per_sample = fmt
+            if audio_format != 1 or bits_per_sample != 16 or channels not in (1, 2):
+                return None
+            
+            # 流式写入的 WAV 可能带有不准确的 data 长度
+            data_len = min(chunk_size, len(buf) - pos)
+            data_len -= data_len % (2 * channels)
+            samples = np.frombuffer(buf[pos:pos + data_len], dtype='<i2')
+            
+            if channels == 2:
+                audio_data = samples.reshape(-1, 2).mean(axis=1, dtype=np.float32)
+                audio_data *= 1.0 / 32768.0
+            else:
+                audio_data = samples * np.float32(1.0 / 32768.0)
+            return audio_data, sample_rate
+        
+        # RIFF 块按偶数字节对齐
+        pos += chunk_size + (chunk_size & 1)
+    
+    return None
+
+
+def _postprocess(audio_data: np.ndarray) -> np.ndarray:
+    """
+    单声道混音 + 峰值归一化到 [-1, 1] + 转为 float32
+    
+    在 float32 数组上原地缩放，避免多次遍历产生临时数组
+    """
+    audio_data = np.asarray(audio_data, dtype=np.float32)
+    if audio_data.ndim > 1:
+        audio_data = audio_data.mean(axis=1, dtype=np.float32)
+    
+    peak = max(audio_data.max(), -audio_data.min())
+    if peak > 0:
+        np.multiply(audio_data, 1.0 / peak, out=audio_data)
+    
+    return audio_data
+
+
+# 线程本地的编码缓冲区（批量处理会在线程池中编码）
+_thread_local = threading.local()
+
+
+def _get_encode_buffer() -> io.BytesIO:
+    """获取当前线程复用的 BytesIO（已清空）"""
+    buffer = getattr(_thread_local, 'encode_buffer', None)
+    if buffer is None:
+        buffer = _thread_local.encode_buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
+class AudioConverter:
+    """音频格式转换工具"""
+    
+    @staticmethod
+    def _check_ffmpeg_available() -> bool:
+        """检查 ffmpeg 是否可用"""
+        return _FFMPEG_PATH is not None
+    
+    @staticmethod
+    def _convert_with_ffmpeg(
+        audio_bytes: Union[bytes, memoryview],
+        format: str,
+        sample_rate: int = 16000,
+    ) -> Optional[bytes]:
+        """
+        使用 ffmpeg 转换音频格式
+        
+        输入通过 stdin、输出 WAV 通过 stdout 传输，不经过临时文件；
+        失败时返回 None
+        """
+        input_path = None
+        try:
+            if format.lower() in _SEEKABLE_INPUT_FORMATS:
+                # MP4 系容器的 moov 可能位于文件末尾，需要可 seek 的输入
+                with tempfile.NamedTemporaryFile(suffix=f'.{format}', delete=False) as input_file:
+                    input_file.write(audio_bytes)
+                    input_path = input_file.name
+            
+            cmd = [
+                _FFMPEG_PATH or 'ffmpeg', '-hide_banner', '-loglevel', 'error',
+                '-probesize', '32768',    # 减少格式探测读取量
+                '-analyzeduration', '0',
+                '-i', input_path or 'pipe:0',
+                '-ar', str(sample_rate),  # 设置采样率
+                '-ac', '1',               # 转为单声道
+                '-f', 'wav',              # 输出格式为 WAV
+                'pipe:1',
+            ]
+            
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL if input_path else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            # communicate() 需要 bytes；bytes 输入不会被复制，memoryview 仅在此转换一次
+            output, error = process.communicate(None if input_path else bytes(audio_bytes))
+            
+            if process.returncode != 0:
+                logger.error(f"ffmpeg 转换失败: {error.decode(errors='replace')}")
+                return None
+            return output
+            
+        except Exception as e:
+            logger.error(f"ffmpeg 调用异常: {e}")
+            return None
+        finally:
+            if input_path:
+                try:
+                    os.unlink(input_path)
+                except Exception as e:
+                    logger.warning(f"清理临时文件失败: {e}")
+    
+    @staticmethod
+    def base64_to_audio(audio_base64: str, format: str) -> tuple[np.ndarray, int]:
+        """
+        将 Base64 音频转换为 NumPy 数组
+        
+        返回: (音频数据, 采样率)
+        """
+        try:
+            audio_bytes = b64decode(audio_base64, validate=False)
+        except Exception as e:
+            logger.error(f"音频转换失败: {e}")
+            raise ValueError(f"无法转换音频格式 {format}: {str(e)}")
+        return AudioConverter.bytes_to_audio(audio_bytes, format)
+    
+    @staticmethod
+    def bytes_to_audio(audio_bytes: Union[bytes, memoryview], format: str) -> tuple[np.ndarray, int]:
+        """
+        将原始音频字节转换为 NumPy 数组（文件上传无需再经过 Base64）
+        
+        返回: (音频数据, 采样率)
+        """
+        try:
+            # 16 位 PCM WAV 快速路径
+            decoded = _fast_pcm_wav_decode(audio_bytes)
+            if decoded is not None:
+                audio_data, sample_rate = decoded
+                return _postprocess(audio_data), sample_rate
+            
+            # soundfile 原生支持的格式
+            native_formats = ['wav', 'flac', 'ogg']
+            
+            if format.lower() in native_formats:
+                # 使用 soundfile 直接读取
+                try:
+                    with io.BytesIO(audio_bytes) as audio_io:
+                        audio_data, sample_rate = sf.read(audio_io, dtype='float32')
+                except Exception as e:
+                    logger.warning(f"soundfile 读取失败，尝试 ffmpeg: {e}")
+                    # 如果 soundfile 失败，也尝试 ffmpeg
+                    return AudioConverter._convert_with_ffmpeg_fallback(
+                        audio_bytes, format
+                    )
+            else:
+                # 对于其他格式（如 m4a, mp3），使用 ffmpeg
+                return AudioConverter._convert_with_ffmpeg_fallback(
+                    audio_bytes, format
+                )
+            
+            return _postprocess(audio_data), sample_rate
+            
+        except Exception as e:
+            logger.error(f"音频转换失败: {e}")
+            raise ValueError(f"无法转换音频格式 {format}: {str(e)}")
+    
+    @staticmethod
+    def _convert_with_ffmpeg_fallback(audio_bytes: Union[bytes, memoryview], format: str) -> tuple[np.ndarray, int]:
+        """使用 ffmpeg 作为后备转换方案"""
+        # 检查 ffmpeg 是否可用
+        if not AudioConverter._check_ffmpeg_available():
+            raise ValueError(
+                f"不支持的音频格式 {format}。"
+                f"请安装 ffmpeg 以支持更多格式，或使用 WAV/FLAC/OGG 格式。"
+            )
+        
+        # 使用 ffmpeg 转换（管道传输）
+        wav_bytes = AudioConverter._convert_with_ffmpeg(audio_bytes, format)
+        
+        if wav_bytes is None:
+            raise ValueError(f"ffmpeg 无法转换 {format} 格式")
+        
+        # 解析 ffmpeg 输出的 WAV（管道输出的头部长度字段不准确，快速路径会自动截断）
+        decoded = _fast_pcm_wav_decode(wav_bytes)
+        if decoded is None:
+            with io.BytesIO(wav_bytes) as audio_io:
+                decoded = sf.read(audio_io, dtype='float32')
+        audio_data, sample_rate = decoded
+        
+        return _postprocess(audio_data), sample_rate
+    
+    @staticmethod
+    def audio_to_base64(audio_data: np.ndarray, sample_rate: int, format: str = 'wav') -> str:
+        """
+        将音频数据转换为 Base64
+        
+        参数:
+            audio_data: 音频数据（-1 到 1 的浮点数）
+            sample_rate: 采样率
+            format: 输出格式
+        """
+        try:
+            # 复用当前线程的内存缓冲区
+            buffer = _get_encode_buffer()
+            
+            # 写入音频数据
+            sf.write(buffer, audio_data, sample_rate, format=format)
+            
+            # 直接对缓冲区视图编码为 Base64，省去 getvalue() 的整块复制
+            try:
+                with buffer.getbuffer() as audio_bytes:
+                    return b64encode(audio_bytes).decode('ascii')
+            finally:
+                buffer.seek(0)
+                buffer.truncate()
+            
+        except Exception as e:
+            logger.error(f"音频编码失败: {e}")
+            raise ValueError(f"无法编码音频: {str(e)}")
+    
+    @staticmethod
+    def resample_audio(audio_data: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+        """
+        重采样音频数据
+        
+        多相 FIR 重采样（带抗混叠低通），优先使用 soxr
+        """
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        
+        # 采样率相同（包括 16000 与 16000.0）时不做任何处理
+        if orig_sr == target_sr:
+            return audio_data
+        
+        if soxr is not None:
+            return soxr.resample(audio_data, orig_sr, target_sr, quality='MQ')
+        
+        # Fraction 同时支持整数和浮点采样率
+        ratio = (Fraction(target_sr) / Fraction(orig_sr)).limit_denominator(1024)
+        up, down = ratio.numerator, ratio.denominator
+        
+        if resample_poly is not None:
+            return resample_poly(audio_data, up, down).astype(np.float32, copy=False)
+        return _resample_poly(audio_data, up, down)
+
+
+# 多相重采样每批计算的输出样本数（限制临时矩阵大小）
+_RESAMPLE_BLOCK = 16384
+
+
+@lru_cache(maxsize=16)
+def _polyphase_filter(up: int, down: int) -> tuple[np.ndarray, int]:
+    """
+    设计 Kaiser 窗低通 FIR 并拆分为多相分量
+    
+    返回: (形状为 (up, 每相抽头数) 的滤波器组, 滤波器半长)
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    n = np.arange(-half_len, half_len + 1)
+    
+    # 截止频率取 1/max_rate，直流增益归一化为 up
+    h = np.sinc(n / max_rate) * np.kaiser(2 * half_len + 1, 5.0)
+    h *= up / h.sum()
+    
+    # 补零到 up 的整数倍后按相位拆分: bank[phase, k] = h[phase + k * up]
+    taps = -(-len(h) // up)
+    h = np.concatenate([h, np.zeros(taps * up - len(h))])
+    bank = h.reshape(taps, up).T[:, ::-1].astype(np.float32)
+    return np.ascontiguousarray(bank), half_len
+
+
+def _resample_poly(audio_data: np.ndarray, up: int, down: int) -> np.ndarray:
+    """
+    NumPy 多相重采样（等价于上采样 -> 低通 -> 下采样）
+    
+    每个输出样本只计算对应相位的非零抽头
+    """
+    bank, half_len = _polyphase_filter(up, down)
+    taps = bank.shape[1]
+    
+    out_len = -(-len(audio_data) * up // down)
+    # 左侧补 taps 个零、右侧补足，避免越界
+    padded = np.concatenate([
+        np.zeros(taps, dtype=np.float32),
+        audio_data,
+        np.zeros(taps + half_len // up + 1, dtype=np.float32),
+    ])
+    offsets = np.arange(1, taps + 1)
+    output = np.empty(out_len, dtype=np.float32)
+    
+    for start in range(0, out_len, _RESAMPLE_BLOCK):
+        t = np.arange(start, min(start + _RESAMPLE_BLOCK, out_len), dtype=np.int64) * down + half_len
+        phase = t % up
+        base = t // up + taps
+        # 抽头已反序: bank[phase, i] 对应输入 x[base - (taps - 1 - i)]
+        window = padded[base[:, None] - taps + offsets[None, :]]
+        output[start:start + len(t)] = np.einsum('ij,ij->i', bank[phase], window)
+    
+    return output
@@ -1,9 +1,13 @@
 """Voice Activity Detection (VAD) implementation."""
 
+import asyncio
+import math
 import sys
+import threading
 import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 import numpy as np
 import structlog
@@ -48,45 +52,93 @@ class VADResult:
         }
 
 
-class VADProcessor:
-    """Voice Activity Detection processor with TEN-VAD integration."""
+def _check_float32(audio_array: np.ndarray, ndim: int) -> None:
+    """Reject audio that would need converting before VAD.
+    
+    Args:
+        audio_array: Audio passed to a VAD session
+        ndim: Expected number of dimensions
+        
+    Raises:
+        VADError: If the audio is not a float32 array of the expected shape
+    """
+    if not isinstance(audio_array, np.ndarray) or audio_array.dtype != np.float32:
+        raise VADError("Expected float32 numpy audio")
+    if audio_array.ndim != ndim:
+        raise VADError(f"Expected a {ndim}-D audio array, got {audio_array.ndim}-D")
+    if ndim == 1 and not audio_array.flags.c_contiguous:
+        raise VADError("Expected C-contiguous audio")
+
+
+def _to_int16(audio_array: np.ndarray) -> np.ndarray:
+    """Convert float samples to the int16 input TEN-VAD expects."""
+    return (np.clip(audio_array, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+class VADModel:
+    """Shared VAD resources: configuration and the TEN-VAD engine factory.
+    
+    TEN-VAD keeps recurrent state inside each native handle, so the model
+    does not hold an engine itself: every :class:`VADSession` creates its own
+    through :attr:`engine_factory`. Apart from its statistics counters the
+    model is not modified after loading, so it can back any number of
+    concurrent sessions.
+    """
 
     def __init__(
         self,
         threshold: float = 0.5,
         silence_duration: float = 0.8,
         hop_size: int = 256,
+        silence_shortcut: float = 0.0,
+        batch_size: int = 64,
     ):
-        """Initialize VAD processor.
+        """Initialize VAD model.
         
         Args:
             threshold: VAD threshold (0.0 to 1.0)
             silence_duration: Minimum silence duration to trigger timeout
             hop_size: VAD hop size in samples
+            silence_shortcut: RMS below which audio is treated as silence
+                without running VAD (0 disables the shortcut)
+            batch_size: Windows handled per mini-batch in batch processing
         """
         self.threshold = threshold
         self.silence_duration = silence_duration
         self.hop_size = hop_size
-        self.is_speaking = False
-        self.silence_start: Optional[float] = None
-        self.debug_counter = 0
+        self.silence_shortcut = silence_shortcut
+        self.batch_size = batch_size
+        
+        # Windows answered by the silence shortcut; sessions sharing this
+        # model update it from executor threads, hence the lock
+        self.silence_shortcut_frames = 0
+        self._stats_lock = threading.Lock()
         
         # Try to initialize TEN-VAD
-        self.ten_vad = None
+        self.engine_factory: Optional[Callable[[], Any]] = None
         self.use_real_vad = False
-        self.vad_buffer: List[int] = []
         
         self._initialize_ten_vad()
         
+    def count_silence_shortcut(self, frames: int) -> None:
+        """Add windows answered by the silence shortcut to the shared counter.
+        
+        Args:
+            frames: Number of windows skipped
+        """
+        if frames:
+            with self._stats_lock:
+                self.silence_shortcut_frames += frames
+        
     def _initialize_ten_vad(self) -> None:
         """Initialize TEN-VAD if available."""
         try:
             # Add parent project's ten-vad path to Python path
-            # Path: /Users/caixin/code/projects/meeting_code/asr_api_service/src/asr_api_service/core/audio/vad.py
-            # Target: /Users/caixin/code/projects/meeting_code/ten-vad/include
+            # Path: <meeting_code>/asr_api_service/src/asr_api_service/core/audio/vad.py
+            # Target: <meeting_code>/ten-vad/include
             current_file = Path(__file__).resolve()
             # Go up to meeting_code directory, then to ten-vad/include
-            ten_vad_path = current_file.parent.parent.parent.parent.parent.parent / "ten-vad" / "include"
+            ten_vad_path = current_file.parents[5] / "ten-vad" / "include"
             
             # Debug path information
             logger.debug(
@@ -102,7 +154,14 @@ class VADProcessor:
             
             from ten_vad import TenVad
             
-            self.ten_vad = TenVad(hop_size=self.hop_size, threshold=self.threshold)
+            hop_size, threshold = self.hop_size, self.threshold
+            
+            def engine_factory() -> Any:
+                return TenVad(hop_size=hop_size, threshold=threshold)
+            
+            # Create one engine up front so a broken install falls back here
+            engine_factory()
+            self.engine_factory = engine_factory
             self.use_real_vad = True
             
             logger.info(
@@ -125,11 +184,79 @@ class VADProcessor:
             )
             self.use_real_vad = False
 
-    async def process(self, audio_data: List[float]) -> VADResult:
+
+class VADSession:
+    """Per-stream VAD state on top of a shared :class:`VADModel`.
+    
+    The speech/silence tracking, the pending TEN-VAD samples and the
+    TEN-VAD engine itself live here, so concurrent streams never share
+    recurrent VAD state. The engine is created on first use, keeping
+    sessions that only run the energy VAD cheap.
+    """
+
+    def __init__(self, model: VADModel):
+        """Initialize VAD session.
+        
+        Args:
+            model: Shared VAD model
+        """
+        self.model = model
+        self.is_speaking = False
+        self.silence_start: Optional[float] = None
+        self.debug_counter = 0
+        # Samples not yet forming a complete TEN-VAD hop
+        self.vad_buffer = np.empty(0, dtype=np.int16)
+        # This session's TEN-VAD engine, created by _engine() on first use
+        self.ten_vad: Optional[Any] = None
+
+    @property
+    def threshold(self) -> float:
+        return self.model.threshold
+
+    @property
+    def silence_duration(self) -> float:
+        return self.model.silence_duration
+
+    @property
+    def hop_size(self) -> int:
+        return self.model.hop_size
+
+    @property
+    def use_real_vad(self) -> bool:
+        return self.model.use_real_vad
+
+    def _engine(self) -> Any:
+        """Get this session's TEN-VAD engine, creating it on first use."""
+        if self.ten_vad is None:
+            factory = self.model.engine_factory
+            if factory is None:
+                raise VADError("TEN-VAD is not available")
+            self.ten_vad = factory()
+        return self.ten_vad
+
+    async def process(self, audio_array: np.ndarray) -> VADResult:
         """Process audio data for voice activity detection.
         
+        Runs inline on the event loop, which suits the short frames of a
+        stream; use :meth:`process_sync` in a worker thread for long clips.
+        
+        Args:
+            audio_array: Audio samples as a C-contiguous float32 array
+            
+        Returns:
+            VAD processing result
+            
+        Raises:
+            VADError: If VAD processing fails
+        """
+        return self.process_sync(audio_array)
+
+    def process_sync(self, audio_array: np.ndarray) -> VADResult:
+        """Process audio data for voice activity detection (blocking).
+        
         Args:
-            audio_data: Audio samples to process
+            audio_array: Audio samples as a C-contiguous float32 array;
+                callers convert once where the audio enters the service
             
         Returns:
             VAD processing result
@@ -138,83 +265,278 @@ class VADProcessor:
             VADError: If VAD processing fails
         """
         try:
-            if not audio_data:
+            _check_float32(audio_array, ndim=1)
+            if len(audio_array) == 0:
                 raise VADError("Empty audio data provided")
             
-            audio_array = np.array(audio_data, dtype=np.float32)
-            
             # Calculate audio metrics
-            rms = float(np.sqrt(np.mean(audio_array ** 2)))
+            rms = math.sqrt(float(np.dot(audio_array, audio_array)) / len(audio_array))
             max_amplitude = float(np.max(np.abs(audio_array)))
             
             # Perform VAD
-            if self.use_real_vad and self.ten_vad:
-                current_speaking, probability = await self._process_with_ten_vad(audio_array)
+            if rms < self.model.silence_shortcut:
+                # Obvious silence: skip VAD inference
+                self.model.count_silence_shortcut(1)
+                current_speaking, probability = False, 0.0
+            elif self.model.use_real_vad and self.model.engine_factory:
+                current_speaking, probability = self._process_with_ten_vad(audio_array)
             else:
                 current_speaking, probability = self._process_with_simple_vad(audio_array, rms)
             
-            # Check for state change
-            state_changed = current_speaking != self.is_speaking
-            current_state = 'speech' if current_speaking else 'silence'
-            
-            # Handle state changes
-            if state_changed:
-                logger.info(
-                    "VAD state changed",
-                    from_state='silence' if current_speaking else 'speech',
-                    to_state=current_state,
-                    probability=probability,
-                    rms=rms,
-                )
-                
-                if not current_speaking:
-                    self.silence_start = time.time()
-                else:
-                    self.silence_start = None
-                    
-                self.is_speaking = current_speaking
-            
-            # Check for silence timeout
-            silence_timeout = False
-            if (self.silence_start and 
-                not current_speaking and 
-                (time.time() - self.silence_start) >= self.silence_duration):
-                silence_timeout = True
-            
-            # Debug logging
-            self.debug_counter += 1
-            if self.debug_counter % 20 == 0:  # Log every 20th call
-                logger.debug(
-                    "VAD debug info",
-                    speaking=current_speaking,
-                    probability=probability,
-                    rms=rms,
-                    max_amplitude=max_amplitude,
-                    vad_type="ten-vad" if self.use_real_vad else "simple",
-                )
+            return self._update_state(current_speaking, probability, rms, max_amplitude)
             
-            return VADResult(
-                is_speaking=current_speaking,
-                state_changed=state_changed,
-                current_state=current_state,
-                probability=probability,
-                rms=rms,
-                max_amplitude=max_amplitude,
-                silence_timeout=silence_timeout,
+        except Exception as e:
+            logger.exception("VAD processing error", error=str(e))
+            raise VADError(
+                f"VAD processing failed: {str(e)}",
+                vad_info={
+                    "audio_length": len(audio_array) if audio_array is not None else 0,
+                    "use_real_vad": self.use_real_vad,
+                    "threshold": self.threshold,
+                }
             )
+
+    async def process_batch(self, windows: np.ndarray, **kwargs: Any) -> List[VADResult]:
+        """Process consecutive audio windows for voice activity detection.
+        
+        Async counterpart of :meth:`process_batch_sync`, run inline.
+        
+        Args:
+            windows: 2-D float32 array with one window per row
+            **kwargs: Passed on to :meth:`process_batch_sync`
+            
+        Returns:
+            One VAD result per window
+            
+        Raises:
+            VADError: If VAD processing fails
+        """
+        return self.process_batch_sync(windows, **kwargs)
+
+    def process_batch_sync(
+        self,
+        windows: np.ndarray,
+        rms: Optional[np.ndarray] = None,
+        max_amplitude: Optional[np.ndarray] = None,
+        prescreen_floor: float = 0.0,
+    ) -> List[VADResult]:
+        """Process consecutive audio windows for voice activity detection (blocking).
+        
+        Audio metrics (and the simple VAD decision) are computed for all
+        windows at once; the speech/silence state then advances window by
+        window exactly as with repeated :meth:`process` calls.
+        
+        Args:
+            windows: 2-D float32 array with one window per row (rows may
+                be strided views into the same audio)
+            rms: Precomputed RMS per window (see :meth:`sliding_energy`);
+                computed from ``windows`` when omitted
+            max_amplitude: Precomputed peak per window, given with ``rms``
+            prescreen_floor: RMS below which windows skip TEN-VAD, on top
+                of the model's silence shortcut
+            
+        Returns:
+            One VAD result per window
+            
+        Raises:
+            VADError: If VAD processing fails
+        """
+        if len(windows) == 0:
+            return []
+        
+        try:
+            _check_float32(windows, ndim=2)
+            if windows.shape[1] == 0:
+                raise VADError("Expected a non-empty 2-D array of audio windows")
+            
+            # Windows are handled in mini-batches so that strided views of
+            # long audio are never copied in full
+            batch_size = self.model.batch_size
+            
+            # Calculate audio metrics for all windows
+            if rms is None or max_amplitude is None:
+                rms, max_amplitude = self._window_metrics(windows, batch_size)
+            
+            if not (self.model.use_real_vad and self.model.engine_factory):
+                return self.process_energy(rms, max_amplitude)
+            
+            # Obvious silence skips VAD inference
+            silent = rms < max(self.model.silence_shortcut, prescreen_floor)
+            self.model.count_silence_shortcut(int(np.count_nonzero(silent)))
+            decisions = []
+            for start in range(0, len(windows), batch_size):
+                batch_silent = silent[start:start + batch_size]
+                if batch_silent.all():
+                    decisions.extend([(False, 0.0)] * len(batch_silent))
+                    continue
+                # Convert the whole mini-batch to int16 at once
+                batch_int16 = _to_int16(windows[start:start + batch_size])
+                decisions.extend(
+                    (False, 0.0) if is_silent else self._feed_ten_vad(frame)
+                    for frame, is_silent in zip(batch_int16, batch_silent)
+                )
+            
+            update_state = self._update_state
+            return [
+                update_state(speaking, probability, window_rms, peak)
+                for (speaking, probability), window_rms, peak
+                in zip(decisions, rms.tolist(), max_amplitude.tolist())
+            ]
             
         except Exception as e:
             logger.exception("VAD processing error", error=str(e))
             raise VADError(
                 f"VAD processing failed: {str(e)}",
                 vad_info={
-                    "audio_length": len(audio_data) if audio_data else 0,
+                    "window_count": len(windows),
                     "use_real_vad": self.use_real_vad,
                     "threshold": self.threshold,
                 }
             )
 
-    async def _process_with_ten_vad(self, audio_array: np.ndarray) -> tuple[bool, float]:
+    def process_energy(self, rms: np.ndarray, max_amplitude: np.ndarray) -> List[VADResult]:
+        """Run the energy-based VAD on precomputed per-window metrics.
+        
+        Lets callers that already know the RMS and peak of each window
+        (see :meth:`sliding_energy`) skip touching the samples again. Only
+        meaningful for the simple VAD; TEN-VAD needs the samples themselves.
+        
+        Args:
+            rms: RMS energy level per window
+            max_amplitude: Peak amplitude per window
+            
+        Returns:
+            One VAD result per window
+        """
+        is_speaking, probability = self._simple_vad_batch(rms, max_amplitude)
+        
+        # Obvious silence skips VAD inference
+        silent = rms < self.model.silence_shortcut
+        self.model.count_silence_shortcut(int(np.count_nonzero(silent)))
+        is_speaking[silent] = False
+        probability[silent] = 0.0
+        
+        # Convert to Python scalars in bulk rather than once per window
+        update_state = self._update_state
+        return [
+            update_state(speaking, prob, window_rms, peak)
+            for speaking, prob, window_rms, peak in zip(
+                is_speaking.tolist(), probability.tolist(), rms.tolist(), max_amplitude.tolist()
+            )
+        ]
+
+    @staticmethod
+    def sliding_energy(
+        audio_array: np.ndarray, window_size: int, hop_size: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute RMS and peak amplitude of every window in O(n).
+        
+        Windows start every ``hop_size`` samples, as with
+        ``sliding_window_view(audio_array, window_size)[::hop_size]``, but
+        overlapping samples are not revisited: RMS comes from differences of
+        a running sum of squares and the peak from a block-wise running max
+        (van Herk/Gil-Werman).
+        
+        Args:
+            audio_array: Audio samples
+            window_size: Window length in samples
+            hop_size: Distance between window starts in samples
+            
+        Returns:
+            Tuple of (rms, max_amplitude) arrays, one value per window
+        """
+        if window_size > len(audio_array):
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32)
+        
+        magnitude = np.abs(audio_array.astype(np.float32, copy=False))
+        
+        # float64 keeps the running sum exact enough for long recordings
+        csum = np.concatenate(([0.0], np.cumsum(np.square(magnitude, dtype=np.float64))))
+        energy = (csum[window_size::hop_size] - csum[:-window_size:hop_size]) / window_size
+        rms = np.sqrt(np.maximum(energy, 0.0)).astype(np.float32)
+        
+        # Any window spans at most two blocks of window_size samples: its
+        # peak is the suffix max of the first block joined with the prefix
+        # max of the second
+        padded = np.zeros(-(-len(magnitude) // window_size) * window_size, dtype=np.float32)
+        padded[:len(magnitude)] = magnitude
+        blocks = padded.reshape(-1, window_size)
+        prefix_max = np.maximum.accumulate(blocks, axis=1).ravel()
+        suffix_max = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+        starts = np.arange(len(rms)) * hop_size
+        max_amplitude = np.maximum(suffix_max[starts], prefix_max[starts + window_size - 1])
+        
+        return rms, max_amplitude
+
+    def _update_state(
+        self,
+        current_speaking: bool,
+        probability: float,
+        rms: float,
+        max_amplitude: float,
+    ) -> VADResult:
+        """Advance the speech/silence state with one VAD decision.
+        
+        Args:
+            current_speaking: Whether speech was detected
+            probability: Speech probability
+            rms: RMS energy level
+            max_amplitude: Peak amplitude
+            
+        Returns:
+            VAD processing result
+        """
+        # Check for state change
+        state_changed = current_speaking != self.is_speaking
+        current_state = 'speech' if current_speaking else 'silence'
+        
+        # Handle state changes
+        if state_changed:
+            logger.info(
+                "VAD state changed",
+                from_state='silence' if current_speaking else 'speech',
+                to_state=current_state,
+                probability=probability,
+                rms=rms,
+            )
+            
+            if not current_speaking:
+                self.silence_start = time.time()
+            else:
+                self.silence_start = None
+                
+            self.is_speaking = current_speaking
+        
+        # Check for silence timeout
+        silence_timeout = False
+        if (self.silence_start and 
+            not current_speaking and 
+            (time.time() - self.silence_start) >= self.silence_duration):
+            silence_timeout = True
+        
+        # Debug logging
+        self.debug_counter += 1
+        if self.debug_counter % 20 == 0:  # Log every 20th call
+            logger.debug(
+                "VAD debug info",
+                speaking=current_speaking,
+                probability=probability,
+                rms=rms,
+                max_amplitude=max_amplitude,
+                vad_type="ten-vad" if self.use_real_vad else "simple",
+            )
+        
+        return VADResult(
+            is_speaking=current_speaking,
+            state_changed=state_changed,
+            current_state=current_state,
+            probability=probability,
+            rms=rms,
+            max_amplitude=max_amplitude,
+            silence_timeout=silence_timeout,
+        )
+
+    def _process_with_ten_vad(self, audio_array: np.ndarray) -> tuple[bool, float]:
         """Process audio with TEN-VAD.
         
         Args:
@@ -223,22 +545,33 @@ class VADProcessor:
         Returns:
             Tuple of (is_speaking, probability)
         """
-        # Convert to int16 for TEN-VAD
-        audio_int16 = (np.clip(audio_array, -1.0, 1.0) * 32767).astype(np.int16)
+        return self._feed_ten_vad(_to_int16(audio_array))
+
+    def _feed_ten_vad(self, audio_int16: np.ndarray) -> tuple[bool, float]:
+        """Run TEN-VAD over int16 samples, keeping any incomplete hop.
         
-        # Add to VAD buffer
-        self.vad_buffer.extend(audio_int16.tolist())
+        Args:
+            audio_int16: Audio data converted with :func:`_to_int16`
+            
+        Returns:
+            Tuple of (is_speaking, probability) of the last complete hop
+        """
+        # Append to the pending samples
+        pending = np.concatenate((self.vad_buffer, audio_int16))
+        hop_size = self.hop_size
+        frame_count = len(pending) // hop_size
         
         probability = 0.0
         voice_flag = 0
         
         # Process complete frames
-        while len(self.vad_buffer) >= self.hop_size:
-            frame = np.array(self.vad_buffer[:self.hop_size], dtype=np.int16)
-            self.vad_buffer = self.vad_buffer[self.hop_size:]
+        if frame_count:
+            ten_vad = self._engine()
+        for i in range(frame_count):
+            frame = pending[i * hop_size:(i + 1) * hop_size]
             
             try:
-                probability, voice_flag = self.ten_vad.process(frame)
+                probability, voice_flag = ten_vad.process(frame)
             except Exception as e:
                 logger.warning("TEN-VAD process error, using fallback", error=str(e))
                 # Fallback to simple VAD
@@ -246,6 +579,8 @@ class VADProcessor:
                 voice_flag = 1 if rms > 0.01 else 0
                 probability = rms
         
+        self.vad_buffer = pending[frame_count * hop_size:].copy()
+        
         return voice_flag == 1, float(probability)
 
     def _process_with_simple_vad(self, audio_array: np.ndarray, rms: float) -> tuple[bool, float]:
@@ -278,11 +613,51 @@ class VADProcessor:
         
         return is_speaking, probability
 
+    @staticmethod
+    def _window_metrics(
+        windows: np.ndarray, batch_size: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute RMS and peak amplitude of each window, a mini-batch at a time.
+        
+        Args:
+            windows: 2-D array with one window per row
+            batch_size: Windows per mini-batch
+            
+        Returns:
+            Tuple of (rms, max_amplitude) arrays
+        """
+        rms = np.empty(len(windows), dtype=np.float32)
+        max_amplitude = np.empty(len(windows), dtype=np.float32)
+        for start in range(0, len(windows), batch_size):
+            batch = windows[start:start + batch_size]
+            rms[start:start + batch_size] = np.sqrt(
+                np.einsum('ij,ij->i', batch, batch) / windows.shape[1]
+            )
+            max_amplitude[start:start + batch_size] = np.abs(batch).max(axis=1)
+        return rms, max_amplitude
+
+    def _simple_vad_batch(
+        self, rms: np.ndarray, peak: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized :meth:`_process_with_simple_vad` over many windows.
+        
+        Args:
+            rms: RMS energy level per window
+            peak: Peak amplitude per window
+            
+        Returns:
+            Tuple of (is_speaking, probability) arrays
+        """
+        effective_threshold = np.where(peak > 0.01, 0.001, self.threshold)
+        is_speaking = (rms > effective_threshold) | (peak > 0.005)
+        probability = np.minimum(1.0, (rms / effective_threshold + peak / 0.01) / 2)
+        return is_speaking, probability
+
     def reset(self) -> None:
         """Reset VAD processor state."""
         self.is_speaking = False
         self.silence_start = None
-        self.vad_buffer.clear()
+        self.vad_buffer = np.empty(0, dtype=np.int16)
         self.debug_counter = 0
         
         logger.info("VAD processor reset")
@@ -301,4 +676,121 @@ class VADProcessor:
             "use_real_vad": self.use_real_vad,
             "vad_buffer_size": len(self.vad_buffer),
             "silence_start": self.silence_start,
-        }
\ No newline at end of file
+        }
+
+
+class VADProcessor(VADSession):
+    """Voice Activity Detection processor with TEN-VAD integration.
+    
+    Convenience wrapper that owns its model and a single session. Streams
+    that run concurrently should share one :class:`VADModel` and use a
+    :class:`VADSession` each instead.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        silence_duration: float = 0.8,
+        hop_size: int = 256,
+        batch_size: int = 64,
+    ):
+        """Initialize VAD processor.
+        
+        Args:
+            threshold: VAD threshold (0.0 to 1.0)
+            silence_duration: Minimum silence duration to trigger timeout
+            hop_size: VAD hop size in samples
+            batch_size: Windows handled per mini-batch in batch processing
+        """
+        super().__init__(
+            VADModel(
+                threshold=threshold,
+                silence_duration=silence_duration,
+                hop_size=hop_size,
+                batch_size=batch_size,
+            )
+        )
+
+
+class VADPool:
+    """Fixed set of :class:`VADProcessor` instances checked out per request.
+    
+    Every processor owns its model (and TEN-VAD engine), so checked-out
+    processors can run in parallel worker threads without sharing state.
+    Processors are reset when they return to the pool.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        threshold: float = 0.5,
+        silence_duration: float = 0.8,
+        hop_size: int = 256,
+        batch_size: int = 64,
+    ):
+        """Initialize VAD pool.
+        
+        Args:
+            size: Number of processors
+            threshold: VAD threshold (0.0 to 1.0)
+            silence_duration: Minimum silence duration to trigger timeout
+            hop_size: VAD hop size in samples
+            batch_size: Windows handled per mini-batch in batch processing
+        """
+        if size < 1:
+            raise ValueError("VAD pool size must be at least 1")
+        
+        self.processors = [
+            VADProcessor(
+                threshold=threshold,
+                silence_duration=silence_duration,
+                hop_size=hop_size,
+                batch_size=batch_size,
+            )
+            for _ in range(size)
+        ]
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for processor in self.processors:
+            self._idle.put_nowait(processor)
+
+    @property
+    def size(self) -> int:
+        return len(self.processors)
+
+    @property
+    def available(self) -> int:
+        return self._idle.qsize()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[VADProcessor]:
+        """Check out a processor, waiting while all of them are busy.
+        
+        Yields:
+            A processor with fresh speech/silence state
+        """
+        processor = await self._idle.get()
+        try:
+            yield processor
+        finally:
+            self.release(processor)
+
+    def release(self, processor: VADProcessor) -> None:
+        """Reset a processor and return it to the pool.
+        
+        Args:
+            processor: Processor obtained from :meth:`acquire`
+        """
+        processor.reset()
+        self._idle.put_nowait(processor)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+        
+        Returns:
+            Dictionary with pool size and usage
+        """
+        return {
+            "size": self.size,
+            "available": self.available,
+            "in_use": self.size - self.available,
+        }
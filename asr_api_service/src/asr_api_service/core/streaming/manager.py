@@ -1,12 +1,12 @@
 """Streaming session manager."""
 
 import asyncio
-import json
 import time
 from typing import Dict, List, Optional, Any
 from uuid import uuid4
 
 from fastapi import WebSocket
+import orjson
 import structlog
 
 from asr_api_service.config import settings
@@ -21,6 +21,12 @@ from asr_api_service.models.streaming import (
 
 logger = structlog.get_logger(__name__)
 
+# Maximum number of outbound messages buffered per client
+OUTBOUND_QUEUE_SIZE = 1000
+
+# Seconds to wait for queued messages to be sent when a client is removed
+OUTBOUND_DRAIN_TIMEOUT = 1.0
+
 
 class StreamingClient:
     """Represents a streaming client session."""
@@ -34,6 +40,8 @@ class StreamingClient:
         self.total_messages = 0
         self.current_status = "connecting"
         self.remote_address = websocket.client.host if websocket.client else None
+        self.out_queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self.writer_task: Optional[asyncio.Task] = None
         
     def update_activity(self):
         """Update last activity timestamp."""
@@ -62,6 +70,9 @@ class StreamingManager:
         self.total_messages_processed = 0
         self.total_transcription_time_ms = 0
         self._lock = asyncio.Lock()
+        # Serialized /active-clients payload, rebuilt only after client changes
+        self._clients_snapshot = b""
+        self._snapshot_dirty = True
         
     async def add_client(self, websocket: WebSocket) -> str:
         """Add a new streaming client.
@@ -87,7 +98,9 @@ class StreamingManager:
             
             # Create client
             client = StreamingClient(client_id, websocket)
+            client.writer_task = asyncio.create_task(self._writer(client))
             self.clients[client_id] = client
+            self._snapshot_dirty = True
             
             self.total_connections += 1
             
@@ -109,16 +122,56 @@ class StreamingManager:
         async with self._lock:
             client = self.clients.pop(client_id, None)
             if client:
-                # Clean up processor
-                if client.processor:
-                    await client.processor.cleanup()
-                
-                logger.info(
-                    "Client removed",
-                    client_id=client_id,
-                    session_duration=time.time() - client.connected_at,
-                    total_messages=client.total_messages,
-                )
+                self._snapshot_dirty = True
+        
+        if not client:
+            return
+        
+        # Flush queued messages, then stop the writer (unless it is the one
+        # removing the client). Draining happens outside the lock so a slow
+        # socket doesn't hold up other clients.
+        writer_task = client.writer_task
+        if writer_task and writer_task is not asyncio.current_task():
+            await self._drain_outbound(client)
+            writer_task.cancel()
+        
+        # Clean up processor
+        if client.processor:
+            await client.processor.cleanup()
+        
+        logger.info(
+            "Client removed",
+            client_id=client_id,
+            session_duration=time.time() - client.connected_at,
+            total_messages=client.total_messages,
+        )
+    
+    async def _drain_outbound(self, client: StreamingClient) -> None:
+        """Wait until a client's queued messages are sent, or the drain timeout.
+        
+        Args:
+            client: Client whose outbound queue to flush
+        """
+        writer = client.writer_task
+        if writer is None or writer.done() or client.out_queue.empty():
+            return
+        
+        join_task = asyncio.create_task(client.out_queue.join())
+        try:
+            await asyncio.wait(
+                {join_task, writer},
+                timeout=OUTBOUND_DRAIN_TIMEOUT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            join_task.cancel()
+        
+        if not client.out_queue.empty():
+            logger.warning(
+                "Dropping unsent messages on client removal",
+                client_id=client.client_id,
+                pending_messages=client.out_queue.qsize(),
+            )
     
     async def process_message(self, client_id: str, message: StreamingMessage) -> None:
         """Process a message from a streaming client.
@@ -134,7 +187,7 @@ class StreamingManager:
         if not client:
             raise StreamingError(f"Client {client_id} not found")
         
-        client.update_activity()
+        self.touch_activity(client)
         self.total_messages_processed += 1
         
         try:
@@ -168,6 +221,18 @@ class StreamingManager:
                 f"Message processing error: {str(e)}",
                 "MESSAGE_PROCESSING_ERROR"
             )
+        finally:
+            # Handlers may have changed the client's status
+            self._snapshot_dirty = True
+    
+    def touch_activity(self, client: StreamingClient) -> None:
+        """Record client activity and invalidate the clients snapshot.
+        
+        Args:
+            client: Client that sent a message
+        """
+        client.update_activity()
+        self._snapshot_dirty = True
     
     async def _handle_config_message(self, client: StreamingClient, message: StreamingMessage) -> None:
         """Handle configuration message."""
@@ -191,6 +256,7 @@ class StreamingManager:
                 client_id=client.client_id,
                 config=config,
                 websocket=client.websocket,
+                outbound=client.out_queue,
             )
             
             # Initialize processor
@@ -269,15 +335,40 @@ class StreamingManager:
                 "CONTROL_PROCESSING_ERROR"
             )
     
+    async def _writer(self, client: StreamingClient) -> None:
+        """Drain a client's outbound queue onto its WebSocket.
+        
+        Args:
+            client: Client whose queue to drain
+        """
+        try:
+            while True:
+                message_json = await client.out_queue.get()
+                try:
+                    await client.websocket.send_text(message_json)
+                finally:
+                    client.out_queue.task_done()
+                
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                "Failed to send message",
+                client_id=client.client_id,
+                error=str(e),
+            )
+            # Remove client on send failure
+            await self.remove_client(client.client_id)
+    
     async def send_message(self, client_id: str, message: StreamingMessage) -> bool:
-        """Send a message to a specific client.
+        """Queue a message for a specific client.
         
         Args:
             client_id: Target client ID
             message: Message to send
             
         Returns:
-            True if message was sent successfully
+            True if message was queued successfully
         """
         client = self.clients.get(client_id)
         if not client:
@@ -285,18 +376,15 @@ class StreamingManager:
             return False
         
         try:
-            message_json = message.model_dump_json()
-            await client.websocket.send_text(message_json)
+            client.out_queue.put_nowait(message.model_dump_json())
             return True
             
-        except Exception as e:
-            logger.error(
-                "Failed to send message",
+        except asyncio.QueueFull:
+            logger.warning(
+                "Outbound queue full, dropping message",
                 client_id=client_id,
-                error=str(e),
+                message_type=message.type,
             )
-            # Remove client on send failure
-            await self.remove_client(client_id)
             return False
     
     async def send_status(
@@ -358,6 +446,24 @@ class StreamingManager:
         """Get list of active clients."""
         return [client.to_dict() for client in self.clients.values()]
     
+    async def snapshot_bytes(self) -> bytes:
+        """Get the active clients listing as serialized JSON.
+        
+        The payload is rebuilt only when a client connected, disconnected
+        or sent a message since the last call.
+        
+        Returns:
+            JSON bytes with ``clients`` and ``total_clients``
+        """
+        if self._snapshot_dirty:
+            self._snapshot_dirty = False
+            clients = [client.to_dict() for client in self.clients.values()]
+            self._clients_snapshot = orjson.dumps({
+                "clients": clients,
+                "total_clients": len(clients),
+            })
+        return self._clients_snapshot
+    
     async def get_stats(self) -> Dict[str, Any]:
         """Get streaming manager statistics."""
         uptime = time.time() - self.start_time
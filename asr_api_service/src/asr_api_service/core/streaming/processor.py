@@ -38,10 +38,17 @@ class AudioSegment:
 class StreamingProcessor:
     """Processes streaming audio with VAD and ASR."""
     
-    def __init__(self, client_id: str, config: StreamingConfig, websocket: WebSocket):
+    def __init__(
+        self,
+        client_id: str,
+        config: StreamingConfig,
+        websocket: WebSocket,
+        outbound: Optional[asyncio.Queue] = None,
+    ):
         self.client_id = client_id
         self.config = config
         self.websocket = websocket
+        self.outbound = outbound
         
         # Audio processing components
         self.audio_buffer = AudioBuffer(sample_rate=settings.audio_sample_rate)
@@ -514,12 +521,29 @@ class StreamingProcessor:
             )
         )
         
-        await self.websocket.send_text(status_message.model_dump_json())
+        await self._send_text(status_message.model_dump_json())
     
     async def _send_result(self, result: StreamingResult) -> None:
         """Send transcription result to client."""
         result_message = StreamingMessage.create_result(result)
-        await self.websocket.send_text(result_message.model_dump_json())
+        await self._send_text(result_message.model_dump_json())
+    
+    async def _send_text(self, message_json: str) -> None:
+        """Send a text frame, through the client's outbound queue when available.
+        
+        Like ``StreamingManager.send_message``, a full queue drops the message
+        instead of blocking audio processing on a slow client.
+        """
+        if self.outbound is not None:
+            try:
+                self.outbound.put_nowait(message_json)
+            except asyncio.QueueFull:
+                logger.warning(
+                    "Outbound queue full, dropping message",
+                    client_id=self.client_id,
+                )
+        else:
+            await self.websocket.send_text(message_json)
     
     async def cleanup(self) -> None:
         """Clean up processor resources."""
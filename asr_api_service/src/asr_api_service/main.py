@@ -7,11 +7,14 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 import structlog
 
-from asr_api_service.api import api_router
+from asr_api_service.api import api_router, probe_counters
+from asr_api_service.api.health_interceptor import HealthCheckInterceptor
+from asr_api_service.api.v1.health import basic_health_check, basic_health_head
 from asr_api_service.config import settings
+from asr_api_service.core.asr.whisper import close_http_client, get_http_client
 from asr_api_service.exceptions import ASRServiceError
 from asr_api_service.utils.logging import setup_logging
 
@@ -45,14 +48,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         temp_path=str(settings.temp_storage_path),
     )
     
+    # Open the ASR API connection pool up front so requests share it
+    app.state.whisper_client = get_http_client()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down ASR API Service")
+    await close_http_client()
 
 
 # Create FastAPI application
-app = FastAPI(
+fastapi_app = FastAPI(
     title="ASR API Service",
     description="Modern ASR API Service with VAD and streaming capabilities",
     version="0.1.0",
@@ -63,21 +70,21 @@ app = FastAPI(
 )
 
 # Add middleware
-app.add_middleware(
+fastapi_app.add_middleware(
     CORSMiddleware,
     **settings.cors_config,
 )
 
 # Add trusted host middleware in production
 if not settings.is_development:
-    app.add_middleware(
+    fastapi_app.add_middleware(
         TrustedHostMiddleware,
         allowed_hosts=["*"],  # Configure based on your deployment
     )
 
 
 # Global exception handler
-@app.exception_handler(ASRServiceError)
+@fastapi_app.exception_handler(ASRServiceError)
 async def asr_service_exception_handler(request: Request, exc: ASRServiceError):
     """Handle ASR service exceptions."""
     logger.error(
@@ -96,7 +103,7 @@ async def asr_service_exception_handler(request: Request, exc: ASRServiceError):
 
 
 # Global exception handler for unhandled exceptions
-@app.exception_handler(Exception)
+@fastapi_app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unhandled exceptions."""
     logger.exception(
@@ -117,7 +124,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 # Add request logging middleware
-@app.middleware("http")
+@fastapi_app.middleware("http")
 async def request_logging_middleware(request: Request, call_next):
     """Log all requests."""
     logger.info(
@@ -141,36 +148,30 @@ async def request_logging_middleware(request: Request, call_next):
 
 
 # Include API routes
-app.include_router(api_router)
-
-
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "asr-api-service",
-        "version": "0.1.0",
-        "settings": {
-            "asr_provider": settings.asr_provider,
-            "llm_provider": settings.llm_provider,
-            "audio_sample_rate": settings.audio_sample_rate,
-            "vad_threshold": settings.vad_threshold,
-        },
-    }
+fastapi_app.include_router(api_router)
+
+
+# Health check endpoint (same pre-serialized payload as /api/v1/health)
+fastapi_app.add_api_route("/health", basic_health_check, methods=["GET"])
+fastapi_app.add_api_route("/health", basic_health_head, methods=["HEAD"])
 
 
 # Metrics endpoint (placeholder for Prometheus metrics)
 if settings.enable_metrics:
-    @app.get("/metrics")
+    @fastapi_app.get("/metrics", response_class=PlainTextResponse)
     async def metrics():
         """Prometheus metrics endpoint."""
-        # TODO: Implement Prometheus metrics
-        return {"message": "Metrics endpoint - implement Prometheus integration"}
+        # TODO: Export service metrics beyond the probe counters
+        return probe_counters.render_prometheus()
+
+
+# ASGI entry point: liveness probes are answered before the FastAPI stack
+app = HealthCheckInterceptor(fastapi_app)
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
     
     uvicorn.run(
@@ -180,4 +181,14 @@ if __name__ == "__main__":
         reload=settings.api_reload,
         log_level=settings.log_level.lower(),
         workers=1 if settings.api_reload else settings.api_workers,
+        # C event loop and HTTP parser (uvloop is unavailable on Windows)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # WebSocket limits; audio frames do not compress, so skip permessage-deflate
+        ws="websockets",
+        ws_max_size=settings.streaming_max_message_size,
+        ws_max_queue=settings.streaming_max_queue,
+        ws_ping_interval=settings.streaming_ping_interval,
+        ws_ping_timeout=settings.streaming_ping_timeout,
+        ws_per_message_deflate=False,
     )
\ No newline at end of file
@@ -2,10 +2,12 @@
 
 from asr_api_service.models.audio import AudioMetadata, AudioProcessingRequest
 from asr_api_service.models.transcription import (
+    RawTranscriptionRequest,
     TranscriptionRequest,
     TranscriptionResponse,
     TranscriptionSegment,
 )
+from asr_api_service.models.vad import VADAnalyzeRequest, VADRequest, VADSegmentsRequest
 from asr_api_service.models.streaming import (
     StreamingMessage,
     StreamingConfig,
@@ -19,6 +21,7 @@ from asr_api_service.models.streaming import (
 __all__ = [
     "AudioMetadata",
     "AudioProcessingRequest", 
+    "RawTranscriptionRequest",
     "TranscriptionRequest",
     "TranscriptionResponse",
     "TranscriptionSegment",
@@ -29,4 +32,7 @@ __all__ = [
     "StreamingResult",
     "StreamingStatus",
     "StreamingError",
+    "VADAnalyzeRequest",
+    "VADRequest",
+    "VADSegmentsRequest",
 ]
\ No newline at end of file
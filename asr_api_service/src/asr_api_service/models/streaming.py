@@ -1,7 +1,23 @@
 """Streaming-related Pydantic models."""
 
-from typing import Optional, List, Dict, Any, Union, Literal
-from pydantic import BaseModel, Field, field_validator
+import struct
+import time
+from typing import Annotated, Optional, List, Dict, Any, Union, Literal
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, WithJsonSchema, field_validator
+
+
+# Binary audio frame header: sample_rate (uint32), sample count (uint32) and
+# timestamp in milliseconds (uint64), little-endian, followed by float32 PCM.
+AUDIO_FRAME_HEADER = struct.Struct("<IIQ")
+
+# float32 sample array that serializes to (and documents itself as) a JSON list
+Float32Array = Annotated[
+    np.ndarray,
+    PlainSerializer(lambda a: a.tolist(), return_type=List[float], when_used="json"),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
 
 
 class StreamingConfig(BaseModel):
@@ -32,9 +48,15 @@ class StreamingConfig(BaseModel):
 
 
 class StreamingAudioData(BaseModel):
-    """Audio data for streaming."""
+    """Audio data for streaming.
     
-    audio_data: List[float] = Field(
+    Samples are held as a float32 array: binary frames pass their decoded
+    array straight through and JSON sample lists are converted once here.
+    """
+    
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    audio_data: Float32Array = Field(
         description="Audio samples as float32 values"
     )
     sample_rate: int = Field(
@@ -42,11 +64,19 @@ class StreamingAudioData(BaseModel):
         description="Audio sample rate",
     )
     
-    @field_validator("audio_data")
+    @field_validator("audio_data", mode="before")
     @classmethod
-    def validate_audio_data(cls, v: List[float]) -> List[float]:
-        """Validate audio data."""
-        if not v:
+    def validate_audio_data(cls, v: Any) -> np.ndarray:
+        """Validate audio data and convert it to a float32 array."""
+        try:
+            v = np.asarray(v, dtype=np.float32)
+        except (TypeError, ValueError):
+            raise ValueError("Audio data must be a list of numbers")
+        
+        if v.ndim != 1:
+            raise ValueError("Audio data must be one-dimensional")
+        
+        if not len(v):
             raise ValueError("Audio data cannot be empty")
         
         if len(v) > 16000 * 30:  # Max 30 seconds per chunk
@@ -193,59 +223,89 @@ class StreamingMessage(BaseModel):
     @classmethod
     def create_config(cls, config: StreamingConfig) -> "StreamingMessage":
         """Create a config message."""
-        import time
         return cls(
             type="config",
             data=config,
-            timestamp=int(time.time() * 1000)
+            timestamp=time.time_ns() // 1_000_000
         )
     
     @classmethod
     def create_audio(cls, audio_data: StreamingAudioData) -> "StreamingMessage":
         """Create an audio data message."""
-        import time
         return cls(
             type="audio", 
             data=audio_data,
-            timestamp=int(time.time() * 1000)
+            timestamp=time.time_ns() // 1_000_000
         )
     
     @classmethod
     def create_control(cls, control: StreamingControl) -> "StreamingMessage":
         """Create a control message."""
-        import time
         return cls(
             type="control",
             data=control,
-            timestamp=int(time.time() * 1000)
+            timestamp=time.time_ns() // 1_000_000
         )
     
     @classmethod
     def create_result(cls, result: StreamingResult) -> "StreamingMessage":
         """Create a result message."""
-        import time
         return cls(
             type="result",
             data=result,
-            timestamp=int(time.time() * 1000)
+            timestamp=time.time_ns() // 1_000_000
         )
     
     @classmethod
     def create_status(cls, status: StreamingStatus) -> "StreamingMessage":
         """Create a status message.""" 
-        import time
         return cls(
             type="status",
             data=status,
-            timestamp=int(time.time() * 1000)
+            timestamp=time.time_ns() // 1_000_000
         )
     
     @classmethod
     def create_error(cls, error: StreamingError) -> "StreamingMessage":
         """Create an error message."""
-        import time
         return cls(
             type="error",
             data=error,
-            timestamp=int(time.time() * 1000)
-        )
\ No newline at end of file
+            timestamp=time.time_ns() // 1_000_000
+        )
+    
+    @classmethod
+    def from_audio_frame(cls, frame: bytes) -> "StreamingMessage":
+        """Create an audio message from a binary audio frame.
+        
+        Args:
+            frame: Header packed with ``AUDIO_FRAME_HEADER`` followed by
+                float32 little-endian PCM samples
+            
+        Returns:
+            Audio data message
+            
+        Raises:
+            ValueError: If the frame is truncated or the sample count
+                does not match the payload size
+        """
+        if len(frame) < AUDIO_FRAME_HEADER.size:
+            raise ValueError("Audio frame shorter than header")
+        
+        sample_rate, sample_count, timestamp = AUDIO_FRAME_HEADER.unpack_from(frame)
+        payload = memoryview(frame)[AUDIO_FRAME_HEADER.size:]
+        if len(payload) != sample_count * 4:
+            raise ValueError(
+                f"Audio frame payload is {len(payload)} bytes, "
+                f"expected {sample_count * 4} for {sample_count} samples"
+            )
+        
+        samples = np.frombuffer(payload, dtype="<f4")
+        return cls(
+            type="audio",
+            data=StreamingAudioData(
+                audio_data=samples,
+                sample_rate=sample_rate,
+            ),
+            timestamp=timestamp,
+        )
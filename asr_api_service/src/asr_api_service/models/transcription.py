@@ -49,6 +49,16 @@ class TranscriptionRequest(BaseModel):
     )
 
 
+class RawTranscriptionRequest(TranscriptionRequest):
+    """Transcription options sent alongside raw float32 audio samples."""
+    
+    sample_rate: int = Field(
+        default=16000,
+        description="Audio sample rate in Hz",
+        gt=0,
+    )
+
+
 class TranscriptionResponse(BaseModel):
     """Response from transcription service."""
     
@@ -0,0 +1,148 @@
+"""VAD REST API request models."""
+
+import binascii
+from typing import List, Literal, Optional
+
+import numpy as np
+from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator
+
+try:
+    # SIMD-accelerated base64 decoding, falls back to the standard library
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+
+AudioEncoding = Literal["pcm_s16le", "float32"]
+
+# Encoding names accepted as synonyms (e.g. numpy dtype names)
+_ENCODING_ALIASES = {"int16": "pcm_s16le", "<i2": "pcm_s16le", "<f4": "float32"}
+
+
+def decode_pcm_base64(data: str, encoding: AudioEncoding) -> np.ndarray:
+    """Decode base64 little-endian PCM into float32 samples.
+
+    Args:
+        data: Base64-encoded PCM bytes
+        encoding: Sample encoding of the decoded bytes
+
+    Returns:
+        Samples as float32 values between -1.0 and 1.0
+
+    Raises:
+        ValueError: If the data is not valid base64 or not whole samples
+    """
+    try:
+        raw = b64decode(data, validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid base64 audio data: {str(e)}") from e
+
+    if encoding == "float32":
+        if len(raw) % 4:
+            raise ValueError("float32 audio length must be a multiple of 4 bytes")
+        return np.frombuffer(raw, dtype="<f4")
+
+    if len(raw) % 2:
+        raise ValueError("pcm_s16le audio length must be a multiple of 2 bytes")
+    return np.frombuffer(raw, dtype="<i2").astype(np.float32) * np.float32(1 / 32768)
+
+
+class _EncodedAudioRequest(BaseModel):
+    """Common fields for requests carrying encoded audio."""
+
+    encoding: AudioEncoding = Field(
+        default="pcm_s16le",
+        validation_alias=AliasChoices("encoding", "dtype"),
+        description="Encoding of base64 audio: pcm_s16le or float32 (little-endian)",
+    )
+    sample_rate: int = Field(
+        default=16000,
+        description="Audio sample rate in Hz",
+        gt=0,
+    )
+
+    @field_validator("encoding", mode="before")
+    @classmethod
+    def normalize_encoding(cls, v: str) -> str:
+        """Accept dtype names for the supported encodings."""
+        return _ENCODING_ALIASES.get(v, v)
+
+
+class VADRequest(_EncodedAudioRequest):
+    """Single-clip VAD request."""
+
+    audio_b64: Optional[str] = Field(
+        default=None,
+        description="Base64-encoded audio samples",
+    )
+    audio_data: Optional[List[float]] = Field(
+        default=None,
+        description="Legacy: audio samples as float values between -1.0 and 1.0",
+    )
+
+    @model_validator(mode="after")
+    def validate_audio_source(self) -> "VADRequest":
+        """Validate exactly one audio field is set."""
+        if (self.audio_b64 is None) == (self.audio_data is None):
+            raise ValueError("Provide exactly one of audio_b64 or audio_data")
+        return self
+
+    def to_array(self) -> np.ndarray:
+        """Get the audio as a float32 array.
+
+        Raises:
+            ValueError: If the encoded audio cannot be decoded
+        """
+        if self.audio_b64 is not None:
+            return decode_pcm_base64(self.audio_b64, self.encoding)
+        return np.asarray(self.audio_data, dtype=np.float32)
+
+
+class VADAnalyzeRequest(VADRequest):
+    """Whole-file VAD analysis request."""
+
+    window_duration: float = Field(
+        default=0.5,
+        description="Analysis window duration in seconds",
+        gt=0.0,
+    )
+    overlap: float = Field(
+        default=0.1,
+        description="Window overlap in seconds",
+        ge=0.0,
+    )
+
+
+class VADSegmentsRequest(_EncodedAudioRequest):
+    """Batch VAD request for several audio segments."""
+
+    segments_b64: Optional[List[str]] = Field(
+        default=None,
+        description="Base64-encoded audio segments",
+    )
+    segments: Optional[List[List[float]]] = Field(
+        default=None,
+        description="Legacy: audio segments as lists of float values",
+    )
+    reset_between_segments: bool = Field(
+        default=False,
+        description="Reset VAD state before each segment",
+    )
+
+    @model_validator(mode="after")
+    def validate_audio_source(self) -> "VADSegmentsRequest":
+        """Validate exactly one segments field is set."""
+        if (self.segments_b64 is None) == (self.segments is None):
+            raise ValueError("Provide exactly one of segments_b64 or segments")
+        return self
+
+    def to_arrays(self) -> List[np.ndarray]:
+        """Get the segments as float32 arrays.
+
+        Raises:
+            ValueError: If an encoded segment cannot be decoded
+        """
+        if self.segments_b64 is not None:
+            return [decode_pcm_base64(segment, self.encoding) for segment in self.segments_b64]
+        # validate_audio_source guarantees segments is set here
+        return [np.asarray(segment, dtype=np.float32) for segment in self.segments or ()]
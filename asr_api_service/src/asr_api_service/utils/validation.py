@@ -2,7 +2,7 @@
 
 import mimetypes
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 
 import numpy as np
 from fastapi import UploadFile
@@ -53,7 +53,7 @@ def validate_audio_file(file: UploadFile, max_size_mb: int = 25) -> None:
 
 
 def validate_audio_data(
-    audio_data: List[float],
+    audio_data: Union[List[float], np.ndarray],
     sample_rate: int = 16000,
     min_duration: float = 0.1,
     max_duration: float = 300.0,
@@ -73,7 +73,7 @@ def validate_audio_data(
     warnings = []
     
     # Basic validation
-    if not audio_data:
+    if len(audio_data) == 0:
         errors.append("Audio data is empty")
         return AudioValidationResult(
             is_valid=False,
@@ -88,10 +88,11 @@ def validate_audio_data(
         )
     
     # Calculate metrics
-    audio_array = np.array(audio_data, dtype=np.float32)
+    audio_array = np.asarray(audio_data, dtype=np.float32)
+    abs_array = np.abs(audio_array)
     duration = len(audio_data) / sample_rate
-    rms_level = float(np.sqrt(np.mean(audio_array ** 2)))
-    peak_level = float(np.max(np.abs(audio_array)))
+    rms_level = float(np.sqrt(np.dot(audio_array, audio_array) / len(audio_array)))
+    peak_level = float(abs_array.max())
     
     # Duration checks
     if duration < min_duration:
@@ -112,11 +113,11 @@ def validate_audio_data(
         warnings.append("Audio has clipping (peak level > 1.0)")
     
     # Check for reasonable audio values
-    if any(abs(sample) > 2.0 for sample in audio_data):
+    if np.any(abs_array > 2.0):
         errors.append("Audio contains samples outside reasonable range (-2.0 to 2.0)")
     
     # Check for NaN or infinite values
-    if any(not np.isfinite(sample) for sample in audio_data):
+    if not np.all(np.isfinite(audio_array)):
         errors.append("Audio contains NaN or infinite values")
     
     # Sample rate validation
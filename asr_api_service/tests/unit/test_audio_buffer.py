@@ -3,7 +3,7 @@
 import pytest
 import numpy as np
 
-from asr_api_service.core.audio.buffer import AudioBuffer
+from asr_api_service.core.audio.buffer import AudioBuffer, FloatRing
 from asr_api_service.exceptions import AudioProcessingError
 
 
@@ -178,4 +178,43 @@ class TestAudioBuffer:
         
         buffer.clear()
         assert len(buffer.buffer) == 0
-        assert buffer.get_duration() == 0.0
\ No newline at end of file
+        assert buffer.get_duration() == 0.0
+
+
+class TestFloatRing:
+    """Test cases for FloatRing class."""
+
+    def test_read_window_overlap(self):
+        """Test windows advance by hop and share overlapping samples."""
+        ring = FloatRing(8)
+        ring.write(np.arange(6, dtype=np.float32))
+
+        first = ring.read_window(4, 2)
+        assert first.tolist() == [0, 1, 2, 3]
+        assert ring.read_window(4, 2).tolist() == [2, 3, 4, 5]
+        assert ring.read_window(4, 2) is None
+        assert len(ring) == 2
+
+    def test_write_compacts_and_grows(self):
+        """Test writes past the end keep unread samples contiguous."""
+        ring = FloatRing(4)
+        ring.write(np.arange(4, dtype=np.float32))
+        ring.read_window(2, 2)
+
+        ring.write(np.array([4, 5], dtype=np.float32))
+        assert ring.capacity == 4
+        ring.write(np.array([6, 7, 8], dtype=np.float32))
+        assert ring.capacity == 8
+
+        assert ring.read_all().tolist() == [2, 3, 4, 5, 6, 7, 8]
+        assert len(ring) == 0
+
+    def test_ready_windows_matches_read_window(self):
+        """Test all ready windows are returned at once and consumed."""
+        ring = FloatRing(16)
+        ring.write(np.arange(9, dtype=np.float32))
+
+        windows = ring.ready_windows(4, 2)
+        assert windows.tolist() == [[0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7]]
+        assert len(ring) == 3
+        assert ring.ready_windows(4, 2).shape == (0, 4)
@@ -156,6 +156,15 @@ class TestSettings:
         settings = Settings(api_debug=False, api_reload=True)
         assert settings.is_development
     
+    def test_valid_audio_settings(self):
+        """Test configuration validity flags."""
+        settings = Settings()
+        assert settings.valid_vad_threshold
+        assert settings.valid_audio_settings
+        
+        settings = Settings(audio_sample_rate=0)
+        assert not settings.valid_audio_settings
+    
     def test_cors_config(self):
         """Test CORS configuration."""
         settings = Settings(
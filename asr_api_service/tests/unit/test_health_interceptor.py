@@ -0,0 +1,60 @@
+"""Unit tests for the liveness probe interceptor."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from asr_api_service.api.health_interceptor import HealthCheckInterceptor
+
+
+def _make_client() -> TestClient:
+    inner = FastAPI()
+
+    @inner.get("/other")
+    async def other():
+        return {"ok": True}
+
+    return TestClient(HealthCheckInterceptor(inner))
+
+
+class TestHealthCheckInterceptor:
+    """Test cases for HealthCheckInterceptor."""
+
+    def test_live_paths(self):
+        """Test that liveness probes are answered directly."""
+        client = _make_client()
+
+        for path in ("/live", "/api/v1/live"):
+            response = client.get(path)
+            assert response.status_code == 200
+            assert response.json() == {"status": "alive"}
+
+    def test_live_head(self):
+        """Test that HEAD liveness probes get headers without a body."""
+        response = _make_client().head("/live")
+
+        assert response.status_code == 200
+        assert response.content == b""
+
+    def test_live_not_modified(self):
+        """Test that a matching If-None-Match yields 304."""
+        client = _make_client()
+        etag = client.get("/live").headers["etag"]
+
+        response = client.get("/live", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_live_wrong_method(self):
+        """Test that non-GET liveness requests are rejected."""
+        response = _make_client().post("/live")
+
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
+
+    def test_other_paths_pass_through(self):
+        """Test that other requests reach the wrapped application."""
+        response = _make_client().get("/other")
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
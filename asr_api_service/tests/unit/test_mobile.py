@@ -0,0 +1,185 @@
+"""Unit tests for the mobile audio helpers."""
+
+import io
+import struct
+
+import msgpack
+import numpy as np
+import pytest
+import soundfile as sf
+from fastapi.testclient import TestClient
+
+from asr_api_service.api.v1 import mobile
+from asr_api_service.core.audio import converter
+from asr_api_service.core.audio.converter import (
+    AudioConverter,
+    _fast_pcm_wav_decode,
+    _polyphase_filter,
+    _resample_poly,
+)
+
+
+def _wav_bytes(audio: np.ndarray, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format="WAV", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+def _tone(freq: float, sample_rate: int, duration: float = 0.5) -> np.ndarray:
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+class TestResample:
+    """Test cases for the polyphase resampler."""
+
+    @pytest.fixture(autouse=True)
+    def numpy_resampler(self, monkeypatch):
+        """Force the NumPy fallback even when soxr or SciPy are installed."""
+        monkeypatch.setattr(converter, "soxr", None)
+        monkeypatch.setattr(converter, "resample_poly", None)
+
+    def test_filter_bank_shape(self):
+        """Test that the filter bank has one row per phase and unit DC gain per phase."""
+        bank, half_len = _polyphase_filter(160, 441)
+
+        assert bank.shape[0] == 160
+        assert bank.dtype == np.float32
+        assert half_len == 10 * 441
+        np.testing.assert_allclose(bank.sum(axis=1), 1.0, atol=0.02)
+
+    @pytest.mark.parametrize("orig_sr, target_sr", [(44100, 16000), (8000, 16000), (48000, 16000)])
+    def test_output_length(self, orig_sr, target_sr):
+        """Test that the output length matches the rate ratio."""
+        audio = _tone(440, orig_sr)
+
+        resampled = AudioConverter.resample_audio(audio, orig_sr, target_sr)
+
+        assert resampled.dtype == np.float32
+        assert len(resampled) == -(-len(audio) * target_sr // orig_sr)
+
+    def test_passband_preserved(self):
+        """Test that a tone well below the new Nyquist keeps its amplitude."""
+        resampled = AudioConverter.resample_audio(_tone(1000, 44100), 44100, 16000)
+
+        steady = resampled[1000:-1000]
+        expected = _tone(1000, 16000)[1000:-1000]
+        assert np.sqrt(np.mean(steady ** 2)) == pytest.approx(0.5 / np.sqrt(2), rel=0.01)
+        np.testing.assert_allclose(steady, expected, atol=0.01)
+
+    def test_stopband_attenuated(self):
+        """Test that a tone above the new Nyquist is filtered out instead of aliasing."""
+        resampled = _resample_poly(_tone(12000, 44100), 160, 441)
+
+        assert np.abs(resampled[1000:-1000]).max() < 0.01
+
+    def test_same_rate_passthrough(self):
+        """Test that equal rates return the samples unchanged."""
+        audio = _tone(440, 16000)
+
+        np.testing.assert_array_equal(AudioConverter.resample_audio(audio, 16000, 16000.0), audio)
+
+
+class TestFastWavDecode:
+    """Test cases for the 16-bit PCM WAV fast path."""
+
+    def test_mono_matches_soundfile(self):
+        """Test that mono WAV decodes exactly like libsndfile."""
+        wav = _wav_bytes(_tone(440, 16000))
+
+        audio, sample_rate = _fast_pcm_wav_decode(wav)
+        expected, expected_rate = sf.read(io.BytesIO(wav), dtype="float32")
+
+        assert sample_rate == expected_rate == 16000
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, expected)
+
+    def test_stereo_downmixed(self):
+        """Test that stereo WAV is averaged to mono like libsndfile output."""
+        stereo = np.stack([_tone(440, 22050), _tone(880, 22050)], axis=1)
+        wav = _wav_bytes(stereo, 22050)
+
+        audio, sample_rate = _fast_pcm_wav_decode(wav)
+        expected, _ = sf.read(io.BytesIO(wav), dtype="float32")
+
+        assert sample_rate == 22050
+        np.testing.assert_allclose(audio, expected.mean(axis=1), atol=1e-6)
+
+    def test_odd_chunk_padding(self):
+        """Test that odd-sized chunks before the data chunk are skipped with their pad byte."""
+        samples = (_tone(440, 16000) * 32767).astype("<i2")
+        fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)
+        extra = b"abc"
+        body = (
+            b"WAVE"
+            + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"LIST" + struct.pack("<I", len(extra)) + extra + b"\x00"
+            + b"data" + struct.pack("<I", samples.nbytes) + samples.tobytes()
+        )
+        wav = b"RIFF" + struct.pack("<I", len(body)) + body
+
+        audio, _ = _fast_pcm_wav_decode(wav)
+        expected, _ = sf.read(io.BytesIO(wav), dtype="float32")
+
+        np.testing.assert_array_equal(audio, expected)
+
+    def test_unsupported_wav_falls_back(self):
+        """Test that non-16-bit WAV is left to libsndfile."""
+        buffer = io.BytesIO()
+        sf.write(buffer, _tone(440, 16000), 16000, format="WAV", subtype="FLOAT")
+
+        assert _fast_pcm_wav_decode(buffer.getvalue()) is None
+        assert _fast_pcm_wav_decode(b"not a wav file") is None
+
+
+class TestAudioResultCache:
+    """Test cases for the mobile result cache."""
+
+    def test_hit_and_byte_budget(self):
+        """Test that hits are returned and the byte budget evicts LRU entries."""
+        cache = mobile._AudioResultCache(maxsize=10, ttl=60.0, max_bytes=100, max_entry_bytes=60)
+
+        cache.put("a", 1, 50)
+        cache.put("b", 2, 40)
+        assert cache.get("a") == 1
+
+        cache.put("c", 3, 30)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.total_bytes == 80
+
+        cache.put("d", 4, 61)
+        assert cache.get("d") is None
+
+    def test_expiry(self):
+        """Test that expired entries are dropped on lookup."""
+        cache = mobile._AudioResultCache(maxsize=10, ttl=0.0, max_bytes=100, max_entry_bytes=100)
+
+        cache.put("a", 1, 10)
+
+        assert cache.get("a") is None
+        assert cache.total_bytes == 0
+
+
+class TestMsgPackResponse:
+    """Test cases for MessagePack responses."""
+
+    def test_efficient_upload_returns_pcm(self):
+        """Test that msgpack clients receive raw float32 PCM."""
+        from asr_api_service.main import app
+
+        audio = _tone(440, 16000)
+
+        response = TestClient(app).post(
+            "/api/v1/mobile/process-audio-efficient",
+            files={"audio": ("tone.wav", _wav_bytes(audio), "audio/wav")},
+            data={"enable_vad": "false", "return_audio": "true"},
+            headers={"Accept": "application/msgpack"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/msgpack")
+        payload = msgpack.unpackb(response.content)
+        assert payload["audio_format"] == "pcm_f32le"
+        pcm = np.frombuffer(payload["audio_data"], dtype="<f4")
+        assert len(pcm) == payload["audio_samples"] == len(audio)
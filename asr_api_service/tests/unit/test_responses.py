@@ -0,0 +1,42 @@
+"""Unit tests for shared response helpers."""
+
+import orjson
+
+from asr_api_service.api.responses import ttl_cached_json
+
+
+class TestTTLCachedJSON:
+    """Test cases for the ttl_cached_json decorator."""
+
+    async def test_payload_cached_until_key_changes(self):
+        """Test that the payload is serialized once per key."""
+        calls = []
+        state = {"version": 1}
+
+        @ttl_cached_json(ttl=60.0, key=lambda: state["version"])
+        async def endpoint():
+            calls.append(state["version"])
+            return {"version": state["version"]}
+
+        first = await endpoint()
+        second = await endpoint()
+        assert first.body == second.body == orjson.dumps({"version": 1})
+        assert first.media_type == "application/json"
+        assert calls == [1]
+
+        state["version"] = 2
+        assert orjson.loads((await endpoint()).body) == {"version": 2}
+        assert calls == [1, 2]
+
+    async def test_payload_expires(self):
+        """Test that a zero TTL rebuilds the payload on every call."""
+        calls = []
+
+        @ttl_cached_json(ttl=0.0)
+        async def endpoint():
+            calls.append(1)
+            return {}
+
+        await endpoint()
+        await endpoint()
+        assert len(calls) == 2
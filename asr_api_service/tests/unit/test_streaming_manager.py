@@ -0,0 +1,79 @@
+"""Unit tests for the streaming manager."""
+
+import asyncio
+
+import orjson
+
+from asr_api_service.core.streaming.manager import StreamingManager
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in recording sent text frames."""
+
+    client = None
+
+    def __init__(self, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+
+    async def send_text(self, data: str) -> None:
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(data)
+
+
+class TestStreamingManager:
+    """Test cases for StreamingManager outbound messaging."""
+
+    async def test_messages_sent_in_order_by_writer(self):
+        """Test that queued messages are delivered by the writer task."""
+        manager = StreamingManager()
+        websocket = FakeWebSocket()
+        client_id = await manager.add_client(websocket)
+
+        assert await manager.send_status(client_id, "ready")
+        assert await manager.send_error(client_id, "boom", "TEST_ERROR")
+        await asyncio.sleep(0)
+
+        messages = [orjson.loads(m) for m in websocket.sent]
+        assert [m["type"] for m in messages] == ["status", "error"]
+
+        await manager.remove_client(client_id)
+        assert client_id not in manager.clients
+
+    async def test_send_failure_removes_client(self):
+        """Test that a failing WebSocket send removes the client."""
+        manager = StreamingManager()
+        client_id = await manager.add_client(FakeWebSocket(fail=True))
+
+        assert await manager.send_status(client_id, "ready")
+        await asyncio.sleep(0.01)
+
+        assert client_id not in manager.clients
+
+    async def test_clients_snapshot_tracks_changes(self):
+        """Test that the clients snapshot is reused until a client changes."""
+        manager = StreamingManager()
+        client_id = await manager.add_client(FakeWebSocket())
+
+        snapshot = await manager.snapshot_bytes()
+        assert await manager.snapshot_bytes() is snapshot
+
+        payload = orjson.loads(snapshot)
+        assert payload["total_clients"] == 1
+        assert payload["clients"][0]["client_id"] == client_id
+
+        await manager.remove_client(client_id)
+        assert orjson.loads(await manager.snapshot_bytes()) == {"clients": [], "total_clients": 0}
+
+    async def test_remove_client_flushes_queue(self):
+        """Test that queued messages are sent before the writer is stopped."""
+        manager = StreamingManager()
+        websocket = FakeWebSocket()
+        client_id = await manager.add_client(websocket)
+
+        for _ in range(3):
+            assert await manager.send_status(client_id, "ready")
+        await manager.remove_client(client_id)
+
+        assert len(websocket.sent) == 3
@@ -0,0 +1,67 @@
+"""Unit tests for streaming models."""
+
+import pytest
+import numpy as np
+
+from asr_api_service.models.streaming import (
+    AUDIO_FRAME_HEADER,
+    StreamingAudioData,
+    StreamingMessage,
+)
+
+
+class TestAudioFrame:
+    """Test cases for binary audio frame parsing."""
+
+    def test_from_audio_frame(self):
+        """Test parsing a well-formed audio frame."""
+        samples = np.array([0.5, -0.25, 0.0, 1.0], dtype="<f4")
+        frame = AUDIO_FRAME_HEADER.pack(16000, len(samples), 1234) + samples.tobytes()
+
+        message = StreamingMessage.from_audio_frame(frame)
+
+        assert message.type == "audio"
+        assert message.timestamp == 1234
+        assert isinstance(message.data, StreamingAudioData)
+        assert message.data.sample_rate == 16000
+        assert message.data.audio_data.dtype == np.float32
+        np.testing.assert_array_equal(message.data.audio_data, samples)
+
+    def test_audio_data_from_list(self):
+        """Test that JSON sample lists are converted to a float32 array."""
+        data = StreamingAudioData(audio_data=[0.5, -0.5])
+
+        assert data.audio_data.dtype == np.float32
+        np.testing.assert_array_equal(data.audio_data, [0.5, -0.5])
+
+        with pytest.raises(ValueError):
+            StreamingAudioData(audio_data=[])
+        with pytest.raises(ValueError):
+            StreamingAudioData(audio_data=["a"])
+
+    def test_audio_message_json_round_trip(self):
+        """Test that audio messages serialize samples as a JSON list and parse back."""
+        message = StreamingMessage.create_audio(
+            StreamingAudioData(audio_data=np.array([0.5, -0.25], dtype=np.float32), sample_rate=8000)
+        )
+
+        assert message.model_dump(mode="json")["data"]["audio_data"] == [0.5, -0.25]
+
+        parsed = StreamingMessage.model_validate_json(message.model_dump_json())
+
+        assert isinstance(parsed.data, StreamingAudioData)
+        assert parsed.data.sample_rate == 8000
+        np.testing.assert_array_equal(parsed.data.audio_data, message.data.audio_data)
+
+    def test_from_audio_frame_truncated_header(self):
+        """Test that a frame shorter than the header is rejected."""
+        with pytest.raises(ValueError):
+            StreamingMessage.from_audio_frame(b"\x00" * (AUDIO_FRAME_HEADER.size - 1))
+
+    def test_from_audio_frame_size_mismatch(self):
+        """Test that a sample count not matching the payload is rejected."""
+        samples = np.zeros(4, dtype="<f4")
+        frame = AUDIO_FRAME_HEADER.pack(16000, 8, 0) + samples.tobytes()
+
+        with pytest.raises(ValueError):
+            StreamingMessage.from_audio_frame(frame)
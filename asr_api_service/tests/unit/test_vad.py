@@ -0,0 +1,178 @@
+"""Unit tests for VAD sessions."""
+
+import numpy as np
+import pytest
+
+from asr_api_service.core.audio.vad import VADModel, VADPool, VADProcessor, VADSession
+from asr_api_service.exceptions import VADError
+
+
+class TestVADSession:
+    """Test cases for VADSession."""
+
+    async def test_sessions_keep_separate_state(self):
+        """Test that sessions sharing a model do not affect each other."""
+        model = VADModel()
+        speech = VADSession(model)
+        silence = VADSession(model)
+
+        await speech.process(np.full(1024, 0.5, dtype=np.float32))
+        result = await silence.process(np.zeros(1024, dtype=np.float32))
+
+        assert speech.is_speaking
+        assert not silence.is_speaking
+        assert not result.state_changed
+
+    async def test_processor_wraps_single_session(self):
+        """Test that VADProcessor exposes its model configuration."""
+        processor = VADProcessor(threshold=0.3, hop_size=128)
+
+        result = await processor.process(np.full(512, 0.5, dtype=np.float32))
+
+        assert result.is_speaking
+        assert processor.threshold == 0.3
+        assert processor.get_stats()["hop_size"] == 128
+
+        processor.reset()
+        assert not processor.is_speaking
+
+    async def test_process_batch_matches_process(self):
+        """Test that batch processing yields the same results as single calls."""
+        model = VADModel()
+        windows = np.zeros((4, 256), dtype=np.float32)
+        windows[1:3] = 0.5
+
+        single = VADSession(model)
+        expected = [await single.process(window) for window in windows]
+        results = await VADSession(model).process_batch(windows)
+
+        assert [r.to_dict() for r in results] == [r.to_dict() for r in expected]
+
+    async def test_silence_shortcut_skips_vad(self):
+        """Test that near-silent windows are answered without running VAD."""
+        model = VADModel(silence_shortcut=1e-3)
+        session = VADSession(model)
+
+        result = await session.process(np.full(256, 1e-4, dtype=np.float32))
+        results = await session.process_batch(np.full((2, 256), 1e-4, dtype=np.float32))
+
+        assert not result.is_speaking
+        assert result.probability == 0.0
+        assert [r.probability for r in results] == [0.0, 0.0]
+        assert model.silence_shortcut_frames == 3
+
+    def test_sliding_energy_matches_windows(self):
+        """Test that running-sum energies match per-window computation."""
+        audio = np.random.default_rng(0).uniform(-1, 1, 1000).astype(np.float32)
+
+        for window_size, hop_size in ((100, 40), (64, 64), (333, 1), (1000, 7)):
+            windows = np.lib.stride_tricks.sliding_window_view(audio, window_size)[::hop_size]
+            rms, peak = VADSession.sliding_energy(audio, window_size, hop_size)
+
+            np.testing.assert_allclose(rms, np.sqrt((windows ** 2).mean(axis=1)), rtol=1e-5)
+            np.testing.assert_array_equal(peak, np.abs(windows).max(axis=1))
+
+    async def test_prescreen_skips_ten_vad_for_quiet_windows(self):
+        """Test that windows under the prescreen floor never reach TEN-VAD."""
+
+        class CountingVad:
+            calls = 0
+
+            def process(self, frame):
+                CountingVad.calls += 1
+                return 0.9, 1
+
+        model = VADModel(hop_size=256)
+        model.engine_factory, model.use_real_vad = CountingVad, True
+        windows = np.full((4, 256), 0.5, dtype=np.float32)
+        windows[1:3] = 1e-4
+
+        results = await VADSession(model).process_batch(windows, prescreen_floor=1e-3)
+
+        assert [r.is_speaking for r in results] == [True, False, False, True]
+        assert CountingVad.calls == 2
+
+    async def test_ten_vad_mini_batches_match_single_windows(self):
+        """Test that mini-batched TEN-VAD input equals feeding windows one by one."""
+
+        class RecordingVad:
+            def __init__(self):
+                self.frames = []
+
+            def process(self, frame):
+                self.frames.append(frame.copy())
+                return float(np.abs(frame).mean()) / 32767, int(frame.any())
+
+        def make_session():
+            model = VADModel(hop_size=96, batch_size=3)
+            model.engine_factory, model.use_real_vad = RecordingVad, True
+            return VADSession(model)
+
+        windows = np.random.default_rng(0).uniform(-1, 1, (8, 160)).astype(np.float32)
+        windows[4] = 0.0
+
+        single = make_session()
+        expected = [await single.process(window) for window in windows]
+        batched = make_session()
+        results = await batched.process_batch(windows)
+
+        assert [(r.is_speaking, r.probability) for r in results] == [
+            (r.is_speaking, r.probability) for r in expected
+        ]
+        np.testing.assert_array_equal(batched.ten_vad.frames, single.ten_vad.frames)
+
+    async def test_sessions_own_ten_vad_engines(self):
+        """Test that sessions sharing a model never share a TEN-VAD engine."""
+
+        class RecordingVad:
+            def __init__(self):
+                self.frames = 0
+
+            def process(self, frame):
+                self.frames += 1
+                return 0.9, 1
+
+        model = VADModel(hop_size=256)
+        model.engine_factory, model.use_real_vad = RecordingVad, True
+        first, second, idle = VADSession(model), VADSession(model), VADSession(model)
+
+        await first.process(np.full(512, 0.5, dtype=np.float32))
+        await second.process(np.full(256, 0.5, dtype=np.float32))
+
+        assert first.ten_vad is not second.ten_vad
+        assert (first.ten_vad.frames, second.ten_vad.frames) == (2, 1)
+        assert idle.ten_vad is None
+
+    async def test_process_requires_float32_array(self):
+        """Test that audio must be converted before reaching the session."""
+        session = VADSession(VADModel())
+
+        with pytest.raises(VADError):
+            await session.process([0.5] * 256)
+        with pytest.raises(VADError):
+            await session.process(np.full(256, 0.5))
+
+
+class TestVADPool:
+    """Test cases for VADPool."""
+
+    async def test_acquire_gives_separate_processors(self):
+        """Test that concurrent checkouts get distinct processors."""
+        pool = VADPool(2)
+
+        async with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+            assert pool.available == 0
+
+        assert pool.get_stats() == {"size": 2, "available": 2, "in_use": 0}
+
+    async def test_release_resets_processor(self):
+        """Test that returned processors start from silence."""
+        pool = VADPool(1)
+
+        async with pool.acquire() as processor:
+            await processor.process(np.full(512, 0.5, dtype=np.float32))
+            assert processor.is_speaking
+
+        async with pool.acquire() as processor:
+            assert not processor.is_speaking
@@ -0,0 +1,106 @@
+"""Unit tests for VAD request models."""
+
+import base64
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from asr_api_service.models.vad import VADRequest, VADSegmentsRequest
+
+
+def _b64(array: np.ndarray) -> str:
+    return base64.b64encode(array.tobytes()).decode()
+
+
+class TestVADRequest:
+    """Test cases for VAD request decoding."""
+
+    def test_pcm16_audio(self):
+        """Test that base64 PCM16 is decoded to scaled float32 samples."""
+        request = VADRequest(audio_b64=_b64(np.array([0, 16384, -32768], dtype="<i2")), dtype="int16")
+
+        audio = request.to_array()
+
+        assert request.encoding == "pcm_s16le"
+        assert audio.dtype == np.float32
+        assert audio.tolist() == [0.0, 0.5, -1.0]
+
+    def test_float32_audio(self):
+        """Test that base64 float32 is decoded without conversion."""
+        samples = np.array([0.25, -0.5], dtype="<f4")
+        request = VADRequest(audio_b64=_b64(samples), encoding="float32")
+
+        assert request.to_array().tolist() == samples.tolist()
+
+    def test_legacy_float_list(self):
+        """Test that the legacy float list is still accepted."""
+        request = VADRequest(audio_data=[0.1, -0.1])
+
+        assert request.to_array().dtype == np.float32
+
+    def test_requires_single_audio_source(self):
+        """Test that exactly one audio field must be given."""
+        with pytest.raises(ValidationError):
+            VADRequest()
+        with pytest.raises(ValidationError):
+            VADRequest(audio_b64="", audio_data=[0.0])
+
+    def test_truncated_pcm16(self):
+        """Test that a partial sample is rejected on decode."""
+        request = VADRequest(audio_b64=base64.b64encode(b"\x00\x00\x00").decode())
+
+        with pytest.raises(ValueError):
+            request.to_array()
+
+    def test_segments(self):
+        """Test that every encoded segment is decoded."""
+        request = VADSegmentsRequest(
+            segments_b64=[_b64(np.zeros(4, dtype="<i2")), _b64(np.ones(2, dtype="<i2"))]
+        )
+
+        assert [len(segment) for segment in request.to_arrays()] == [4, 2]
+
+
+class TestLegacyRequestShape:
+    """Test cases for the bare-array bodies with query parameters."""
+
+    @pytest.fixture
+    def client(self):
+        from asr_api_service.main import app
+
+        return TestClient(app)
+
+    def test_bare_array_with_query_params(self, client):
+        """Test that bare arrays are accepted and query parameters are applied."""
+        audio = (0.3 * np.sin(np.arange(4000) / 5)).tolist()
+
+        detect = client.post("/api/v1/vad/detect", params={"sample_rate": 8000}, json=audio)
+        segments = client.post(
+            "/api/v1/vad/process-segments",
+            params={"reset_between_segments": "true"},
+            json=[audio[:2000], audio[2000:]],
+        )
+        analyze = client.post(
+            "/api/v1/vad/analyze-file",
+            params={"window_duration": 0.05, "overlap": 0.01},
+            json={"audio_data": audio},
+        )
+
+        assert detect.status_code == 200
+        assert detect.json()["metadata"]["sample_rate"] == 8000
+        assert segments.status_code == 200
+        assert segments.json()["metadata"]["reset_between_segments"] is True
+        assert analyze.status_code == 200
+        assert analyze.json()["metadata"]["window_duration"] == 0.05
+
+    def test_conflicting_query_param(self, client):
+        """Test that a query parameter contradicting the body is rejected."""
+        response = client.post(
+            "/api/v1/vad/detect",
+            params={"sample_rate": 8000},
+            json={"audio_data": [0.0] * 1024, "sample_rate": 16000},
+        )
+
+        assert response.status_code == 400
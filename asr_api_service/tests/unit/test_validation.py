@@ -0,0 +1,47 @@
+"""Unit tests for audio validation utilities."""
+
+import numpy as np
+
+from asr_api_service.utils.validation import validate_audio_data
+
+
+class TestValidateAudioData:
+    """Test cases for validate_audio_data."""
+
+    def test_ndarray_metrics(self):
+        """Test metrics computed from a float32 array."""
+        audio = np.full(1600, 0.5, dtype=np.float32)
+        audio[::2] = -0.5
+
+        result = validate_audio_data(audio, 16000)
+
+        assert result.is_valid
+        assert result.duration == 0.1
+        assert result.rms_level == 0.5
+        assert result.peak_level == 0.5
+
+    def test_list_input(self):
+        """Test that plain float lists are still accepted."""
+        result = validate_audio_data([0.1] * 1600, 16000)
+
+        assert result.is_valid
+        assert abs(result.rms_level - 0.1) < 1e-6
+
+    def test_invalid_samples(self):
+        """Test out-of-range and non-finite samples are reported."""
+        audio = np.zeros(1600, dtype=np.float32)
+        audio[10] = 3.0
+        audio[20] = np.nan
+
+        result = validate_audio_data(audio, 16000)
+
+        assert not result.is_valid
+        assert any("outside reasonable range" in e for e in result.errors)
+        assert any("NaN or infinite" in e for e in result.errors)
+
+    def test_empty(self):
+        """Test that empty input is rejected."""
+        result = validate_audio_data(np.empty(0, dtype=np.float32), 16000)
+
+        assert not result.is_valid
+        assert result.errors == ["Audio data is empty"]